@@ -0,0 +1,70 @@
+"""
+/api/news/ (sync DRF view, ASGI ostida thread-pool orqali), /api/async/news/
+(async ORM va kesh) va WSGI (oqimlar) o'tkazuvchanligini parallel mijozlar
+bilan taqqoslash.
+
+    python benchmarks/bench_async.py --clients 100 --requests 20
+
+So'rovlar jarayon ichida (AsyncClient / Client) yuboriladi, haqiqiy server
+(uvicorn, gunicorn) orqali emas. Kesh o'chirilgan (DummyCache), ya'ni har bir
+so'rov bazaga boradi. SQLite da Django async ORM ham so'rovlarni bitta fon
+oqimida bajaradi, shuning uchun farq asosan thread-pool almashinuvlari
+hisobidan; PostgreSQL va haqiqiy ASGI serverda natija boshqacha bo'ladi.
+"""
+import argparse
+import asyncio
+import time
+
+from common import run_concurrent, setup_django
+
+setup_django(CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}})
+
+from django.test import AsyncClient
+
+from core.models import News
+
+
+def seed(rows):
+    News.objects.bulk_create([
+        News(title=f"Yangilik {i}", content=f"<p>Matn {i}</p>", main_image='news/x.jpg', slug=f"yangilik-{i}")
+        for i in range(rows)
+    ])
+
+
+async def run_async(url, clients, requests_per_client):
+    """url ga clients ta parallel korutina bilan so'rov yuborish, (rps, xatolar) qaytaradi"""
+    errors = []
+
+    async def worker():
+        client = AsyncClient()
+        for _ in range(requests_per_client):
+            response = await client.get(url)
+            if response.status_code != 200:
+                errors.append(response.status_code)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(clients)))
+    elapsed = time.perf_counter() - started
+    return clients * requests_per_client / elapsed, len(errors)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--clients', type=int, default=100)
+    parser.add_argument('--requests', type=int, default=20)
+    parser.add_argument('--rows', type=int, default=200)
+    args = parser.parse_args()
+
+    seed(args.rows)
+    results = {
+        'WSGI (oqimlar)': run_concurrent('/api/news/?page=2', args.clients, args.requests),
+        'ASGI, sync view': asyncio.run(run_async('/api/news/?page=2', args.clients, args.requests)),
+        'ASGI, async view': asyncio.run(run_async('/api/async/news/?page=2', args.clients, args.requests)),
+    }
+    print(f"{args.clients} ta parallel mijoz, har biri {args.requests} so'rov")
+    for name, (rps, errors) in results.items():
+        print(f"  {name:18} {rps:8.1f} req/s, xatolar: {errors}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+increment_views: eski sinxron HitCount yozuvi va buferlangan hisoblagich taqqoslanadi.
+
+    python benchmarks/bench_hits.py --clients 16 --requests 200
+"""
+import argparse
+
+from common import run_concurrent, setup_django
+
+setup_django(urlconf='__main__')
+
+from django.urls import include, path
+from hitcount.models import HitCount
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.routers import DefaultRouter
+
+from core.counters import hit_buffer
+from core.models import News
+from core.views import NewsViewSet
+
+
+class LegacyNewsViewSet(NewsViewSet):
+    @action(detail=True, methods=['get'])
+    def increment_views(self, request, pk=None):
+        """Avvalgi usul: har bir so'rovda HitCount ni o'qish va yozish"""
+        news = self.get_object()
+        hit_count = HitCount.objects.get_for_object(news)
+        hit_count.increase()
+        hit_count.refresh_from_db()
+        return Response({'views': hit_count.hits})
+
+
+router = DefaultRouter()
+router.register(r'legacy-news', LegacyNewsViewSet, basename='legacy-news')
+
+urlpatterns = [
+    path('bench/', include(router.urls)),
+    path('api/', include('core.urls')),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--clients', type=int, default=16)
+    parser.add_argument('--requests', type=int, default=200)
+    args = parser.parse_args()
+
+    news = News.objects.create(title="Benchmark", content="<p>x</p>", main_image='news/x.jpg')
+
+    before = run_concurrent(f'/bench/legacy-news/{news.pk}/increment_views/', args.clients, args.requests)
+    after = run_concurrent(f'/api/news/{news.pk}/increment_views/', args.clients, args.requests)
+    hit_buffer.flush()
+
+    print(f"{args.clients} ta parallel mijoz, har biri {args.requests} so'rov")
+    print(f"  sinxron HitCount:   {before[0]:8.1f} req/s, xatolar: {before[1]}")
+    print(f"  buferlangan:        {after[0]:8.1f} req/s, xatolar: {after[1]}")
+    print(f"  bazadagi ko'rishlar: {HitCount.objects.get_for_object(news).hits}")
+
+
+if __name__ == '__main__':
+    main()
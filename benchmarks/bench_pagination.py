@@ -0,0 +1,58 @@
+"""
+Sahifa raqami (COUNT + OFFSET) va keyset paginatsiyani birinchi va chuqur sahifada taqqoslash.
+
+    python benchmarks/bench_pagination.py --rows 20000 --page 1000
+"""
+import argparse
+
+from common import measure, setup_django
+
+setup_django(CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}})
+
+from core.models import Decision, News
+from core.pagination import KeysetPagination
+
+
+def seed(rows):
+    batch = 2000
+    for start in range(0, rows, batch):
+        News.objects.bulk_create([
+            News(
+                title=f"Yangilik {i}", content=f"<p>Matn {i}</p>" * 20,
+                main_image='news/x.jpg', slug=f"yangilik-{i}",
+            )
+            for i in range(start, min(start + batch, rows))
+        ])
+        Decision.objects.bulk_create([
+            Decision(title=f"Qaror {i}", content=f"<p>Qaror {i}</p>" * 20, slug=f"qaror-{i}")
+            for i in range(start, min(start + batch, rows))
+        ])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--page', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    seed(args.rows)
+    paginator = KeysetPagination()
+    print(f"{args.rows} ta yozuv, sahifa hajmi {paginator.page_size}")
+    for model, url in [(News, '/api/news/'), (Decision, '/api/decisions/')]:
+        offset = (args.page - 1) * paginator.page_size
+        anchor = model.objects.order_by(*paginator.ordering)[offset - 1]
+        cursor = paginator.encode_cursor(anchor)
+        results = {
+            'page=1': measure(f'{url}?page=1', args.repeat),
+            f'page={args.page}': measure(f'{url}?page={args.page}', args.repeat),
+            'cursor, 1-sahifa': measure(f'{url}?pagination=cursor', args.repeat),
+            f'cursor, {args.page}-sahifa': measure(f'{url}?cursor={cursor}', args.repeat),
+        }
+        print(url)
+        for name, latency in results.items():
+            print(f"  {name:22} {latency:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+Eski SearchFilter (icontains), ro'yxatdagi ?search= filtri va /api/search/
+tartiblangan qidiruvini taqqoslash.
+
+    python benchmarks/bench_search.py --rows 50000
+"""
+import argparse
+import random
+
+from common import measure, setup_django
+
+setup_django(
+    urlconf='__main__',
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}},
+)
+
+from django.urls import include, path
+from rest_framework import filters
+from rest_framework.routers import DefaultRouter
+
+from core.content import backfill_content
+from core.models import News
+from core.search import rebuild_index
+from core.views import NewsViewSet
+
+WORDS = (
+    "suv ta'minoti nasos stansiyasi kanal irrigatsiya melioratsiya fermer hosil "
+    "yer daryo ariq tomchilatib sug'orish loyiha qurilish hudud tuman viloyat"
+).split()
+# Har biri taxminan 1% yangiliklarda uchraydigan so'zlar
+RARE_WORDS = [f"obyekt{i}" for i in range(100)]
+
+
+class LegacyNewsViewSet(NewsViewSet):
+    """Avvalgi usul: search_fields ustunlari bo'yicha icontains"""
+    filter_backends = [filters.SearchFilter]
+
+
+router = DefaultRouter()
+router.register(r'legacy-news', LegacyNewsViewSet, basename='legacy-news')
+
+urlpatterns = [
+    path('bench/', include(router.urls)),
+    path('api/', include('core.urls')),
+]
+
+
+def seed(rows):
+    rng = random.Random(0)
+    batch = 2000
+    for start in range(0, rows, batch):
+        News.objects.bulk_create([
+            News(
+                title=' '.join(rng.choices(WORDS, k=5)).capitalize(),
+                content='<p>' + ' '.join(rng.choices(WORDS, k=120) + [rng.choice(RARE_WORDS)]) + '</p>',
+                main_image='news/x.jpg', slug=f"yangilik-{i}",
+            )
+            for i in range(start, min(start + batch, rows))
+        ])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    seed(args.rows)
+    # bulk_create save() ni chaqirmaydi: plain_text ustunlarini to'ldirish
+    backfill_content(News, 'content', 'minutes_to_read', batch_size=1000)
+    rebuild_index(batch_size=1000)
+    print(f"{args.rows} ta yangilik")
+    for query in ('obyekt42', 'obyekt42 kanal', 'nasos kanal'):
+        results = {
+            'SearchFilter': measure(f'/bench/legacy-news/?search={query}', args.repeat),
+            '?search=': measure(f'/api/news/?search={query}', args.repeat),
+            '/api/search/': measure(f'/api/search/?q={query}&type=news', args.repeat),
+        }
+        print(query)
+        for name, latency in results.items():
+            print(f"  {name:18} {latency:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
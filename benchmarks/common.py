@@ -0,0 +1,72 @@
+"""
+Benchmark skriptlari uchun umumiy yordamchilar.
+
+Har bir skript vaqtinchalik SQLite bazasida ishlaydi, asosiy db.sqlite3 ga tegmaydi.
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def setup_django(urlconf=None, **overrides):
+    """Django ni vaqtinchalik baza bilan ishga tushirish va migratsiyalarni qo'llash"""
+    sys.path.insert(0, ROOT)
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+    import django
+    from django.conf import settings
+
+    database = settings.DATABASES['default']
+    database['NAME'] = os.path.join(tempfile.mkdtemp(), 'bench.sqlite3')
+    database.setdefault('OPTIONS', {})['timeout'] = 30
+    settings.DEBUG = False
+    settings.ALLOWED_HOSTS = ['*']
+    if urlconf:
+        settings.ROOT_URLCONF = urlconf
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+    django.setup()
+
+    from django.core.management import call_command
+    call_command('migrate', verbosity=0)
+
+
+def run_concurrent(url, clients, requests_per_client):
+    """url ga clients ta parallel mijoz bilan so'rov yuborish, (rps, xatolar) qaytaradi"""
+    from django.db import connection
+    from django.test import Client
+
+    errors = []
+
+    def worker():
+        client = Client()
+        for _ in range(requests_per_client):
+            response = client.get(url)
+            if response.status_code != 200:
+                errors.append(response.status_code)
+        connection.close()
+
+    threads = [threading.Thread(target=worker) for _ in range(clients)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    return clients * requests_per_client / elapsed, len(errors)
+
+
+def measure(url, repeat=20):
+    """url ni ketma-ket repeat marta so'rash, o'rtacha kechikish (ms)"""
+    from django.test import Client
+
+    client = Client()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        response = client.get(url)
+        assert response.status_code == 200, response.status_code
+    return (time.perf_counter() - started) / repeat * 1000
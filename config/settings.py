@@ -5,6 +5,8 @@ Django settings for config project.
 import os
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 SECRET_KEY = "y_e#%0ek53+(sqll)))g28^t7$r(%#c)n8%jl!2s(+5djv2igb"  
@@ -122,6 +124,46 @@ MEDIA_ROOT = BASE_DIR / 'media'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Kesh sozlamalari. CACHE_BACKEND muhit o'zgaruvchisi orqali tanlanadi:
+#   locmem - bitta jarayon xotirasida (standart, testlar uchun ham)
+#   redis  - bir nechta worker uchun umumiy kesh (redis paketi kerak), CACHE_URL
+#   file   - bitta server uchun fayl keshi, CACHE_LOCATION
+#   db     - bazadagi kesh jadvali (avval: python manage.py createcachetable)
+#   dummy  - keshsiz rejim
+CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'locmem')
+CACHE_BACKENDS = {
+    'locmem': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'water-management',
+        'OPTIONS': {'MAX_ENTRIES': 5000},
+    },
+    'redis': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ.get('CACHE_URL', 'redis://127.0.0.1:6379/1'),
+    },
+    'file': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get('CACHE_LOCATION', '/var/tmp/water-management-cache'),
+    },
+    'db': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'api_cache',
+    },
+    'dummy': {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    },
+}
+if CACHE_BACKEND not in CACHE_BACKENDS:
+    raise ImproperlyConfigured(
+        f"CACHE_BACKEND={CACHE_BACKEND!r} noma'lum, mumkin bo'lganlari: {', '.join(CACHE_BACKENDS)}"
+    )
+CACHES = {
+    'default': {
+        **CACHE_BACKENDS[CACHE_BACKEND],
+        'KEY_PREFIX': 'water-management',
+    },
+}
+
 # REST Framework sozlamalari
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
@@ -135,16 +177,37 @@ REST_FRAMEWORK = {
     'PAGE_SIZE': 10,
     'DEFAULT_FILTER_BACKENDS': ['django_filters.rest_framework.DjangoFilterBackend'],
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    # core.throttles (token bucket, keshda saqlanadi)
+    'DEFAULT_THROTTLE_RATES': {
+        'contact': '5/min',
+        'contact_global': '120/min',
+    },
 }
 
+# Rasm nusxalarini (WebP/JPEG) tayyorlaydigan fon oqimlari soni; 0 - saqlash tranzaksiyasidan keyin darhol
+IMAGE_VARIANT_WORKERS = 2
+
+# Bir xil (email, xabar) murojaati shu vaqt (soniya) ichida qayta qabul qilinmaydi
+CONTACT_DUPLICATE_WINDOW = 600
+
 # Telegram bot sozlamalari
 TELEGRAM_BOT_TOKEN = '7977582154:AAEqxQsY40i792Vnxrzn0XdBS9iLzGye3ZQ'
 TELEGRAM_CHAT_ID = '5182300111'
+TELEGRAM_API_URL = os.environ.get('TELEGRAM_API_URL', 'https://api.telegram.org')
+# Murojaatlar shu oynada (soniya) yig'ilib, bitta xabar bo'lib yuboriladi; 0 - o'chirilgan
+TELEGRAM_DIGEST_WINDOW = 30
+# Digest da to'liq ko'rsatiladigan murojaatlar soni
+TELEGRAM_DIGEST_SIZE = 5
+# Bitta chat uchun yuborish tezligi (Telegram cheklovlari ichida) va ketma-ket yuborish mumkin bo'lgan soni
+TELEGRAM_RATE_LIMIT = '20/min'
+TELEGRAM_RATE_BURST = 5
 
 # Hitcount sozlamalari
 HITCOUNT_KEEP_HIT_ACTIVE = {'days': 7}
 HITCOUNT_HITS_PER_IP_LIMIT = 0  # cheksiz
 HITCOUNT_EXCLUDE_USER_GROUP = ()
+# Ko'rishlar xotirada yig'iladi va shu oraliqda (soniya) bazaga yoziladi
+HITCOUNT_FLUSH_INTERVAL = 10
 
 CKEDITOR_UPLOAD_PATH = "uploads/"
 
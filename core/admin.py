@@ -1,12 +1,24 @@
 from django.contrib import admin
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from hitcount.models import HitCount
 from .models import * 
+from .counters import contact_created, contact_read_changed, delete_contacts, set_contacts_read
+from .filters import normalized_search, supports_normalized_search
+from .utils import search_words
 
 # Base admin class with common functionality
 class BaseAdmin(admin.ModelAdmin):
     readonly_fields = ('created_date', 'updated_date')
     list_per_page = 20
+    
+    def get_search_results(self, request, queryset, search_term):
+        results, may_have_duplicates = super().get_search_results(request, queryset, search_term)
+        words = search_words(search_term)
+        if words and supports_normalized_search(self.model):
+            # Kirillcha so'rov lotincha nomni ham topishi uchun (va aksincha)
+            results |= normalized_search(queryset, words)
+        return results, may_have_duplicates
  
 # Statistics Admin
 @admin.register(Statistics)
@@ -23,13 +35,28 @@ class ContactAdmin(BaseAdmin):
     list_editable = ('is_read',)
     actions = ['mark_as_read', 'mark_as_unread']
     
+    def save_model(self, request, obj, form, change):
+        # is_read ro'yxatda ham tahrirlanadi, hisoblagichni yangilash kerak
+        was_read = Contact.objects.values_list('is_read', flat=True).get(pk=obj.pk) if change else None
+        super().save_model(request, obj, form, change)
+        if not change:
+            contact_created(obj)
+        elif was_read != obj.is_read:
+            contact_read_changed(obj)
+    
+    def delete_model(self, request, obj):
+        delete_contacts(Contact.objects.filter(pk=obj.pk))
+    
+    def delete_queryset(self, request, queryset):
+        delete_contacts(queryset)
+    
     def mark_as_read(self, request, queryset):
-        queryset.update(is_read=True)
+        set_contacts_read(queryset, True)
         self.message_user(request, _("Tanlangan murojaatlar o'qilgan deb belgilandi"))
     mark_as_read.short_description = _("Tanlanganlarni o'qilgan deb belgilash")
     
     def mark_as_unread(self, request, queryset):
-        queryset.update(is_read=False)
+        set_contacts_read(queryset, False)
         self.message_user(request, _("Tanlangan murojaatlar o'qilmagan deb belgilandi"))
     mark_as_unread.short_description = _("Tanlanganlarni o'qilmagan deb belgilash")
 
@@ -76,9 +103,10 @@ class UsefulLinkAdmin(BaseAdmin):
 # News Admin
 @admin.register(News)
 class NewsAdmin(BaseAdmin):
+    readonly_fields = BaseAdmin.readonly_fields + ('minutes_to_read',)
     list_display = ('title', 'category', 'minutes_to_read', 'get_views_count', 'created_date')
     list_filter = ('category', 'created_date')
-    search_fields = ('title', 'title_ru', 'title_uz_cyrl', 'content', 'content_ru', 'content_uz_cyrl', 'category', 'category_ru', 'category_uz_cyrl')
+    search_fields = ('title', 'title_ru', 'title_uz_cyrl', 'plain_text', 'plain_text_ru', 'plain_text_uz_cyrl', 'category', 'category_ru', 'category_uz_cyrl')
     prepopulated_fields = {'slug': ('title',)}
     fieldsets = (
         ('Asosiy ma\'lumotlar', {
@@ -97,9 +125,13 @@ class NewsAdmin(BaseAdmin):
         }),
     ) 
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_views_count()
+    
     def get_views_count(self, obj):
-        return obj.views_count.count()
+        return obj.get_views_count()
     get_views_count.short_description = _("Ko'rishlar soni")
+    get_views_count.admin_order_field = 'views_total'
 
 # About Admin - FIXED VERSION
 @admin.register(About)
@@ -199,7 +231,8 @@ class TypeOfWorkAdmin(BaseAdmin):
 class JobVacancyAdmin(BaseAdmin):
     list_display = ('title', 'get_leadership', 'get_department', 'get_type_of_work', 'created_date')
     list_filter = ('leadership', 'department', 'type_of_work', 'created_date')
-    search_fields = ('title', 'title_ru', 'title_uz_cyrl', 'location', 'description')
+    list_select_related = ('leadership', 'department', 'type_of_work')
+    search_fields = ('title', 'title_ru', 'title_uz_cyrl', 'location', 'plain_text')
     # raw_id_fields ni olib tashlang yoki kommentga oling
     # raw_id_fields = ('leadership', 'department', 'type_of_work')
     prepopulated_fields = {'slug': ('title',)}
@@ -239,7 +272,7 @@ class JobVacancyAdmin(BaseAdmin):
 @admin.register(InteractiveService)
 class InteractiveServiceAdmin(BaseAdmin):
     list_display = ('title', 'get_views_count', 'created_date')
-    search_fields = ('title', 'title_ru', 'title_uz_cyrl', 'about')
+    search_fields = ('title', 'title_ru', 'title_uz_cyrl', 'plain_text')
     list_filter = ('created_date',)
     prepopulated_fields = {'slug': ('title',)}
     fieldsets = (
@@ -259,15 +292,19 @@ class InteractiveServiceAdmin(BaseAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_views_count()
+    
     def get_views_count(self, obj):
-        return obj.views_count.count()
+        return obj.get_views_count()
     get_views_count.short_description = _("Ko'rishlar soni")
+    get_views_count.admin_order_field = 'views_total'
 
 # Decision Admin
 @admin.register(Decision)
 class DecisionAdmin(BaseAdmin):
     list_display = ('title', 'get_views_count', 'created_date')
-    search_fields = ('title', 'title_ru', 'title_uz_cyrl', 'content')
+    search_fields = ('title', 'title_ru', 'title_uz_cyrl', 'plain_text')
     list_filter = ('created_date',)
     prepopulated_fields = {'slug': ('title',)}
     fieldsets = (
@@ -287,6 +324,25 @@ class DecisionAdmin(BaseAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_views_count()
+    
     def get_views_count(self, obj):
-        return obj.views_count.count()
-    get_views_count.short_description = _("Ko'rishlar soni")
\ No newline at end of file
+        return obj.get_views_count()
+    get_views_count.short_description = _("Ko'rishlar soni")
+    get_views_count.admin_order_field = 'views_total'
+# Notification Admin
+@admin.register(Notification)
+class NotificationAdmin(admin.ModelAdmin):
+    list_display = ('created_date', 'group', 'status', 'attempts', 'next_attempt_at', 'sent_date')
+    list_filter = ('status', 'group')
+    readonly_fields = ('message', 'attempts', 'last_error', 'created_date', 'sent_date')
+    list_per_page = 20
+    actions = ['retry_now']
+    
+    def retry_now(self, request, queryset):
+        queryset.exclude(status=Notification.STATUS_SENT).update(
+            status=Notification.STATUS_PENDING, attempts=0, next_attempt_at=timezone.now()
+        )
+        self.message_user(request, _("Tanlangan bildirishnomalar qayta yuborish navbatiga qo'yildi"))
+    retry_now.short_description = _("Hozir qayta yuborish")
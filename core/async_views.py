@@ -0,0 +1,200 @@
+"""
+ASGI uchun async o'qish endpointlari (/api/async/...).
+
+Ochiq list va retrieve so'rovlari mavjud viewset sozlamalari (queryset,
+serializer, til) bilan, lekin thread-pool adapterisiz bajariladi: baza async
+ORM (acount, aiterator, aget), kesh esa async API orqali o'qiladi. Javob
+baytlari model versiyalariga bog'langan kesh yozuvida saqlanadi.
+
+Filtr, qidiruv, saralash va cursor paginatsiya kabi boshqa parametrlar bilan
+kelgan so'rovlar odatdagi (sync) viewsetga uzatiladi.
+"""
+from asgiref.sync import sync_to_async
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.http import HttpResponse, JsonResponse
+from django.utils.decorators import classonlymethod
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.exceptions import ParseError, Throttled, UnsupportedMediaType
+from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .cache import aget_model_versions, cache_metrics
+from .serializers import ContactCreateSerializer
+from .throttles import ContactGlobalThrottle, ContactIPThrottle, aclaim_contact_fingerprint
+from .views import save_contact
+
+# Async yo'lda qo'llab-quvvatlanadigan query parametrlari
+ASYNC_QUERY_PARAMS = {'page', 'lang'}
+ASYNC_CACHE_TIMEOUT = 60 * 60
+
+
+def render_json(data):
+    return JSONRenderer().render(data)
+
+
+def json_response(content, hit):
+    response = HttpResponse(content, content_type='application/json')
+    response['X-Cache'] = 'HIT' if hit else 'MISS'
+    return response
+
+
+class AsyncReadView(View):
+    """
+    viewset ning list yoki retrieve amali (action) uchun async view.
+    Javob viewset ning kesh modellari versiyasiga bog'lab keshlanadi
+    """
+    http_method_names = ['get', 'head', 'options']
+    viewset = None
+    action = 'list'
+
+    def get_viewset(self, request, kwargs):
+        return self.viewset(
+            action=self.action, request=Request(request), args=(), kwargs=kwargs, format_kwarg=None
+        )
+
+    async def sync_fallback(self, request, kwargs):
+        """Qo'llab-quvvatlanmaydigan parametrlar bilan so'rov odatdagi DRF viewset orqali"""
+        view = self.viewset.as_view({'get': self.action})
+        return await sync_to_async(view)(request, **kwargs)
+
+    def get_cache_models(self, viewset):
+        return viewset.get_cache_models() or (viewset.queryset.model,)
+
+    async def get(self, request, **kwargs):
+        if set(request.GET) - ASYNC_QUERY_PARAMS:
+            return await self.sync_fallback(request, kwargs)
+
+        viewset = self.get_viewset(request, kwargs)
+        versions = await aget_model_versions(self.get_cache_models(viewset))
+        key = f"async-view:{'.'.join(str(version) for version in versions)}:{request.get_full_path()}"
+        endpoint = getattr(request.resolver_match, 'view_name', None) or request.path
+
+        content = await cache.aget(key)
+        if content is not None:
+            cache_metrics.record(endpoint, hit=True)
+            return json_response(content, hit=True)
+
+        # Ko'rishlar soni subquery'si uchun ContentType (birinchi marta bazadan)
+        await sync_to_async(ContentType.objects.get_for_model)(viewset.queryset.model)
+        if self.action == 'list':
+            status, data = await self.list(request, viewset)
+        else:
+            status, data = await self.retrieve(viewset, kwargs['pk'])
+        content = render_json(data)
+        if status != 200:
+            return HttpResponse(content, content_type='application/json', status=status)
+        await cache.aset(key, content, ASYNC_CACHE_TIMEOUT)
+        cache_metrics.record(endpoint, hit=False)
+        return json_response(content, hit=False)
+
+    def serialize(self, viewset, instance, **kwargs):
+        serializer_class = viewset.get_serializer_class()
+        return serializer_class(instance, context=viewset.get_serializer_context(), **kwargs).data
+
+    async def list(self, request, viewset):
+        """PageNumberPagination bilan bir xil ko'rinishdagi sahifa"""
+        queryset = viewset.get_queryset()
+        page_size = api_settings.PAGE_SIZE
+        try:
+            page = int(request.GET.get('page', 1))
+        except ValueError:
+            page = 0
+        count = await queryset.acount()
+        last_page = max((count + page_size - 1) // page_size, 1)
+        if not 1 <= page <= last_page:
+            return 404, {'detail': "Invalid page."}
+
+        offset = (page - 1) * page_size
+        rows = [obj async for obj in queryset[offset:offset + page_size].aiterator()]
+        url = request.build_absolute_uri()
+        previous = None
+        if page > 1:
+            previous = remove_query_param(url, 'page') if page == 2 else replace_query_param(url, 'page', page - 1)
+        return 200, {
+            'count': count,
+            'next': replace_query_param(url, 'page', page + 1) if page < last_page else None,
+            'previous': previous,
+            'results': self.serialize(viewset, rows, many=True),
+        }
+
+    async def retrieve(self, viewset, pk):
+        queryset = viewset.get_queryset()
+        try:
+            instance = await queryset.aget(pk=pk)
+        except queryset.model.DoesNotExist:
+            return 404, {'detail': f"No {queryset.model._meta.object_name} matches the given query."}
+        return 200, self.serialize(viewset, instance)
+
+
+class AsyncSingletonView(AsyncReadView):
+    """
+    About va Statistics kabi bitta obyektli list: javob sync endpoint bilan
+    umumiy SingletonCache da (viewset.singleton_cache) saqlanadi
+    """
+    ordering = ('-created_date', '-id')
+
+    async def get(self, request, **kwargs):
+        if set(request.GET) - ASYNC_QUERY_PARAMS:
+            return await self.sync_fallback(request, kwargs)
+
+        viewset = self.get_viewset(request, kwargs)
+
+        async def render():
+            instance = await viewset.get_queryset().order_by(*self.ordering).afirst()
+            return render_json(self.serialize(viewset, instance) if instance is not None else {})
+
+        content, hit = await viewset.singleton_cache.aget(viewset.get_language(), render)
+        cache_metrics.record(getattr(request.resolver_match, 'view_name', None) or request.path, hit=hit)
+        return json_response(content, hit)
+
+
+class AsyncContactCreateView(View):
+    """
+    Murojaat yuborish (ContactViewSet.create bilan bir xil tekshiruvlar).
+    Kesh va validatsiya async bajariladi, bazaga yozish va Telegram navbatiga
+    qo'yish bitta tranzaksiyada (sync_to_async) bajariladi
+    """
+    http_method_names = ['post', 'options']
+    throttle_classes = (ContactIPThrottle, ContactGlobalThrottle)
+
+    @classonlymethod
+    def as_view(cls, **initkwargs):
+        # DRF APIView kabi: ochiq API, sessiya cookie'siga tayanmaydi
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def post(self, request):
+        drf_request = Request(request, parsers=[JSONParser(), FormParser(), MultiPartParser()])
+        for throttle in [throttle_class() for throttle_class in self.throttle_classes]:
+            if not await sync_to_async(throttle.allow_request)(drf_request, self):
+                wait = throttle.wait()
+                response = JsonResponse({'detail': str(Throttled(wait).detail)}, status=429)
+                if wait is not None:
+                    response['Retry-After'] = str(int(wait) + 1)
+                return response
+
+        try:
+            data = drf_request.data
+        except (ParseError, UnsupportedMediaType) as e:
+            # Sync endpoint kabi 400 / 415
+            return JsonResponse({'detail': str(e.detail)}, status=e.status_code)
+
+        serializer = ContactCreateSerializer(data=data)
+        if not serializer.is_valid():
+            return JsonResponse(serializer.errors, status=400)
+
+        # Bir xil xabar qayta yuborilsa, bazaga yozilmaydi
+        fingerprint = await aclaim_contact_fingerprint(
+            serializer.validated_data['email'], serializer.validated_data['message']
+        )
+        if fingerprint is None:
+            return JsonResponse({'message': 'Bu murojaat allaqachon qabul qilingan.'}, status=409)
+
+        await sync_to_async(save_contact)(serializer, fingerprint)
+        return JsonResponse(
+            {'message': 'Murojaatingiz qabul qilindi. Tez orada aloqaga chiqamiz.'}, status=201
+        )
@@ -0,0 +1,160 @@
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from functools import wraps
+
+from django.core.cache import cache
+from django.views.decorators.cache import cache_page
+
+logger = logging.getLogger(__name__)
+
+
+class CacheMetrics:
+    """
+    Har bir endpoint uchun kesh hit/miss hisoblagichlari (joriy worker jarayoni bo'yicha)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = defaultdict(lambda: {'hits': 0, 'misses': 0})
+
+    def record(self, endpoint, hit):
+        with self._lock:
+            self._counts[endpoint]['hits' if hit else 'misses'] += 1
+
+    def snapshot(self):
+        with self._lock:
+            endpoints = {
+                endpoint: {
+                    **counts,
+                    'hit_rate': round(counts['hits'] / (counts['hits'] + counts['misses']), 3),
+                }
+                for endpoint, counts in self._counts.items()
+            }
+        return {'pid': os.getpid(), 'endpoints': endpoints}
+
+    def reset(self):
+        with self._lock:
+            self._counts.clear()
+
+
+cache_metrics = CacheMetrics()
+
+
+def _version_key(model):
+    return f'cache-version:{model._meta.label_lower}'
+
+
+def _now_version():
+    return int(time.time() * 1000)
+
+
+def get_model_versions(models):
+    """
+    Modellarning joriy kesh versiyalari (oxirgi o'zgarish vaqti, millisekundlarda)
+    """
+    keys = [_version_key(model) for model in models]
+    versions = cache.get_many(keys)
+    missing = {key: _now_version() for key in keys if key not in versions}
+    if missing:
+        cache.set_many(missing, None)
+        versions.update(missing)
+    return [versions[key] for key in keys]
+
+
+async def aget_model_versions(models):
+    """get_model_versions ning async varianti"""
+    keys = [_version_key(model) for model in models]
+    versions = await cache.aget_many(keys)
+    missing = {key: _now_version() for key in keys if key not in versions}
+    if missing:
+        await cache.aset_many(missing, None)
+        versions.update(missing)
+    return [versions[key] for key in keys]
+
+
+def bump_model_version(model):
+    """
+    Model versiyasini oshirish: shu modelga bog'liq barcha keshlangan javoblar eskiradi
+    """
+    key = _version_key(model)
+    cache.set(key, max(_now_version(), (cache.get(key) or 0) + 1), None)
+
+
+def versioned_cache_page(timeout, *models):
+    """
+    cache_page bilan bir xil, lekin kesh kaliti modellar versiyasiga bog'langan.
+    Model saqlanganda yoki o'chirilganda (signals.py) eski yozuvlar ishlatilmay qoladi,
+    shuning uchun timeout uzoq bo'lishi mumkin.
+
+    Kalit faqat URL (til va query parametrlari) va javob formatiga bog'liq, cookie'lar
+    hisobga olinmaydi: barcha anonim foydalanuvchilar bitta yozuvdan foydalanadi.
+    Adminlar uchun kesh chetlab o'tiladi.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped_view(request, *args, **kwargs):
+            user = getattr(request, 'user', None)
+            if user is not None and user.is_staff:
+                return view_func(request, *args, **kwargs)
+
+            versions = '.'.join(str(version) for version in get_model_versions(models))
+            renderer = getattr(request, 'accepted_renderer', None)
+            key_prefix = f"v{versions}.{getattr(renderer, 'format', '')}"
+            missed = []
+
+            def render(*args, **kwargs):
+                missed.append(True)
+                return view_func(*args, **kwargs)
+
+            response = cache_page(timeout, key_prefix=key_prefix)(render)(request, *args, **kwargs)
+            if request.method in ('GET', 'HEAD'):
+                endpoint = getattr(request.resolver_match, 'view_name', None) or request.path
+                cache_metrics.record(endpoint, hit=not missed)
+                response['X-Cache'] = 'MISS' if missed else 'HIT'
+            return response
+        return _wrapped_view
+    return decorator
+
+
+class SingletonCache:
+    """
+    Kam o'zgaradigan yagona obyekt (masalan, oxirgi About) uchun tayyor javob
+    baytlari, joriy worker xotirasida. Har so'rovda faqat modelning umumiy
+    keshdagi versiyasi tekshiriladi: model saqlangan yoki o'chirilgan bo'lsa
+    (signals.py), keyingi so'rovda javob qaytadan tuziladi.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    def get(self, key, render):
+        """(baytlar, hit) qaytaradi; versiya o'zgargan bo'lsa render() chaqiriladi"""
+        version = get_model_versions([self.model])[0]
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            return entry[1], True
+        # Versiya render'dan oldin olinadi: shu orada o'zgarish bo'lsa, keyingi so'rov yana yangilaydi
+        content = render()
+        with self._lock:
+            self._entries[key] = (version, content)
+        return content, False
+
+    async def aget(self, key, render):
+        """get() ning async varianti: render korutina qaytaradi"""
+        version = (await aget_model_versions([self.model]))[0]
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            return entry[1], True
+        content = await render()
+        with self._lock:
+            self._entries[key] = (version, content)
+        return content, False
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
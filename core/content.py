@@ -0,0 +1,181 @@
+"""
+CKEditor matnlarini saqlashda qayta ishlash.
+
+Asl HTML o'zgarmaydi. Undan har bir til uchun hosila ustunlar tayyorlanadi:
+ruxsat etilgan teg va atributlar bilan tozalangan (script, on* atributlar,
+javascript: havolalar olib tashlanadi) va siqilgan HTML (clean_html*), oddiy
+matn (plain_text*) va qisqa matn (excerpt*); yangiliklar uchun esa o'qish
+vaqti hisoblanadi. API, ro'yxat va qidiruv shu tayyor ustunlarni o'qiydi,
+HTML har so'rovda qayta tahlil qilinmaydi.
+"""
+import html
+import math
+import re
+from html.parser import HTMLParser
+from urllib.parse import urlsplit
+
+from django.utils.text import Truncator
+
+from .utils import EXCERPT_LENGTH, LANGUAGE_SUFFIXES, html_to_text
+
+# Daqiqasiga o'qiladigan so'zlar soni
+READING_SPEED = 200
+MAX_MINUTES_TO_READ = 60
+
+ALLOWED_TAGS = {
+    'a', 'abbr', 'b', 'blockquote', 'br', 'caption', 'code', 'div', 'em', 'figcaption',
+    'figure', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'hr', 'i', 'img', 'li', 'ol', 'p', 'pre',
+    's', 'small', 'span', 'strike', 'strong', 'sub', 'sup', 'table', 'tbody', 'td', 'tfoot',
+    'th', 'thead', 'tr', 'u', 'ul',
+}
+VOID_TAGS = {'br', 'hr', 'img'}
+# Ichidagi matni bilan birga olib tashlanadigan teglar
+DROP_CONTENT_TAGS = {'script', 'style', 'iframe', 'object', 'noscript', 'template', 'textarea'}
+PRESERVE_WHITESPACE_TAGS = {'pre', 'code'}
+
+GLOBAL_ATTRIBUTES = {'class', 'style', 'title', 'dir', 'lang'}
+ALLOWED_ATTRIBUTES = {
+    'a': {'href', 'target', 'rel', 'name'},
+    'img': {'src', 'alt', 'width', 'height'},
+    'td': {'colspan', 'rowspan', 'align'},
+    'th': {'colspan', 'rowspan', 'align', 'scope'},
+    'table': {'border', 'cellpadding', 'cellspacing', 'width'},
+    'ol': {'start', 'type'},
+    'iframe': {'src', 'width', 'height', 'allow', 'allowfullscreen', 'frameborder'},
+}
+# iframe (video, xarita) faqat shu manzillardan qoldiriladi
+EMBED_HOSTS = {
+    'www.youtube.com', 'youtube.com', 'www.youtube-nocookie.com', 'player.vimeo.com',
+    'www.google.com', 'maps.google.com', 'yandex.uz', 'yandex.ru',
+}
+URL_ATTRIBUTES = {'href', 'src'}
+URL_RE = re.compile(r'^(?:https?:|mailto:|tel:|/|#|\.|[^:/?#]*(?:[/?#]|$))', re.IGNORECASE)
+UNSAFE_STYLE_RE = re.compile(r'expression|javascript:|url\s*\(|@import|behavior', re.IGNORECASE)
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+class HTMLSanitizer(HTMLParser):
+    """Ruxsat etilgan teglardan iborat, to'g'ri yopilgan va siqilgan HTML"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.output = []
+        self.open_tags = []
+        self.dropping = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in DROP_CONTENT_TAGS:
+            if tag == 'iframe' and not self.dropping and is_embed(attrs):
+                self.output.append(f'<iframe{self.render_attributes(tag, attrs)}></iframe>')
+            self.dropping += 1
+            return
+        if self.dropping or tag not in ALLOWED_TAGS:
+            return
+        self.output.append(f'<{tag}{self.render_attributes(tag, attrs)}>')
+        if tag not in VOID_TAGS:
+            self.open_tags.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        # <br/> kabi; <p/> va <script/> kabi boshqa teglar tashlab yuboriladi
+        if tag in VOID_TAGS:
+            self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag):
+        if tag in DROP_CONTENT_TAGS:
+            self.dropping = max(self.dropping - 1, 0)
+            return
+        if self.dropping or tag not in self.open_tags:
+            return
+        # Ichida yopilmay qolgan teglar ham yopiladi
+        while self.open_tags:
+            open_tag = self.open_tags.pop()
+            self.output.append(f'</{open_tag}>')
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        if self.dropping:
+            return
+        if not PRESERVE_WHITESPACE_TAGS.intersection(self.open_tags):
+            data = WHITESPACE_RE.sub(' ', data)
+            if data == ' ' and (not self.output or self.output[-1].endswith(' ')):
+                return
+        self.output.append(html.escape(data, quote=False))
+
+    def render_attributes(self, tag, attrs):
+        allowed = GLOBAL_ATTRIBUTES | ALLOWED_ATTRIBUTES.get(tag, set())
+        rendered = []
+        for name, value in attrs:
+            value = (value or '').strip()
+            if name not in allowed:
+                continue
+            if name in URL_ATTRIBUTES and not URL_RE.match(WHITESPACE_RE.sub('', value)):
+                continue
+            if name == 'style' and UNSAFE_STYLE_RE.search(value):
+                continue
+            rendered.append(f' {name}="{html.escape(value)}"')
+        if tag == 'a' and ('target', '_blank') in attrs and not any(name == 'rel' for name, _ in attrs):
+            rendered.append(' rel="noopener noreferrer"')
+        return ''.join(rendered)
+
+    def get_html(self):
+        self.close()
+        return (''.join(self.output) + ''.join(f'</{tag}>' for tag in reversed(self.open_tags))).strip()
+
+
+def is_embed(attrs):
+    """iframe manzili EMBED_HOSTS dan (https yoki //) bo'lsa True"""
+    url = urlsplit(WHITESPACE_RE.sub('', dict(attrs).get('src') or ''))
+    return url.scheme in ('https', '') and url.hostname in EMBED_HOSTS
+
+
+def sanitize_html(value):
+    """Foydalanuvchi kiritgan HTML ni xavfsiz va siqilgan ko'rinishga keltirish"""
+    if not value:
+        return value
+    sanitizer = HTMLSanitizer()
+    sanitizer.feed(value)
+    return sanitizer.get_html()
+
+
+def minutes_to_read(text):
+    """Oddiy matnni o'qish vaqti (daqiqa, 1..MAX_MINUTES_TO_READ)"""
+    words = len(text.split())
+    return min(max(math.ceil(words / READING_SPEED), 1), MAX_MINUTES_TO_READ)
+
+
+def process_content(obj, field, reading_time_field=None):
+    """
+    obj.<field>* HTML matnlaridan hosila ustunlarni to'ldirish (asl matn
+    o'zgarmaydi). O'zgartirilgan maydonlar nomlari ro'yxatini qaytaradi
+    """
+    changed = []
+    for suffix in LANGUAGE_SUFFIXES.values():
+        cleaned = sanitize_html(getattr(obj, f'{field}{suffix}')) or ''
+        text = html_to_text(cleaned)
+        setattr(obj, f'clean_html{suffix}', cleaned)
+        setattr(obj, f'plain_text{suffix}', text)
+        setattr(obj, f'excerpt{suffix}', Truncator(text).chars(EXCERPT_LENGTH))
+        changed += [f'clean_html{suffix}', f'plain_text{suffix}', f'excerpt{suffix}']
+    if reading_time_field:
+        setattr(obj, reading_time_field, minutes_to_read(obj.plain_text))
+        changed.append(reading_time_field)
+    return changed
+
+
+def backfill_content(model, field, reading_time_field=None, batch_size=200):
+    """Mavjud yozuvlarning hosila ustunlarini qayta hisoblash (signal va save() siz)"""
+    total = 0
+    batch = []
+    fields = None
+    for obj in model.objects.order_by('pk').iterator(chunk_size=batch_size):
+        fields = process_content(obj, field, reading_time_field)
+        batch.append(obj)
+        if len(batch) >= batch_size:
+            model.objects.bulk_update(batch, fields)
+            total += len(batch)
+            batch = []
+    if batch:
+        model.objects.bulk_update(batch, fields)
+        total += len(batch)
+    return total
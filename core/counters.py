@@ -0,0 +1,265 @@
+import atexit
+import logging
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import IntegrityError, close_old_connections, transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from hitcount.models import HitCount
+
+from .cache import bump_model_version
+from .models import Contact, ContactCounter
+
+logger = logging.getLogger(__name__)
+
+
+class HitBuffer:
+    """
+    Ko'rishlarni xotirada yig'ib, HitCount jadvaliga partiyalab yozuvchi bufer.
+
+    Har bir so'rov faqat xotiradagi hisoblagichni oshiradi; to'plangan farqlar
+    fon oqimi (HITCOUNT_FLUSH_INTERVAL soniyada bir) yoki flush() orqali
+    bitta tranzaksiyada bazaga yoziladi.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = {}  # (content_type_id, object_pk) -> yozilmagan ko'rishlar
+        # (content_type_id, object_pk) -> bazadagi qiymat + yozilayotgan farqlar;
+        # faqat yozilmagan ko'rishlari bor obyektlar saqlanadi
+        self._known = {}
+        self._generation = 0  # _known dan kalitlar olib tashlanganda oshadi
+        self._worker = None
+
+    def hit(self, obj):
+        """Ko'rishni qayd etish va taxminiy umumiy sonni qaytarish"""
+        key = (ContentType.objects.get_for_model(obj.__class__).pk, obj.pk)
+        stored = generation = None
+        while True:
+            with self._lock:
+                if key not in self._known and stored is not None and generation == self._generation:
+                    self._known[key] = stored
+                if key in self._known:
+                    self._pending[key] = self._pending.get(key, 0) + 1
+                    total = self._known[key] + self._pending[key]
+                    break
+                generation = self._generation
+            # Bazadan o'qish paytida flush kalitni olib tashlagan bo'lsa, qayta o'qiladi
+            stored = self._load([key]).get(key, 0)
+        self._ensure_worker()
+        return total
+
+    def flush(self):
+        """To'plangan farqlarni bazaga yozish, yozilgan ko'rishlar sonini qaytaradi"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            # Yozilayotgan farqlar _known ga o'tadi: hit() javobi kamaymaydi
+            for key, delta in pending.items():
+                self._known[key] += delta
+        if not pending:
+            return 0
+
+        try:
+            with transaction.atomic():
+                for (content_type_id, object_pk), delta in pending.items():
+                    updated = HitCount.objects.filter(
+                        content_type_id=content_type_id, object_pk=object_pk
+                    ).update(hits=F('hits') + delta)
+                    if not updated:
+                        HitCount.objects.create(
+                            content_type_id=content_type_id, object_pk=object_pk, hits=delta
+                        )
+        except Exception as e:
+            logger.error(f"Ko'rishlarni bazaga yozishda xatolik: {e}")
+            with self._lock:
+                for key, delta in pending.items():
+                    self._known[key] -= delta
+                    self._pending[key] = self._pending.get(key, 0) + delta
+            return 0
+
+        bump_model_version(HitCount)
+        with self._lock:
+            # Yozib bo'lingan obyektlar unutiladi (keyingi hit bazadan o'qiydi),
+            # shuning uchun _known faqat faol obyektlar bilan cheklanadi
+            for key in pending:
+                if key not in self._pending:
+                    del self._known[key]
+            self._generation += 1
+        return sum(pending.values())
+
+    def _load(self, keys):
+        by_type = {}
+        for content_type_id, object_pk in keys:
+            by_type.setdefault(content_type_id, []).append(object_pk)
+        stored = {}
+        for content_type_id, pks in by_type.items():
+            rows = HitCount.objects.filter(
+                content_type_id=content_type_id, object_pk__in=pks
+            ).values_list('object_pk', 'hits')
+            for object_pk, hits in rows:
+                stored[(content_type_id, object_pk)] = hits
+        return stored
+
+    def _ensure_worker(self):
+        interval = getattr(settings, 'HITCOUNT_FLUSH_INTERVAL', None)
+        if not interval or self._worker is not None:
+            return
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, args=(interval,), name='hit-buffer', daemon=True
+                )
+                self._worker.start()
+
+    def _run(self, interval):
+        while True:
+            time.sleep(interval)
+            try:
+                self.flush()
+            finally:
+                close_old_connections()
+
+
+hit_buffer = HitBuffer()
+atexit.register(hit_buffer.flush)
+
+
+# Murojaatlar hisoblagichlari: ContactCounter kunlik qatorlari murojaat
+# yaratilganda, o'qilgan/o'qilmagan qilinganda va o'chirilganda yangilanadi.
+
+def _apply_contact_deltas(deltas):
+    """{kun: (jami_farq, oqilmagan_farq)} ni ContactCounter ga qo'shish"""
+    for day, (total, unread) in deltas.items():
+        if not total and not unread:
+            continue
+        updated = ContactCounter.objects.filter(day=day).update(
+            total=F('total') + total, unread=F('unread') + unread
+        )
+        if not updated:
+            try:
+                with transaction.atomic():
+                    ContactCounter.objects.create(day=day, total=total, unread=unread)
+            except IntegrityError:
+                # Boshqa so'rov shu kun qatorini yaratib ulgurdi
+                ContactCounter.objects.filter(day=day).update(
+                    total=F('total') + total, unread=F('unread') + unread
+                )
+
+
+def _contacts_by_day(queryset):
+    """Querysetdagi murojaatlar: {kun: (soni, o'qilmaganlar soni)}"""
+    rows = (
+        queryset.order_by()
+        .annotate(day=TruncDate('created_date'))
+        .values('day')
+        .annotate(total=Count('pk'), unread=Count('pk', filter=Q(is_read=False)))
+    )
+    return {row['day']: (row['total'], row['unread']) for row in rows}
+
+
+def contact_created(contact):
+    _apply_contact_deltas({
+        timezone.localdate(contact.created_date): (1, 0 if contact.is_read else 1),
+    })
+
+
+def contact_read_changed(contact):
+    """Saqlangan murojaatning is_read qiymati o'zgargandan keyin"""
+    _apply_contact_deltas({
+        timezone.localdate(contact.created_date): (0, -1 if contact.is_read else 1),
+    })
+
+
+def _lock_contacts(queryset):
+    """Murojaatlarni qulflab, ularning (pk, kun, is_read) ro'yxatini qaytarish"""
+    rows = queryset.select_for_update().order_by('pk').values_list('pk', 'created_date', 'is_read')
+    return [(pk, timezone.localdate(created_date), is_read) for pk, created_date, is_read in rows]
+
+
+def _recount_days(days):
+    """Kunlar hisoblagichlarini Contact jadvalidan qayta hisoblash"""
+    actual = _contacts_by_day(Contact.objects.filter(created_date__date__in=days))
+    for day in days:
+        total, unread = actual.get(day, (0, 0))
+        ContactCounter.objects.update_or_create(day=day, defaults={'total': total, 'unread': unread})
+
+
+def set_contacts_read(queryset, is_read):
+    """
+    Murojaatlarni o'qilgan/o'qilmagan qilish va hisoblagichni yangilash.
+    Faqat holati o'zgaradigan qatorlar yangilanadi, ularning soni qaytariladi
+    """
+    with transaction.atomic():
+        rows = _lock_contacts(queryset.exclude(is_read=is_read))
+        count = Contact.objects.filter(pk__in=[pk for pk, _, _ in rows]).exclude(is_read=is_read).update(
+            is_read=is_read, updated_date=timezone.now()
+        )
+        by_day = Counter(day for _, day, _ in rows)
+        if count != len(rows):
+            # Qulflanmagan (SQLite) qatorlarni boshqa so'rov o'zgartirib ulgurgan:
+            # farqlar noaniq, shu kunlar qayta sanaladi
+            _recount_days(by_day)
+        else:
+            sign = -1 if is_read else 1
+            _apply_contact_deltas({day: (0, sign * total) for day, total in by_day.items()})
+    return count
+
+
+def delete_contacts(queryset):
+    """Murojaatlarni o'chirish va hisoblagichni yangilash, o'chirilganlar sonini qaytaradi"""
+    with transaction.atomic():
+        rows = _lock_contacts(queryset)
+        count = Contact.objects.filter(pk__in=[pk for pk, _, _ in rows]).delete()[1].get(Contact._meta.label, 0)
+        if count != len(rows):
+            _recount_days({day for _, day, _ in rows})
+        else:
+            deltas = {}
+            for _, day, is_read in rows:
+                total, unread = deltas.get(day, (0, 0))
+                deltas[day] = (total - 1, unread - (0 if is_read else 1))
+            _apply_contact_deltas(deltas)
+    return count
+
+
+def contact_summary():
+    """Jami, o'qilmagan va bugungi murojaatlar soni (bitta kichik so'rov)"""
+    summary = ContactCounter.objects.aggregate(
+        all_total=Sum('total'),
+        all_unread=Sum('unread'),
+        today_total=Sum('total', filter=Q(day=timezone.localdate())),
+    )
+    return {
+        'total': summary['all_total'] or 0,
+        'unread': summary['all_unread'] or 0,
+        'today': summary['today_total'] or 0,
+    }
+
+
+def rebuild_contact_counters():
+    """Hisoblagichlarni Contact jadvalidan qaytadan hisoblash"""
+    with transaction.atomic():
+        ContactCounter.objects.all().delete()
+        ContactCounter.objects.bulk_create([
+            ContactCounter(day=day, total=total, unread=unread)
+            for day, (total, unread) in _contacts_by_day(Contact.objects.all()).items()
+        ])
+
+
+def check_contact_counters():
+    """Hisoblagich va haqiqiy sonlar farqi: {kun: ((jami, o'qilmagan), (kutilgan))}"""
+    actual = _contacts_by_day(Contact.objects.all())
+    stored = {
+        counter.day: (counter.total, counter.unread)
+        for counter in ContactCounter.objects.all()
+    }
+    return {
+        day: (stored.get(day, (0, 0)), actual.get(day, (0, 0)))
+        for day in stored.keys() | actual.keys()
+        if stored.get(day, (0, 0)) != actual.get(day, (0, 0))
+    }
+
@@ -0,0 +1,44 @@
+from django.db.models import Q
+from rest_framework import filters
+
+from .search import MAX_QUERY_TERMS, SEARCH_MODELS, matching_object_ids, prefix_range
+from .utils import search_words
+
+
+def search_key_condition(word):
+    """
+    search_key dagi biror so'z shu so'rov bilan boshlanadi. Ikkinchi va
+    keyingi so'zlar uchun LIKE '%...%' indeksdan foydalanmaydi: search_key faqat
+    kichik ma'lumotnoma jadvallarida (UsefulLink, Leadership) bor, katta
+    jadvallar SearchTerm indeksidan qidiriladi
+    """
+    return prefix_range('search_key', word) | Q(search_key__contains=f' {word}')
+
+
+def supports_normalized_search(model):
+    return model in SEARCH_MODELS or hasattr(model, 'search_key_fields')
+
+
+def normalized_search(queryset, words):
+    """Har bir so'z mos kelgan obyektlar (qidiruv indeksi yoki search_key bo'yicha)"""
+    model = queryset.model
+    for word in list(dict.fromkeys(words))[:MAX_QUERY_TERMS]:
+        if model in SEARCH_MODELS:
+            queryset = queryset.filter(pk__in=matching_object_ids(model, word))
+        else:
+            queryset = queryset.filter(search_key_condition(word))
+    return queryset
+
+
+class NormalizedSearchFilter(filters.SearchFilter):
+    """
+    ?search= so'rovini kirill/lotin yozuvidan qat'i nazar qidirish.
+
+    So'rov so'zlari saqlashda tuzilgan kalitlar kabi normallashtiriladi:
+    qidiruv indeksidagi modellar uchun SearchTerm (sarlavha va matn),
+    qolganlari uchun search_key ustuni ishlatiladi. Har bir so'z mos kelishi kerak.
+    """
+    def filter_queryset(self, request, queryset, view):
+        if not supports_normalized_search(queryset.model):
+            return super().filter_queryset(request, queryset, view)
+        return normalized_search(queryset, search_words(' '.join(self.get_search_terms(request))))
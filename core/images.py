@@ -0,0 +1,189 @@
+"""
+Rasmlarning kichraytirilgan nusxalari (WebP va JPEG, bir nechta kenglikda).
+
+Rasm yuklanganda nusxalar admin so'rovi ichida emas, tranzaksiya tugagach
+fon oqimlari hovuzida (IMAGE_VARIANT_WORKERS) tayyorlanadi va modelning
+<maydon>_variants JSON ustuniga yoziladi. Shundan keyin kesh versiyasi
+oshiriladi, shuning uchun API javoblarida srcset darhol paydo bo'ladi.
+"""
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connection, transaction
+from PIL import Image, ImageOps
+
+from .cache import bump_model_version
+from .models import Banner, Leadership, News, UsefulLink
+
+logger = logging.getLogger(__name__)
+
+VARIANT_WIDTHS = (320, 640, 1280)
+# Format nomi (fayl kengaytmasi) -> (Pillow formati, saqlash parametrlari)
+VARIANT_FORMATS = {
+    'webp': ('WEBP', {'quality': 80, 'method': 4}),
+    'jpeg': ('JPEG', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+VARIANTS_DIR = 'variants'
+
+# Model -> rasm maydoni (nusxalar <maydon>_variants ustunida)
+IMAGE_FIELDS = {
+    Banner: 'image',
+    UsefulLink: 'icon',
+    News: 'main_image',
+    Leadership: 'image',
+}
+
+_executor = None
+_executor_lock = threading.Lock()
+_pending = set()
+
+
+def variants_field(model):
+    return f'{IMAGE_FIELDS[model]}_variants'
+
+
+def variant_widths(width):
+    """Asl kenglikdan katta nusxa qilinmaydi (kichik rasm o'z kengligida qoladi)"""
+    return sorted({min(size, width) for size in VARIANT_WIDTHS})
+
+
+def variant_name(name, width, extension):
+    directory, filename = os.path.split(name)
+    stem = os.path.splitext(filename)[0]
+    return os.path.join(directory, VARIANTS_DIR, f'{stem}-{width}.{extension}')
+
+
+def needs_variants(obj):
+    """Rasm o'zgargan (yoki hali nusxalari yo'q) bo'lsa True"""
+    name = getattr(obj, IMAGE_FIELDS[type(obj)]).name or ''
+    return (getattr(obj, variants_field(type(obj))) or {}).get('source', '') != name
+
+
+def _encode(image, width, image_format, options):
+    if image.width > width:
+        image = image.resize((width, round(image.height * width / image.width)), Image.LANCZOS)
+    if image_format == 'JPEG' and image.mode != 'RGB':
+        # Shaffof fonni oq rang bilan to'ldirish
+        background = Image.new('RGB', image.size, 'white')
+        background.paste(image, mask=image.getchannel('A') if 'A' in image.getbands() else None)
+        image = background
+    buffer = BytesIO()
+    image.save(buffer, image_format, **options)
+    return buffer.getvalue()
+
+
+def build_variants(field_file):
+    """
+    Rasm faylidan barcha nusxalarni tayyorlab saqlash va
+    {'source', 'width', 'height', <format>: {kenglik: yo'l}} qaytarish
+    """
+    storage = field_file.storage
+    with storage.open(field_file.name, 'rb') as source:
+        image = ImageOps.exif_transpose(Image.open(source))
+        image.load()
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if 'transparency' in image.info or 'A' in image.getbands() else 'RGB')
+
+    variants = {'source': field_file.name, 'width': image.width, 'height': image.height}
+    for extension, (image_format, options) in VARIANT_FORMATS.items():
+        variants[extension] = {}
+        for width in variant_widths(image.width):
+            name = variant_name(field_file.name, width, extension)
+            if storage.exists(name):
+                storage.delete(name)
+            variants[extension][str(width)] = storage.save(
+                name, ContentFile(_encode(image, width, image_format, options))
+            )
+    return variants
+
+
+def delete_variants(variants, storage, keep=()):
+    for extension in VARIANT_FORMATS:
+        for name in (variants or {}).get(extension, {}).values():
+            if name not in keep:
+                storage.delete(name)
+
+
+def generate_variants(model, pk, bump=True):
+    """
+    Obyekt rasmining nusxalarini tayyorlab saqlash. Rasm shu vaqt ichida
+    o'zgargan bo'lsa, natija yozilmaydi (yangi rasm uchun alohida vazifa bor)
+    """
+    field = IMAGE_FIELDS[model]
+    obj = model.objects.filter(pk=pk).only('pk', field, variants_field(model)).first()
+    if obj is None or not needs_variants(obj):
+        return False
+
+    field_file = getattr(obj, field)
+    old_variants = getattr(obj, variants_field(model))
+    variants = {'source': ''}
+    if field_file.name:
+        if not field_file.storage.exists(field_file.name):
+            logger.warning(f"{model.__name__} #{pk}: {field_file.name} fayli topilmadi")
+            return False
+        try:
+            variants = build_variants(field_file)
+        except (OSError, ValueError) as e:
+            logger.warning(f"{model.__name__} #{pk}: nusxalar tayyorlanmadi: {e}")
+            return False
+
+    updated = model.objects.filter(pk=pk, **{field: field_file.name}).update(**{variants_field(model): variants})
+    new_names = {name for extension in VARIANT_FORMATS for name in variants.get(extension, {}).values()}
+    delete_variants(old_variants, field_file.storage, keep=new_names)
+    if updated and bump:
+        bump_model_version(model)
+    return bool(updated)
+
+
+def _run(model, pk):
+    try:
+        generate_variants(model, pk)
+    except Exception:
+        logger.exception(f"{model.__name__} #{pk}: rasm nusxalarini tayyorlashda xatolik")
+    finally:
+        # Fon oqimining baza ulanishi
+        connection.close()
+
+
+def get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.IMAGE_VARIANT_WORKERS, thread_name_prefix='image-variants'
+            )
+        return _executor
+
+
+def submit(model, pk):
+    """Nusxalarni tayyorlash vazifasini hovuzga qo'yish (IMAGE_VARIANT_WORKERS=0 bo'lsa shu yerning o'zida)"""
+    if not getattr(settings, 'IMAGE_VARIANT_WORKERS', 0):
+        generate_variants(model, pk)
+        return
+    future = get_executor().submit(_run, model, pk)
+    _pending.add(future)
+    future.add_done_callback(_pending.discard)
+
+
+def schedule_variants(obj):
+    """Tranzaksiya muvaffaqiyatli tugagach nusxalarni tayyorlash"""
+    model, pk = type(obj), obj.pk
+    transaction.on_commit(lambda: submit(model, pk))
+
+
+def schedule_variants_deletion(obj):
+    """O'chirilgan obyekt nusxalarini tranzaksiya muvaffaqiyatli tugagach o'chirish"""
+    variants = getattr(obj, variants_field(type(obj)))
+    if variants:
+        storage = getattr(obj, IMAGE_FIELDS[type(obj)]).storage
+        transaction.on_commit(lambda: delete_variants(variants, storage))
+
+
+def wait_pending(timeout=None):
+    """Navbatdagi barcha vazifalar tugashini kutish (buyruqlar va testlar uchun)"""
+    wait(list(_pending), timeout=timeout)
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from core.cache import bump_model_version
+from core.images import IMAGE_FIELDS, generate_variants, needs_variants, variants_field
+
+
+class Command(BaseCommand):
+    help = "Rasmlarning WebP/JPEG nusxalarini tayyorlash (mavjud yozuvlar uchun)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help="Tayyor nusxalarni ham qaytadan yaratish")
+
+    def handle(self, *args, **options):
+        for model, field in IMAGE_FIELDS.items():
+            if options['force']:
+                model.objects.exclude(**{field: ''}).update(**{variants_field(model): {}})
+            done = 0
+            for obj in model.objects.only('pk', field, variants_field(model)).order_by('pk').iterator():
+                if needs_variants(obj) and generate_variants(model, obj.pk, bump=False):
+                    done += 1
+            if done:
+                # Butun model uchun bir marta
+                bump_model_version(model)
+            self.stdout.write(f"{model._meta.verbose_name_plural}: {done} ta rasm")
+        self.stdout.write(self.style.SUCCESS("Rasm nusxalari tayyor"))
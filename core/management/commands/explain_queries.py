@@ -0,0 +1,104 @@
+import re
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, models
+from rest_framework.test import APIRequestFactory
+
+from core.urls import router
+
+# filterset_fields dan tashqari query parametrlari bilan tekshiriladigan holatlar
+EXTRA_CASES = {
+    'job-vacancies': [{'leadership': '1'}, {'department': '1'}, {'type_of_work': '1'}],
+}
+
+FULL_SCAN_PATTERNS = {
+    # "SCAN core_news" - jadval to'liq o'qiladi, "SCAN ... USING INDEX" - indeks bo'yicha
+    'sqlite': re.compile(r'\bSCAN (?!CONSTANT ROW)(\w+)(?! USING (?:COVERING )?INDEX)(?:\s|$)'),
+    'postgresql': re.compile(r'Seq Scan on (\w+)'),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Har bir API endpoint so'rovi uchun EXPLAIN rejasini chiqarish va "
+        "jadval to'liq o'qilsa (full scan) xato bilan tugash"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--verbose-plans', action='store_true', help="Barcha rejalarni chiqarish")
+
+    def handle(self, *args, **options):
+        pattern = FULL_SCAN_PATTERNS.get(connection.vendor)
+        if pattern is None:
+            raise CommandError(f"{connection.vendor} bazasi qo'llab-quvvatlanmaydi")
+
+        failures = []
+        for name, queryset in self.get_querysets():
+            sql, params = queryset.query.sql_with_params()
+            if name.endswith('[count]'):
+                # Paginator.count() kabi so'rov
+                sql = f"SELECT COUNT(*) FROM ({sql}) subquery"
+            plan = self.explain(sql, params)
+            scans = [table for table in pattern.findall(plan) if not self.reads_first_rows_only(sql, plan)]
+            if options['verbose_plans'] or scans:
+                self.stdout.write(f"{name}\n{queryset.query}\n{plan}\n")
+            if scans:
+                failures.append(f"{name}: {', '.join(sorted(set(scans)))}")
+            else:
+                self.stdout.write(f"OK  {name}")
+
+        if failures:
+            raise CommandError("To'liq skanerlash topildi:\n" + '\n'.join(failures))
+        self.stdout.write(self.style.SUCCESS("Barcha so'rovlar indeksdan foydalanadi"))
+
+    def explain(self, sql, params):
+        with connection.cursor() as cursor:
+            cursor.execute(f"{connection.ops.explain_query_prefix()} {sql}", params)
+            return '\n'.join(' '.join(str(column) for column in row) for row in cursor.fetchall())
+
+    def reads_first_rows_only(self, sql, plan):
+        """Shartsiz, saralanmaydigan LIMIT so'rovi faqat birinchi qatorlarni o'qiydi"""
+        return ' LIMIT ' in sql and ' WHERE ' not in sql and 'TEMP B-TREE' not in plan and 'Sort' not in plan
+
+    def get_querysets(self):
+        factory = APIRequestFactory()
+        for prefix, viewset, _ in router.registry:
+            if getattr(viewset, 'queryset', None) is None:
+                # Modelga bog'lanmagan (yig'ma) endpointlar
+                continue
+            model = viewset.queryset.model
+            cases = [{}]
+            cases += [{field: self.sample_value(model, field)} for field in getattr(viewset, 'filterset_fields', ())]
+            cases += EXTRA_CASES.get(prefix, [])
+            for params in cases:
+                view = self.make_view(factory, viewset, 'list', params)
+                queryset = view.filter_queryset(view.get_queryset())
+                label = f"GET /api/{prefix}/" + (f"?{'&'.join(f'{k}={v}' for k, v in params.items())}" if params else '')
+                yield f"{label} [count]", queryset.order_by().values('pk')
+                yield label, queryset[:view.paginator.page_size if view.paginator else None]
+
+            view = self.make_view(factory, viewset, 'retrieve', {})
+            lookup = view.lookup_url_kwarg or view.lookup_field
+            value = 'x' if view.lookup_field == 'slug' else '1'
+            view.kwargs = {lookup: value}
+            queryset = view.filter_queryset(view.get_queryset()).filter(**{view.lookup_field: value})
+            yield f"GET /api/{prefix}/<{lookup}>/", queryset
+
+    def make_view(self, factory, viewset, action, params):
+        view = viewset()
+        view.action_map = {'get': action}
+        view.args = ()
+        view.kwargs = {}
+        view.format_kwarg = None
+        view.request = view.initialize_request(factory.get('/', params))
+        return view
+
+    def sample_value(self, model, name):
+        field = model._meta.get_field(name)
+        if field.choices:
+            return field.choices[0][0]
+        if isinstance(field, models.BooleanField):
+            return 'false'
+        if isinstance(field, (models.ForeignKey, models.IntegerField)):
+            return '1'
+        return 'x'
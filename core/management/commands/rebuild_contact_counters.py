@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.counters import check_contact_counters, rebuild_contact_counters
+
+
+class Command(BaseCommand):
+    help = "Murojaatlar hisoblagichini (ContactCounter) qayta hisoblash yoki tekshirish"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check', action='store_true',
+            help="Faqat tekshirish: farq bo'lsa xato bilan tugaydi, hech narsa yozilmaydi",
+        )
+
+    def handle(self, *args, **options):
+        if options['check']:
+            mismatches = check_contact_counters()
+            for day, (stored, actual) in sorted(mismatches.items()):
+                self.stdout.write(f"{day}: hisoblagich {stored}, haqiqiy {actual}")
+            if mismatches:
+                raise CommandError(f"{len(mismatches)} kun bo'yicha hisoblagich noto'g'ri")
+            self.stdout.write(self.style.SUCCESS("Hisoblagich to'g'ri"))
+            return
+
+        rebuild_contact_counters()
+        self.stdout.write(self.style.SUCCESS("Hisoblagich qayta hisoblandi"))
@@ -0,0 +1,29 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from core.cache import bump_model_version
+from core.content import backfill_content
+from core.models import ProcessedContentMixin
+
+
+class Command(BaseCommand):
+    help = (
+        "HTML matnlardan clean_html*, plain_text*, excerpt* ustunlari hamda "
+        "o'qish vaqtini qayta hisoblash (asl HTML o'zgarmaydi)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=200)
+
+    def handle(self, *args, **options):
+        for model in apps.get_app_config('core').get_models():
+            if not issubclass(model, ProcessedContentMixin):
+                continue
+            total = backfill_content(
+                model, model.content_field, model.reading_time_field, options['batch_size']
+            )
+            bump_model_version(model)
+            self.stdout.write(f"{model._meta.verbose_name_plural}: {total} ta yozuv")
+        self.stdout.write(self.style.SUCCESS(
+            "Tayyor. Matnlar o'zgargan bo'lsa, rebuild_search_index buyrug'ini ishga tushiring"
+        ))
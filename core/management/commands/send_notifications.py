@@ -0,0 +1,34 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from core.notifications import BATCH_SIZE, dispatch_pending
+from core.utils import telegram_client
+
+
+class Command(BaseCommand):
+    help = "Navbatdagi Telegram bildirishnomalarini yuborish (worker)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help="Navbatni bir marta bo'shatib chiqish")
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+        parser.add_argument('--interval', type=float, default=5, help="Navbat bo'sh bo'lganda kutish (soniya)")
+
+    def handle(self, *args, **options):
+        try:
+            while True:
+                try:
+                    sent, failed = dispatch_pending(options['batch_size'])
+                finally:
+                    close_old_connections()
+                if sent or failed:
+                    self.stdout.write(f"Yuborildi: {sent}, xatolik: {failed}")
+                    if options['verbosity'] > 1:
+                        self.stdout.write(str(telegram_client.snapshot()))
+                if sent + failed < options['batch_size']:
+                    if options['once']:
+                        break
+                    time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.9 on 2026-10-18 18:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_news_category_news_category_ru_news_category_uz_cyrl_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='decision',
+            index=models.Index(fields=['-created_date', '-id'], name='decision_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobvacancy',
+            index=models.Index(fields=['-created_date', '-id'], name='jobvacancy_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(fields=['-created_date', '-id'], name='news_created_id_idx'),
+        ),
+    ]
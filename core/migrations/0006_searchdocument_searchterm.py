@@ -0,0 +1,47 @@
+# Generated by Django 5.2.9 on 2026-10-18 18:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('core', '0005_decision_decision_created_id_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('title', models.CharField(max_length=255)),
+                ('title_ru', models.CharField(blank=True, max_length=255, null=True)),
+                ('title_uz_cyrl', models.CharField(blank=True, max_length=255, null=True)),
+                ('slug', models.SlugField(blank=True, max_length=300)),
+                ('created_date', models.DateTimeField()),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+            ],
+            options={
+                'verbose_name': 'Qidiruv hujjati',
+                'verbose_name_plural': 'Qidiruv hujjatlari',
+                'unique_together': {('content_type', 'object_id')},
+            },
+        ),
+        migrations.CreateModel(
+            name='SearchTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=64)),
+                ('weight', models.PositiveIntegerField(default=1)),
+                ('document', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='terms', to='core.searchdocument')),
+            ],
+            options={
+                'verbose_name': "Qidiruv so'zi",
+                'verbose_name_plural': "Qidiruv so'zlari",
+                'indexes': [models.Index(fields=['term', 'document'], name='search_term_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 5.2.9 on 2026-10-18 18:38
+
+from django.db import migrations, models
+
+from core.utils import build_search_key
+
+SEARCH_KEY_FIELDS = {
+    'usefullink': ('name',),
+    'news': ('title',),
+    'leadership': ('full_name', 'position'),
+    'jobvacancy': ('title',),
+    'interactiveservice': ('title',),
+    'decision': ('title',),
+}
+
+
+def fill_search_keys(apps, schema_editor):
+    for model_name, fields in SEARCH_KEY_FIELDS.items():
+        model = apps.get_model('core', model_name)
+        objects = list(model.objects.all())
+        for obj in objects:
+            obj.search_key = build_search_key(obj, fields)
+        model.objects.bulk_update(objects, ['search_key'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_searchdocument_searchterm'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='decision',
+            name='search_key',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=500),
+        ),
+        migrations.AddField(
+            model_name='interactiveservice',
+            name='search_key',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=500),
+        ),
+        migrations.AddField(
+            model_name='jobvacancy',
+            name='search_key',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=500),
+        ),
+        migrations.AddField(
+            model_name='leadership',
+            name='search_key',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=500),
+        ),
+        migrations.AddField(
+            model_name='news',
+            name='search_key',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=500),
+        ),
+        migrations.AddField(
+            model_name='usefullink',
+            name='search_key',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=500),
+        ),
+        migrations.RunPython(fill_search_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.9 on 2026-10-18 18:42
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_alter_about_created_date_alter_banner_created_date_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Notification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('message', models.TextField(verbose_name='Xabar')),
+                ('status', models.CharField(choices=[('pending', 'Navbatda'), ('sent', 'Yuborilgan'), ('failed', 'Yuborilmadi')], default='pending', max_length=10, verbose_name='Holati')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='Urinishlar soni')),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Keyingi urinish vaqti')),
+                ('last_error', models.TextField(blank=True, verbose_name='Oxirgi xatolik')),
+                ('created_date', models.DateTimeField(auto_now_add=True)),
+                ('sent_date', models.DateTimeField(blank=True, null=True, verbose_name='Yuborilgan vaqti')),
+            ],
+            options={
+                'verbose_name': 'Bildirishnoma',
+                'verbose_name_plural': 'Bildirishnomalar',
+                'ordering': ['-created_date'],
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='notification_due_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-18 18:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_notification'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='group',
+            field=models.CharField(blank=True, max_length=50, verbose_name='Guruh'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.9 on 2026-10-18 18:49
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+from django.db.models.functions import TruncDate
+
+
+def fill_counters(apps, schema_editor):
+    Contact = apps.get_model('core', 'Contact')
+    ContactCounter = apps.get_model('core', 'ContactCounter')
+    rows = (
+        Contact.objects.order_by()
+        .annotate(day=TruncDate('created_date'))
+        .values('day')
+        .annotate(total=Count('pk'), unread=Count('pk', filter=Q(is_read=False)))
+    )
+    ContactCounter.objects.bulk_create([
+        ContactCounter(day=row['day'], total=row['total'], unread=row['unread'])
+        for row in rows
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_notification_group'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContactCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(unique=True, verbose_name='Kun')),
+                ('total', models.IntegerField(default=0, verbose_name='Jami')),
+                ('unread', models.IntegerField(default=0, verbose_name="O'qilmagan")),
+            ],
+            options={
+                'verbose_name': 'Murojaatlar hisoblagichi',
+                'verbose_name_plural': 'Murojaatlar hisoblagichlari',
+                'ordering': ['-day'],
+            },
+        ),
+        migrations.RunPython(fill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,373 @@
+# Generated by Django 5.2.9 on 2026-10-18 18:57
+
+import html
+import math
+import re
+from html.parser import HTMLParser
+from urllib.parse import urlsplit
+
+import django.core.validators
+from django.db import migrations, models
+from django.utils.text import Truncator
+
+# Hosila ustunlarni to'ldirish mantig'i shu migratsiya uchun muzlatilgan
+# (core.content keyinchalik o'zgarsa ham natija o'zgarmaydi). Asl HTML
+# ustunlariga tegilmaydi.
+
+LANGUAGE_SUFFIXES = ('', '_ru', '_uz_cyrl')
+EXCERPT_LENGTH = 200
+READING_SPEED = 200
+MAX_MINUTES_TO_READ = 60
+TAG_RE = re.compile(r'<[^>]*>')
+
+# Model -> (HTML maydoni, o'qish vaqti maydoni)
+CONTENT_FIELDS = {
+    'news': ('content', 'minutes_to_read'),
+    'decision': ('content', None),
+    'jobvacancy': ('description', None),
+    'interactiveservice': ('about', None),
+}
+
+ALLOWED_TAGS = {
+    'a', 'abbr', 'b', 'blockquote', 'br', 'caption', 'code', 'div', 'em', 'figcaption',
+    'figure', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'hr', 'i', 'img', 'li', 'ol', 'p', 'pre',
+    's', 'small', 'span', 'strike', 'strong', 'sub', 'sup', 'table', 'tbody', 'td', 'tfoot',
+    'th', 'thead', 'tr', 'u', 'ul',
+}
+VOID_TAGS = {'br', 'hr', 'img'}
+# Ichidagi matni bilan birga olib tashlanadigan teglar
+DROP_CONTENT_TAGS = {'script', 'style', 'iframe', 'object', 'noscript', 'template', 'textarea'}
+PRESERVE_WHITESPACE_TAGS = {'pre', 'code'}
+
+GLOBAL_ATTRIBUTES = {'class', 'style', 'title', 'dir', 'lang'}
+ALLOWED_ATTRIBUTES = {
+    'a': {'href', 'target', 'rel', 'name'},
+    'img': {'src', 'alt', 'width', 'height'},
+    'td': {'colspan', 'rowspan', 'align'},
+    'th': {'colspan', 'rowspan', 'align', 'scope'},
+    'table': {'border', 'cellpadding', 'cellspacing', 'width'},
+    'ol': {'start', 'type'},
+    'iframe': {'src', 'width', 'height', 'allow', 'allowfullscreen', 'frameborder'},
+}
+# iframe (video, xarita) faqat shu manzillardan qoldiriladi
+EMBED_HOSTS = {
+    'www.youtube.com', 'youtube.com', 'www.youtube-nocookie.com', 'player.vimeo.com',
+    'www.google.com', 'maps.google.com', 'yandex.uz', 'yandex.ru',
+}
+URL_ATTRIBUTES = {'href', 'src'}
+URL_RE = re.compile(r'^(?:https?:|mailto:|tel:|/|#|\.|[^:/?#]*(?:[/?#]|$))', re.IGNORECASE)
+UNSAFE_STYLE_RE = re.compile(r'expression|javascript:|url\s*\(|@import|behavior', re.IGNORECASE)
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+class HTMLSanitizer(HTMLParser):
+    """Ruxsat etilgan teglardan iborat, to'g'ri yopilgan va siqilgan HTML"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.output = []
+        self.open_tags = []
+        self.dropping = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in DROP_CONTENT_TAGS:
+            if tag == 'iframe' and not self.dropping and is_embed(attrs):
+                self.output.append(f'<iframe{self.render_attributes(tag, attrs)}></iframe>')
+            self.dropping += 1
+            return
+        if self.dropping or tag not in ALLOWED_TAGS:
+            return
+        self.output.append(f'<{tag}{self.render_attributes(tag, attrs)}>')
+        if tag not in VOID_TAGS:
+            self.open_tags.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        # <br/> kabi; <p/> va <script/> kabi boshqa teglar tashlab yuboriladi
+        if tag in VOID_TAGS:
+            self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag):
+        if tag in DROP_CONTENT_TAGS:
+            self.dropping = max(self.dropping - 1, 0)
+            return
+        if self.dropping or tag not in self.open_tags:
+            return
+        # Ichida yopilmay qolgan teglar ham yopiladi
+        while self.open_tags:
+            open_tag = self.open_tags.pop()
+            self.output.append(f'</{open_tag}>')
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        if self.dropping:
+            return
+        if not PRESERVE_WHITESPACE_TAGS.intersection(self.open_tags):
+            data = WHITESPACE_RE.sub(' ', data)
+            if data == ' ' and (not self.output or self.output[-1].endswith(' ')):
+                return
+        self.output.append(html.escape(data, quote=False))
+
+    def render_attributes(self, tag, attrs):
+        allowed = GLOBAL_ATTRIBUTES | ALLOWED_ATTRIBUTES.get(tag, set())
+        rendered = []
+        for name, value in attrs:
+            value = (value or '').strip()
+            if name not in allowed:
+                continue
+            if name in URL_ATTRIBUTES and not URL_RE.match(WHITESPACE_RE.sub('', value)):
+                continue
+            if name == 'style' and UNSAFE_STYLE_RE.search(value):
+                continue
+            rendered.append(f' {name}="{html.escape(value)}"')
+        if tag == 'a' and ('target', '_blank') in attrs and not any(name == 'rel' for name, _ in attrs):
+            rendered.append(' rel="noopener noreferrer"')
+        return ''.join(rendered)
+
+    def get_html(self):
+        self.close()
+        return (''.join(self.output) + ''.join(f'</{tag}>' for tag in reversed(self.open_tags))).strip()
+
+
+def is_embed(attrs):
+    """iframe manzili EMBED_HOSTS dan (https yoki //) bo'lsa True"""
+    url = urlsplit(WHITESPACE_RE.sub('', dict(attrs).get('src') or ''))
+    return url.scheme in ('https', '') and url.hostname in EMBED_HOSTS
+
+
+def sanitize_html(value):
+    """Foydalanuvchi kiritgan HTML ni xavfsiz va siqilgan ko'rinishga keltirish"""
+    if not value:
+        return value
+    sanitizer = HTMLSanitizer()
+    sanitizer.feed(value)
+    return sanitizer.get_html()
+
+
+def html_to_text(value):
+    if not value:
+        return ''
+    if value.rfind('<') > value.rfind('>'):
+        value = value[:value.rfind('<')]
+    return ' '.join(html.unescape(TAG_RE.sub(' ', value)).split())
+
+
+def fill_content(apps, schema_editor):
+    for model_name, (field, reading_time_field) in CONTENT_FIELDS.items():
+        model = apps.get_model('core', model_name)
+        fields = [
+            f'{name}{suffix}' for name in ('clean_html', 'plain_text', 'excerpt') for suffix in LANGUAGE_SUFFIXES
+        ] + ([reading_time_field] if reading_time_field else [])
+        batch = []
+        for obj in model.objects.order_by('pk').iterator(chunk_size=200):
+            for suffix in LANGUAGE_SUFFIXES:
+                cleaned = sanitize_html(getattr(obj, f'{field}{suffix}')) or ''
+                text = html_to_text(cleaned)
+                setattr(obj, f'clean_html{suffix}', cleaned)
+                setattr(obj, f'plain_text{suffix}', text)
+                setattr(obj, f'excerpt{suffix}', Truncator(text).chars(EXCERPT_LENGTH))
+            if reading_time_field:
+                words = len(obj.plain_text.split())
+                setattr(obj, reading_time_field, min(max(math.ceil(words / READING_SPEED), 1), MAX_MINUTES_TO_READ))
+            batch.append(obj)
+            if len(batch) >= 200:
+                model.objects.bulk_update(batch, fields)
+                batch = []
+        if batch:
+            model.objects.bulk_update(batch, fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_image_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='decision',
+            name='clean_html',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='decision',
+            name='clean_html_ru',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='decision',
+            name='clean_html_uz_cyrl',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='interactiveservice',
+            name='clean_html',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='interactiveservice',
+            name='clean_html_ru',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='interactiveservice',
+            name='clean_html_uz_cyrl',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='jobvacancy',
+            name='clean_html',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='jobvacancy',
+            name='clean_html_ru',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='jobvacancy',
+            name='clean_html_uz_cyrl',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='news',
+            name='clean_html',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='news',
+            name='clean_html_ru',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='news',
+            name='clean_html_uz_cyrl',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='decision',
+            name='excerpt',
+            field=models.CharField(blank=True, default='', editable=False, max_length=200),
+        ),
+        migrations.AddField(
+            model_name='decision',
+            name='excerpt_ru',
+            field=models.CharField(blank=True, default='', editable=False, max_length=200),
+        ),
+        migrations.AddField(
+            model_name='decision',
+            name='excerpt_uz_cyrl',
+            field=models.CharField(blank=True, default='', editable=False, max_length=200),
+        ),
+        migrations.AddField(
+            model_name='decision',
+            name='plain_text',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='decision',
+            name='plain_text_ru',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='decision',
+            name='plain_text_uz_cyrl',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='interactiveservice',
+            name='excerpt',
+            field=models.CharField(blank=True, default='', editable=False, max_length=200),
+        ),
+        migrations.AddField(
+            model_name='interactiveservice',
+            name='excerpt_ru',
+            field=models.CharField(blank=True, default='', editable=False, max_length=200),
+        ),
+        migrations.AddField(
+            model_name='interactiveservice',
+            name='excerpt_uz_cyrl',
+            field=models.CharField(blank=True, default='', editable=False, max_length=200),
+        ),
+        migrations.AddField(
+            model_name='interactiveservice',
+            name='plain_text',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='interactiveservice',
+            name='plain_text_ru',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='interactiveservice',
+            name='plain_text_uz_cyrl',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='jobvacancy',
+            name='excerpt',
+            field=models.CharField(blank=True, default='', editable=False, max_length=200),
+        ),
+        migrations.AddField(
+            model_name='jobvacancy',
+            name='excerpt_ru',
+            field=models.CharField(blank=True, default='', editable=False, max_length=200),
+        ),
+        migrations.AddField(
+            model_name='jobvacancy',
+            name='excerpt_uz_cyrl',
+            field=models.CharField(blank=True, default='', editable=False, max_length=200),
+        ),
+        migrations.AddField(
+            model_name='jobvacancy',
+            name='plain_text',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='jobvacancy',
+            name='plain_text_ru',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='jobvacancy',
+            name='plain_text_uz_cyrl',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='news',
+            name='excerpt',
+            field=models.CharField(blank=True, default='', editable=False, max_length=200),
+        ),
+        migrations.AddField(
+            model_name='news',
+            name='excerpt_ru',
+            field=models.CharField(blank=True, default='', editable=False, max_length=200),
+        ),
+        migrations.AddField(
+            model_name='news',
+            name='excerpt_uz_cyrl',
+            field=models.CharField(blank=True, default='', editable=False, max_length=200),
+        ),
+        migrations.AddField(
+            model_name='news',
+            name='plain_text',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='news',
+            name='plain_text_ru',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='news',
+            name='plain_text_uz_cyrl',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AlterField(
+            model_name='news',
+            name='minutes_to_read',
+            field=models.PositiveIntegerField(default=5, editable=False, validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(60)], verbose_name="O'qish vaqti (daqiqa)"),
+        ),
+        migrations.RunPython(fill_content, migrations.RunPython.noop),
+    ]
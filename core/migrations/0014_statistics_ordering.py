@@ -0,0 +1,21 @@
+# Generated by Django 5.2.9 on 2026-10-18 18:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_processed_content'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='statistics',
+            options={'ordering': ['-created_date', '-id'], 'verbose_name': 'Statistika', 'verbose_name_plural': "Statistika ma'lumotlari"},
+        ),
+        migrations.AddIndex(
+            model_name='statistics',
+            index=models.Index(fields=['-created_date', '-id'], name='statistics_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,105 @@
+import re
+import unicodedata
+from collections import Counter
+
+from django.db import migrations
+
+# Mavjud yozuvlar uchun qidiruv indeksini (SearchDocument, SearchTerm) to'ldirish:
+# ?search= va /api/search/ shu indeksdan o'qiydi. Indekslash mantig'i shu
+# migratsiya uchun muzlatilgan (core.search va core.utils o'zgarsa ham natija
+# o'zgarmaydi). Indeksda hujjati bor obyektlarga tegilmaydi.
+
+LANGUAGE_SUFFIXES = ('', '_ru', '_uz_cyrl')
+TITLE_WEIGHT = 10
+MAX_TERM_LENGTH = 64
+MAX_TERM_WEIGHT = 1000
+BATCH_SIZE = 500
+
+# Model -> (sarlavha maydoni, matn maydonlari)
+SEARCH_MODELS = {
+    'news': ('title', ('category', 'plain_text')),
+    'decision': ('title', ('plain_text',)),
+    'jobvacancy': ('title', ('location', 'plain_text')),
+    'interactiveservice': ('title', ('plain_text',)),
+}
+
+CYRILLIC_TO_LATIN = {
+    'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'ғ': 'g', 'д': 'd', 'е': 'e', 'ё': 'yo',
+    'ж': 'j', 'з': 'z', 'и': 'i', 'й': 'y', 'к': 'k', 'қ': 'q', 'л': 'l', 'м': 'm',
+    'н': 'n', 'о': 'o', 'ў': 'o', 'п': 'p', 'р': 'r', 'с': 's', 'т': 't', 'у': 'u',
+    'ф': 'f', 'х': 'x', 'ҳ': 'h', 'ц': 's', 'ч': 'ch', 'ш': 'sh', 'щ': 'sh', 'ъ': '',
+    'ы': 'i', 'ь': '', 'э': 'e', 'ю': 'yu', 'я': 'ya',
+}
+APOSTROPHES = "'`´ʹʻʼʽ‘’‛′"
+TRANSLITERATION = str.maketrans({
+    **CYRILLIC_TO_LATIN,
+    **{char: '' for char in APOSTROPHES},
+})
+WORD_RE = re.compile(r'\w+')
+
+
+def tokenize(value):
+    value = (value or '').casefold().translate(TRANSLITERATION)
+    value = ''.join(char for char in unicodedata.normalize('NFKD', value) if not unicodedata.combining(char))
+    return [word[:MAX_TERM_LENGTH] for word in WORD_RE.findall(value)]
+
+
+def build_terms(obj, title_field, body_fields):
+    weights = Counter()
+    for suffix in LANGUAGE_SUFFIXES:
+        for term in tokenize(getattr(obj, f'{title_field}{suffix}', None)):
+            weights[term] += TITLE_WEIGHT
+        for field in body_fields:
+            for term in tokenize(getattr(obj, f'{field}{suffix}', None)):
+                weights[term] += 1
+    return {term: min(weight, MAX_TERM_WEIGHT) for term, weight in weights.items()}
+
+
+def index_batch(SearchDocument, SearchTerm, content_type, title_field, body_fields, objects):
+    documents = SearchDocument.objects.bulk_create([
+        SearchDocument(
+            content_type=content_type, object_id=obj.pk,
+            title=getattr(obj, title_field),
+            title_ru=getattr(obj, f'{title_field}_ru'),
+            title_uz_cyrl=getattr(obj, f'{title_field}_uz_cyrl'),
+            slug=obj.slug, created_date=obj.created_date,
+        )
+        for obj in objects
+    ])
+    SearchTerm.objects.bulk_create([
+        SearchTerm(document=document, term=term, weight=weight)
+        for document, obj in zip(documents, objects)
+        for term, weight in build_terms(obj, title_field, body_fields).items()
+    ], batch_size=2000)
+
+
+def fill_search_index(apps, schema_editor):
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    SearchDocument = apps.get_model('core', 'SearchDocument')
+    SearchTerm = apps.get_model('core', 'SearchTerm')
+    for model_name, (title_field, body_fields) in SEARCH_MODELS.items():
+        model = apps.get_model('core', model_name)
+        content_type, _ = ContentType.objects.get_or_create(app_label='core', model=model_name)
+        indexed = set(SearchDocument.objects.filter(content_type=content_type).values_list('object_id', flat=True))
+        batch = []
+        for obj in model.objects.order_by('pk').iterator(chunk_size=BATCH_SIZE):
+            if obj.pk in indexed:
+                continue
+            batch.append(obj)
+            if len(batch) >= BATCH_SIZE:
+                index_batch(SearchDocument, SearchTerm, content_type, title_field, body_fields, batch)
+                batch = []
+        if batch:
+            index_batch(SearchDocument, SearchTerm, content_type, title_field, body_fields, batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('core', '0014_statistics_ordering'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_search_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.9 on 2026-10-18 19:46
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0015_fill_search_index'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='decision',
+            name='search_key',
+        ),
+        migrations.RemoveField(
+            model_name='interactiveservice',
+            name='search_key',
+        ),
+        migrations.RemoveField(
+            model_name='jobvacancy',
+            name='search_key',
+        ),
+        migrations.RemoveField(
+            model_name='news',
+            name='search_key',
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-18 19:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0016_remove_search_key_from_indexed_models'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='claim_token',
+            field=models.UUIDField(blank=True, db_index=True, editable=False, null=True, verbose_name='Band qilish tokeni'),
+        ),
+    ]
@@ -0,0 +1,208 @@
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.http import HttpResponse
+from django.utils.http import http_date
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+from .cache import cache_metrics, get_model_versions
+from .pagination import KeysetPagination
+from .utils import LANGUAGE_SUFFIXES, get_other_language_fields, get_request_language
+
+
+class TranslatedSerializerMixin:
+    """
+    Kontekstda til berilgan bo'lsa, har bir tarjima maydonidan faqat
+    o'sha tildagi qiymat (bo'lmasa lotincha qiymat) asosiy nom bilan qaytariladi
+    """
+    def get_fields(self):
+        fields = super().get_fields()
+        lang = self.context.get('lang')
+        if not lang:
+            return fields
+        keep = LANGUAGE_SUFFIXES[lang]
+        for name in [name for name in fields if self._is_translated(fields, name)]:
+            for suffix in LANGUAGE_SUFFIXES.values():
+                if suffix and suffix != keep:
+                    fields.pop(f'{name}{suffix}')
+        return fields
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        suffix = LANGUAGE_SUFFIXES.get(self.context.get('lang'))
+        if suffix:
+            for name in [name for name in data if f'{name}{suffix}' in data]:
+                value = data.pop(f'{name}{suffix}')
+                if value:
+                    data[name] = value
+        return data
+
+    @staticmethod
+    def _is_translated(fields, name):
+        return all(
+            f'{name}{suffix}' in fields for suffix in LANGUAGE_SUFFIXES.values() if suffix
+        )
+
+
+class CleanHTMLSerializerMixin:
+    """
+    ProcessedContentMixin modellari uchun: javobda asl HTML (content_field*)
+    o'rniga saqlashda tozalangan clean_html* qiymati qaytariladi, yozish esa
+    asl maydonlarga bo'ladi
+    """
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        for suffix in LANGUAGE_SUFFIXES.values():
+            name = f'{instance.content_field}{suffix}'
+            if name in data:
+                data[name] = getattr(instance, f'clean_html{suffix}')
+        return data
+
+
+class LanguageMixin:
+    """
+    ?lang= parametri bilan o'qish: faqat tanlangan til ustunlari bazadan olinadi
+    va serializer faqat shu tildagi qiymatlarni qaytaradi
+    """
+    def get_language(self):
+        if self.action in ['list', 'retrieve']:
+            return get_request_language(self.request)
+        return None
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        lang = self.get_language()
+        if lang:
+            queryset = queryset.defer(*get_other_language_fields(queryset.model, lang))
+        return queryset
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['lang'] = self.get_language()
+        return context
+
+
+class NotModified(Exception):
+    def __init__(self, response):
+        self.response = response
+
+
+class ConditionalGetMixin:
+    """
+    conditional_actions (odatda list va retrieve) javoblariga ETag va Last-Modified qo'shish.
+    If-None-Match / If-Modified-Since mos kelsa, so'rov serializatsiyadan oldin 304 bilan tugaydi.
+
+    Validatorlar cache_models versiyalaridan (bazaga murojaatsiz) olinadi;
+    versiyasi yuritilmaydigan modellar uchun Max('updated_date') va qatorlar soni ishlatiladi.
+    """
+    cache_models = None
+    conditional_actions = ('list', 'retrieve')
+
+    def get_cache_models(self):
+        if self.cache_models is not None:
+            return self.cache_models
+        from .signals import CACHED_MODELS
+        model = self.queryset.model
+        return (model,) if model in CACHED_MODELS else ()
+
+    def get_validators(self):
+        models = self.get_cache_models()
+        if models:
+            versions = get_model_versions(models)
+            token = '.'.join(str(version) for version in versions)
+            last_modified = max(versions) // 1000
+        else:
+            queryset = self.filter_queryset(self.get_queryset())
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            if lookup_url_kwarg in self.kwargs:
+                queryset = queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+            stats = queryset.order_by().aggregate(last=Max('updated_date'), count=Count('pk'))
+            token = f"{stats['last']}.{stats['count']}"
+            last_modified = int(stats['last'].timestamp()) if stats['last'] else None
+        renderer = getattr(self.request, 'accepted_renderer', None)
+        source = f"{token}:{self.request.get_full_path()}:{getattr(renderer, 'format', '')}"
+        return f'"{hashlib.md5(source.encode()).hexdigest()}"', last_modified
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.validators = None
+        if self.action in self.conditional_actions and request.method in ('GET', 'HEAD'):
+            self.validators = self.get_validators()
+            etag, last_modified = self.validators
+            not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if not_modified is not None:
+                raise NotModified(not_modified)
+
+    def handle_exception(self, exc):
+        if isinstance(exc, NotModified):
+            return exc.response
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if getattr(self, 'validators', None) and response.status_code in (200, 304):
+            if hasattr(response, 'add_post_render_callback'):
+                # cache_page sarlavhalarni render'dan keyin qo'yadi, biz ulardan keyin ishlaymiz
+                response.add_post_render_callback(self.set_validator_headers)
+            else:
+                self.set_validator_headers(response)
+        return response
+
+    def set_validator_headers(self, response):
+        etag, last_modified = self.validators
+        response['ETag'] = etag
+        if last_modified:
+            response['Last-Modified'] = http_date(last_modified)
+        # Mijoz har safar tekshirib olishi kerak (odatda 304 bilan)
+        if 'Expires' in response:
+            del response['Expires']
+        response['Cache-Control'] = 'private, no-cache' if self.request.user.is_authenticated else 'no-cache'
+
+
+class KeysetPaginationMixin:
+    """
+    ?pagination=cursor (yoki ?cursor=...) berilganda sahifa raqami o'rniga
+    keyset paginatsiyadan foydalanish
+    """
+    keyset_pagination_class = KeysetPagination
+
+    @property
+    def paginator(self):
+        if not hasattr(self, '_paginator'):
+            params = self.request.query_params if self.request is not None else {}
+            if params.get('pagination') == 'cursor' or 'cursor' in params:
+                self._paginator = self.keyset_pagination_class()
+            else:
+                self._paginator = super().paginator
+        return self._paginator
+
+
+class SingletonListMixin:
+    """
+    list javobi bitta obyekt (get_singleton(), bo'lmasa {}). JSON javob baytlari
+    singleton_cache (SingletonCache) da til bo'yicha saqlanadi, shuning uchun
+    takroriy so'rovlar bazaga ham, serializerga ham murojaat qilmaydi
+    """
+    singleton_cache = None
+
+    def get_singleton(self):
+        raise NotImplementedError
+
+    def serialize_singleton(self):
+        instance = self.get_singleton()
+        return self.get_serializer(instance).data if instance is not None else {}
+
+    def list(self, request, *args, **kwargs):
+        if not isinstance(request.accepted_renderer, JSONRenderer):
+            # Brauzer uchun API sahifasi keshlanmaydi
+            return Response(self.serialize_singleton())
+        content, hit = self.singleton_cache.get(
+            self.get_language(), lambda: JSONRenderer().render(self.serialize_singleton())
+        )
+        endpoint = getattr(request.resolver_match, 'view_name', None) or request.path
+        cache_metrics.record(endpoint, hit=hit)
+        response = HttpResponse(content, content_type='application/json')
+        response['X-Cache'] = 'HIT' if hit else 'MISS'
+        return response
@@ -6,20 +6,101 @@ from ckeditor.fields import RichTextField  # O'ZGARTIRILDI: tinymce -> ckeditor
 from ckeditor_uploader.fields import RichTextUploadingField  # YANGI: Rasm yuklash uchun
 from hitcount.models import HitCountMixin, HitCount
 from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import DateField, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Trunc
+
+from .content import process_content
+from .utils import EXCERPT_LENGTH, LANGUAGE_SUFFIXES, build_search_key
 
 class BaseModel(models.Model):
-    created_date = models.DateTimeField(auto_now_add=True)
+    created_date = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_date = models.DateTimeField(auto_now=True)
     
     class Meta:
         abstract = True
 
+
+class SearchKeyMixin(models.Model):
+    """
+    Barcha tillardagi nom maydonlaridan saqlashda tuziladigan normallashtirilgan
+    qidiruv kaliti (kirill/lotin, tutuq belgilari va diakritikalarsiz).
+    Faqat kichik ma'lumotnoma jadvallari uchun; yangiliklar, qarorlar kabi
+    katta jadvallar qidiruv indeksida (core.search)
+    """
+    search_key_fields = ('title',)
+    
+    search_key = models.CharField(max_length=500, blank=True, editable=False, db_index=True)
+    
+    class Meta:
+        abstract = True
+    
+    def save(self, *args, **kwargs):
+        self.search_key = build_search_key(self, self.search_key_fields)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'search_key'}
+        super().save(*args, **kwargs)
+
+
+class ProcessedContentMixin(models.Model):
+    """
+    Saqlashda content_field HTML matnlaridan har bir til uchun tozalangan HTML,
+    oddiy matn va qisqa matn ustunlarini tayyorlash (content.py)
+    """
+    content_field = 'content'
+    # O'qish vaqti yoziladigan maydon (bo'lsa)
+    reading_time_field = None
+    
+    clean_html = models.TextField(blank=True, default='', editable=False)
+    clean_html_ru = models.TextField(blank=True, default='', editable=False)
+    clean_html_uz_cyrl = models.TextField(blank=True, default='', editable=False)
+    plain_text = models.TextField(blank=True, default='', editable=False)
+    plain_text_ru = models.TextField(blank=True, default='', editable=False)
+    plain_text_uz_cyrl = models.TextField(blank=True, default='', editable=False)
+    excerpt = models.CharField(max_length=EXCERPT_LENGTH, blank=True, default='', editable=False)
+    excerpt_ru = models.CharField(max_length=EXCERPT_LENGTH, blank=True, default='', editable=False)
+    excerpt_uz_cyrl = models.CharField(max_length=EXCERPT_LENGTH, blank=True, default='', editable=False)
+    
+    class Meta:
+        abstract = True
+    
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        content_fields = {f'{self.content_field}{suffix}' for suffix in LANGUAGE_SUFFIXES.values()}
+        if update_fields is None or content_fields.intersection(update_fields):
+            changed = process_content(self, self.content_field, self.reading_time_field)
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, *changed}
+        super().save(*args, **kwargs)
+
+
+class ContentQuerySet(models.QuerySet):
+    def without_content(self, field):
+        """Og'ir matn ustunlarini o'qimaslik (ro'yxatda tayyor excerpt* ustunlari ishlatiladi)"""
+        return self.defer(*(
+            f'{name}{suffix}'
+            for name in (field, 'clean_html', 'plain_text') for suffix in LANGUAGE_SUFFIXES.values()
+        ))
+
+
+class ViewsCountQuerySet(ContentQuerySet):
+    def with_views_count(self):
+        """Ko'rishlar sonini bitta so'rovda qo'shib olish (har bir qator uchun alohida COUNT o'rniga)"""
+        hits = HitCount.objects.filter(
+            content_type=ContentType.objects.get_for_model(self.model),
+            object_pk=OuterRef('pk'),
+        ).order_by().values('hits')[:1]
+        return self.annotate(views_total=Coalesce(Subquery(hits), 0))
+
 # 1. Banner modeli
 class Banner(BaseModel):
     title = models.CharField(max_length=255, verbose_name="Sarlavha")
     title_ru = models.CharField(max_length=255, verbose_name="Заголовок", blank=True, null=True)
     title_uz_cyrl = models.CharField(max_length=255, verbose_name="Сарлавҳа (Кирилл)", blank=True, null=True)
     image = models.ImageField(upload_to='banners/', verbose_name="Rasm")
+    # Kichraytirilgan nusxalar (images.py): {'source': ..., 'webp': {kenglik: yo'l}, 'jpeg': {...}}
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     
     class Meta:
         verbose_name = "Banner"
@@ -38,26 +119,57 @@ class Banner(BaseModel):
         return self.title
 
 # 2. Statistics modeli
+class StatisticsQuerySet(models.QuerySet):
+    def current(self):
+        """Eng oxirgi statistika (indeks bo'yicha bitta qator)"""
+        return self.order_by('-created_date', '-id').first()
+    
+    def history(self, bucket, limit):
+        """
+        Har bir davr (day, month, year) uchun shu davrdagi oxirgi statistika,
+        eng yangi limit ta davr, vaqt bo'yicha o'sish tartibida
+        """
+        period = Trunc('created_date', bucket, output_field=DateField())
+        last_ids = list(
+            self.order_by()
+            .values(period=period)
+            .annotate(last_id=Max('id'))
+            .order_by('-period')
+            .values_list('last_id', flat=True)[:limit]
+        )
+        return self.filter(pk__in=last_ids).annotate(period=period).order_by('created_date', 'id')
+
+
 class Statistics(BaseModel):
     korsatilayotgan_xizmatlar = models.IntegerField(verbose_name="Ko'rsatilayotgan xizmatlar soni", default=0)
     hududiy_boshqarmalar_soni = models.IntegerField(verbose_name="Hududiy boshqarmalar soni", default=0)
     nasos_stansiyalar_soni = models.IntegerField(verbose_name="Nasos stansiyalari soni", default=0)
     xodimlar = models.IntegerField(verbose_name="Xodimlar soni", default=0)
     
+    objects = StatisticsQuerySet.as_manager()
+    
     class Meta:
         verbose_name = "Statistika"
         verbose_name_plural = "Statistika ma'lumotlari"
+        ordering = ['-created_date', '-id']
+        indexes = [
+            # Joriy statistika (StatisticsQuerySet.current) uchun
+            models.Index(fields=['-created_date', '-id'], name='statistics_created_id_idx'),
+        ]
     
     def __str__(self):
         return f"Statistika: {self.created_date.strftime('%d.%m.%Y')}"
 
 # 3. Useful Links modeli
-class UsefulLink(BaseModel):
+class UsefulLink(SearchKeyMixin, BaseModel):
+    search_key_fields = ('name',)
+    
     name = models.CharField(max_length=255, verbose_name="Nomi")
     name_ru = models.CharField(max_length=255, verbose_name="Название", blank=True, null=True)
     name_uz_cyrl = models.CharField(max_length=255, verbose_name="Номи (Кирилл)", blank=True, null=True)
     link = models.URLField(verbose_name="Havola")
     icon = models.ImageField(upload_to='links_icons/', verbose_name="Ikona")
+    icon_variants = models.JSONField(default=dict, blank=True, editable=False)
     
     class Meta:
         verbose_name = "Foydali havola"
@@ -68,11 +180,14 @@ class UsefulLink(BaseModel):
         return self.name
 
 # 4. News modeli
-class News(BaseModel, HitCountMixin):
+class News(ProcessedContentMixin, BaseModel, HitCountMixin):
+    reading_time_field = 'minutes_to_read'
+    
     title = models.CharField(max_length=255, verbose_name="Sarlavha")
     title_ru = models.CharField(max_length=255, verbose_name="Заголовок", blank=True, null=True)
     title_uz_cyrl = models.CharField(max_length=255, verbose_name="Сарлавҳа (Кирилл)", blank=True, null=True)
     main_image = models.ImageField(upload_to='news/', verbose_name="Asosiy rasm")
+    main_image_variants = models.JSONField(default=dict, blank=True, editable=False)
     
     # YANGI: Category field qo'shildi (varchar)
     category = models.CharField(
@@ -94,10 +209,11 @@ class News(BaseModel, HitCountMixin):
         null=True
     )
     
-    # YANGI: O'qish vaqti (daqiqalarda)
+    # YANGI: O'qish vaqti (daqiqalarda), matndan saqlashda hisoblanadi
     minutes_to_read = models.PositiveIntegerField(
         verbose_name="O'qish vaqti (daqiqa)",
         default=5,
+        editable=False,
         validators=[MinValueValidator(1), MaxValueValidator(60)]
     )
     
@@ -108,10 +224,17 @@ class News(BaseModel, HitCountMixin):
     slug = models.SlugField(max_length=300, unique=True, blank=True)
     views_count = GenericRelation(HitCount, object_id_field='object_pk')
     
+    objects = ViewsCountQuerySet.as_manager()
+    
     class Meta:
         verbose_name = "Yangilik"
         verbose_name_plural = "Yangiliklar"
         ordering = ['-created_date']
+        indexes = [
+            # Keyset paginatsiya uchun (pagination.KeysetPagination)
+            models.Index(fields=['-created_date', '-id'], name='news_created_id_idx'),
+            models.Index(fields=['category', '-created_date'], name='news_category_created_idx'),
+        ]
     
     def __str__(self):
         return self.title
@@ -122,7 +245,9 @@ class News(BaseModel, HitCountMixin):
         super().save(*args, **kwargs)
     
     def get_views_count(self):
-        return self.views_count.count()
+        if hasattr(self, 'views_total'):
+            return self.views_total
+        return self.views_count.aggregate(total=models.Sum('hits'))['total'] or 0
     
     def get_translated_title(self, language_code='uz'):
         """Til bo'yicha tarjima qilingan sarlavha"""
@@ -230,7 +355,9 @@ class About(BaseModel):
         return hudud_map.get(self.hudud, self.hudud)
 
 # 6. Leadership modeli
-class Leadership(BaseModel):
+class Leadership(SearchKeyMixin, BaseModel):
+    search_key_fields = ('full_name', 'position')
+    
     full_name = models.CharField(max_length=255, verbose_name="To'liq ism")
     full_name_ru = models.CharField(max_length=255, verbose_name="Полное имя", blank=True, null=True)
     full_name_uz_cyrl = models.CharField(max_length=255, verbose_name="Тўлиқ исм (Кирилл)", blank=True, null=True)
@@ -241,6 +368,7 @@ class Leadership(BaseModel):
     
     # YANGI: Rasm maydoni qo'shildi
     image = models.ImageField(upload_to='leadership/', verbose_name="Rasm", blank=True, null=True)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     
     reception_time = models.CharField(max_length=255, verbose_name="Qabul vaqtlari")
     reception_time_ru = models.CharField(max_length=255, verbose_name="Время приема", blank=True, null=True)
@@ -297,7 +425,9 @@ class TypeOfWork(BaseModel):
         return self.title
 
 # 9. Job Vacancy modeli
-class JobVacancy(BaseModel):
+class JobVacancy(ProcessedContentMixin, BaseModel):
+    content_field = 'description'
+    
     title = models.CharField(max_length=255, verbose_name="Sarlavha")
     title_ru = models.CharField(max_length=255, verbose_name="Заголовок", blank=True, null=True)
     title_uz_cyrl = models.CharField(max_length=255, verbose_name="Сарлавҳа (Кирилл)", blank=True, null=True)
@@ -330,10 +460,16 @@ class JobVacancy(BaseModel):
     
     slug = models.SlugField(max_length=300, unique=True, blank=True)
     
+    objects = ContentQuerySet.as_manager()
+    
     class Meta:
         verbose_name = "Ish o'rini"
         verbose_name_plural = "Ish o'rinlari"
         ordering = ['-created_date']
+        indexes = [
+            # Keyset paginatsiya uchun (pagination.KeysetPagination)
+            models.Index(fields=['-created_date', '-id'], name='jobvacancy_created_id_idx'),
+        ]
     
     def __str__(self):
         return self.title
@@ -344,7 +480,9 @@ class JobVacancy(BaseModel):
         super().save(*args, **kwargs)
 
 # 10. Interactive Service modeli
-class InteractiveService(BaseModel, HitCountMixin):
+class InteractiveService(ProcessedContentMixin, BaseModel, HitCountMixin):
+    content_field = 'about'
+    
     title = models.CharField(max_length=255, verbose_name="Sarlavha")
     title_ru = models.CharField(max_length=255, verbose_name="Заголовок", blank=True, null=True)
     title_uz_cyrl = models.CharField(max_length=255, verbose_name="Сарлавҳа (Кирилл)", blank=True, null=True)
@@ -356,6 +494,8 @@ class InteractiveService(BaseModel, HitCountMixin):
     slug = models.SlugField(max_length=300, unique=True, blank=True)
     views_count = GenericRelation(HitCount, object_id_field='object_pk')
     
+    objects = ViewsCountQuerySet.as_manager()
+    
     class Meta:
         verbose_name = "Interaktiv xizmat"
         verbose_name_plural = "Interaktiv xizmatlar"
@@ -370,10 +510,12 @@ class InteractiveService(BaseModel, HitCountMixin):
         super().save(*args, **kwargs)
     
     def get_views_count(self):
-        return self.views_count.count()
+        if hasattr(self, 'views_total'):
+            return self.views_total
+        return self.views_count.aggregate(total=models.Sum('hits'))['total'] or 0
 
 # 11. Decision modeli
-class Decision(BaseModel, HitCountMixin):
+class Decision(ProcessedContentMixin, BaseModel, HitCountMixin):
     title = models.CharField(max_length=255, verbose_name="Sarlavha")
     title_ru = models.CharField(max_length=255, verbose_name="Заголовок", blank=True, null=True)
     title_uz_cyrl = models.CharField(max_length=255, verbose_name="Сарлавҳа (Кирилл)", blank=True, null=True)
@@ -385,10 +527,16 @@ class Decision(BaseModel, HitCountMixin):
     slug = models.SlugField(max_length=300, unique=True, blank=True)
     views_count = GenericRelation(HitCount, object_id_field='object_pk')
     
+    objects = ViewsCountQuerySet.as_manager()
+    
     class Meta:
         verbose_name = "Qaror"
         verbose_name_plural = "Qarorlar"
         ordering = ['-created_date']
+        indexes = [
+            # Keyset paginatsiya uchun (pagination.KeysetPagination)
+            models.Index(fields=['-created_date', '-id'], name='decision_created_id_idx'),
+        ]
     
     def __str__(self):
         return self.title
@@ -399,7 +547,9 @@ class Decision(BaseModel, HitCountMixin):
         super().save(*args, **kwargs)
     
     def get_views_count(self):
-        return self.views_count.count()
+        if hasattr(self, 'views_total'):
+            return self.views_total
+        return self.views_count.aggregate(total=models.Sum('hits'))['total'] or 0
 
 # 12. Contact modeli
 class Contact(BaseModel):
@@ -413,6 +563,97 @@ class Contact(BaseModel):
         verbose_name = "Murojaat"
         verbose_name_plural = "Murojaatlar"
         ordering = ['-created_date']
+        indexes = [
+            # Admin va API da o'qilmaganlar ro'yxati uchun
+            models.Index(fields=['is_read', '-created_date'], name='contact_read_created_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.full_name} - {self.created_date.strftime('%d.%m.%Y')}"
+
+# 13. Qidiruv indeksi (core.search)
+class SearchDocument(models.Model):
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveBigIntegerField()
+    title = models.CharField(max_length=255)
+    title_ru = models.CharField(max_length=255, blank=True, null=True)
+    title_uz_cyrl = models.CharField(max_length=255, blank=True, null=True)
+    slug = models.SlugField(max_length=300, blank=True)
+    created_date = models.DateTimeField()
+    
+    class Meta:
+        verbose_name = "Qidiruv hujjati"
+        verbose_name_plural = "Qidiruv hujjatlari"
+        unique_together = ('content_type', 'object_id')
+    
+    def __str__(self):
+        return self.title
+
+
+class SearchTerm(models.Model):
+    document = models.ForeignKey(SearchDocument, on_delete=models.CASCADE, related_name='terms')
+    term = models.CharField(max_length=64)
+    weight = models.PositiveIntegerField(default=1)
+    
+    class Meta:
+        verbose_name = "Qidiruv so'zi"
+        verbose_name_plural = "Qidiruv so'zlari"
+        indexes = [
+            models.Index(fields=['term', 'document'], name='search_term_idx'),
+        ]
+    
+    def __str__(self):
+        return self.term
+
+
+# 14. Bildirishnomalar navbati (core.notifications)
+class Notification(models.Model):
+    STATUS_PENDING = 'pending'
+    STATUS_SENT = 'sent'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Navbatda"),
+        (STATUS_SENT, "Yuborilgan"),
+        (STATUS_FAILED, "Yuborilmadi"),
+    ]
+    
+    message = models.TextField(verbose_name="Xabar")
+    # Bir guruhdagi xabarlar digest bo'lib birlashtiriladi (masalan 'contact')
+    group = models.CharField(max_length=50, blank=True, verbose_name="Guruh")
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING, verbose_name="Holati")
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name="Urinishlar soni")
+    next_attempt_at = models.DateTimeField(default=timezone.now, verbose_name="Keyingi urinish vaqti")
+    # Xabarni oxirgi band qilgan worker partiyasi (notifications.claim_batch)
+    claim_token = models.UUIDField(blank=True, null=True, db_index=True, editable=False, verbose_name="Band qilish tokeni")
+    last_error = models.TextField(blank=True, verbose_name="Oxirgi xatolik")
+    created_date = models.DateTimeField(auto_now_add=True)
+    sent_date = models.DateTimeField(blank=True, null=True, verbose_name="Yuborilgan vaqti")
+    
+    class Meta:
+        verbose_name = "Bildirishnoma"
+        verbose_name_plural = "Bildirishnomalar"
+        ordering = ['-created_date']
+        indexes = [
+            # Navbatdagi xabarlarni olish uchun (notifications.dispatch_pending)
+            models.Index(fields=['status', 'next_attempt_at'], name='notification_due_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.get_status_display()} - {self.created_date.strftime('%d.%m.%Y %H:%M')}"
+
+
+# 15. Murojaatlar hisoblagichi (core.counters)
+class ContactCounter(models.Model):
+    """Kunlik murojaatlar soni; har bir o'zgarishda bazani sanamasdan yangilanadi"""
+    day = models.DateField(unique=True, verbose_name="Kun")
+    total = models.IntegerField(default=0, verbose_name="Jami")
+    unread = models.IntegerField(default=0, verbose_name="O'qilmagan")
+    
+    class Meta:
+        verbose_name = "Murojaatlar hisoblagichi"
+        verbose_name_plural = "Murojaatlar hisoblagichlari"
+        ordering = ['-day']
     
     def __str__(self):
-        return f"{self.full_name} - {self.created_date.strftime('%d.%m.%Y')}"
\ No newline at end of file
+        return f"{self.day}: {self.unread}/{self.total}"
+
@@ -0,0 +1,226 @@
+"""
+Telegram bildirishnomalari navbati (outbox).
+
+Xabar so'rov ichida asosiy yozuv bilan bitta tranzaksiyada Notification
+jadvaliga yoziladi, shuning uchun so'rov Telegramni kutmaydi va xabar
+yo'qolmaydi. send_notifications buyrug'i (worker) navbatni partiyalab
+yuboradi, xatolikda esa eksponensial kutish bilan qayta urinadi.
+
+Bir guruhdagi (masalan murojaatlar) xabarlar TELEGRAM_DIGEST_WINDOW soniyalik
+oynaga yig'ilib, bitta umumiy xabar (digest) sifatida yuboriladi. Har bir chat
+uchun TELEGRAM_RATE_LIMIT token bucket cheklovi qo'llaniladi.
+"""
+import html
+import logging
+import random
+import uuid
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.db.models import F, Q
+from django.utils import timezone
+from django.utils.text import Truncator
+
+from .models import Notification
+from .ratelimit import TokenBucket
+from .utils import CircuitOpen, post_telegram_message
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 20
+MAX_ATTEMPTS = 8
+RETRY_BASE_DELAY = 30  # soniya, har urinishda ikki barobar oshadi
+MAX_RETRY_DELAY = 3600
+# Worker olgan xabar shu vaqt ichida yuborilmasa, boshqa worker qayta oladi;
+# ijara har bir xabarni yuborishdan oldin yangilanadi (renew_lease)
+LEASE_TIMEOUT = 120
+# Digest dagi har bir yozuvning maksimal uzunligi (Telegram chegarasi 4096)
+DIGEST_ENTRY_LENGTH = 600
+
+# Guruh -> (bitta xabar sarlavhasi, digest sarlavhasi)
+GROUP_TITLES = {
+    'contact': ("📩 Yangi murojaat!", "📩 Yangi murojaatlar: {count} ta"),
+}
+
+
+def digest_window():
+    return getattr(settings, 'TELEGRAM_DIGEST_WINDOW', 0)
+
+
+def window_end(now, window):
+    """now tushgan window soniyalik oynaning oxiri (bir oynadagilar birga yuboriladi)"""
+    timestamp = (int(now.timestamp()) // window + 1) * window
+    return datetime.fromtimestamp(timestamp, tz=dt_timezone.utc)
+
+
+def enqueue(message, group=''):
+    """Xabarni yuborish navbatiga qo'yish (joriy tranzaksiya ichida)"""
+    notification = Notification(message=message, group=group)
+    window = digest_window()
+    if group and window:
+        notification.next_attempt_at = window_end(timezone.now(), window)
+    notification.save()
+    return notification
+
+
+def format_contact_message(contact):
+    """Yangi murojaat haqida xabar matni (sarlavha yuborishda qo'shiladi)"""
+    # Telegram xabari parse_mode=HTML bilan yuboriladi
+    return (
+        f"👤 Ism: {html.escape(contact.full_name)}\n"
+        f"📞 Telefon: {html.escape(contact.phone_number)}\n"
+        f"📧 Email: {html.escape(contact.email)}\n"
+        f"✉️ Xabar: {html.escape(contact.message)}\n"
+        f"⏰ Vaqt: {contact.created_date.strftime('%d.%m.%Y %H:%M')}"
+    )
+
+
+def retry_delay(attempts):
+    """attempts-urinishdan keyingi kutish vaqti (tasodifiy ±20% bilan)"""
+    delay = min(RETRY_BASE_DELAY * 2 ** (attempts - 1), MAX_RETRY_DELAY)
+    return timedelta(seconds=delay * random.uniform(0.8, 1.2))
+
+
+def claim_batch(batch_size, now):
+    """
+    Vaqti kelgan xabarlarni band qilish: bitta UPDATE next_attempt_at ni
+    oldinga suradi va partiya tokenini yozadi, so'ng xabarlar shu token bo'yicha
+    olinadi. UPDATE muddat shartini qayta tekshiradi, shuning uchun bir nechta
+    worker bir xabarni ikki marta yubormaydi
+    """
+    due = Notification.objects.filter(status=Notification.STATUS_PENDING, next_attempt_at__lte=now)
+    rows = list(due.order_by('next_attempt_at', 'pk').values_list('pk', 'group')[:batch_size])
+    if not rows:
+        return []
+    condition = Q(pk__in=[pk for pk, _ in rows])
+    groups = {group for _, group in rows if group}
+    if groups and digest_window():
+        # Digest guruhning navbatdagi barcha xabarlarini (haqiqiy soni bilan)
+        # bitta xabarga yig'adi, partiya hajmi bilan cheklanmaydi
+        condition |= Q(group__in=groups)
+    token = uuid.uuid4()
+    lease_until = now + timedelta(seconds=LEASE_TIMEOUT)
+    if not due.filter(condition).update(next_attempt_at=lease_until, claim_token=token):
+        return []
+    return list(Notification.objects.filter(claim_token=token).order_by('pk'))
+
+
+def renew_lease(notifications):
+    """
+    Yuborishdan oldin xabarlar ijarasini bitta UPDATE bilan yangilash: partiyadagi
+    oldingi xabarlar uzoq yuborilgan bo'lsa ham ijara shu xabarni yuborish
+    vaqtini qoplaydi. Ijarasi tugab, boshqa worker olib ulgurgan (tokeni
+    almashgan) xabarlar ro'yxatdan chiqariladi
+    """
+    token = notifications[0].claim_token
+    pks = [notification.pk for notification in notifications]
+    lease_until = timezone.now() + timedelta(seconds=LEASE_TIMEOUT)
+    held = Notification.objects.filter(pk__in=pks, status=Notification.STATUS_PENDING, claim_token=token)
+    renewed = held.update(next_attempt_at=lease_until)
+    if renewed < len(notifications):
+        kept = set(held.values_list('pk', flat=True))
+        notifications = [notification for notification in notifications if notification.pk in kept]
+    for notification in notifications:
+        notification.next_attempt_at = lease_until
+    return notifications
+
+
+def render_message(notifications):
+    """Bitta xabar yoki bir guruh uchun umumiy xabar matni"""
+    group = notifications[0].group
+    title, digest_title = GROUP_TITLES.get(group, ('', "{count} ta xabar"))
+    if len(notifications) == 1:
+        message = notifications[0].message
+        return f"{title}\n\n{message}" if title else message
+    
+    size = getattr(settings, 'TELEGRAM_DIGEST_SIZE', 5)
+    entries = [
+        f"{i}. {Truncator(notification.message).chars(DIGEST_ENTRY_LENGTH, html=True)}"
+        for i, notification in enumerate(notifications[:size], 1)
+    ]
+    if len(notifications) > size:
+        entries.append(f"... va yana {len(notifications) - size} ta")
+    return digest_title.format(count=len(notifications)) + "\n\n" + "\n\n".join(entries)
+
+
+def group_batch(batch):
+    """Digest yoqilgan bo'lsa, bir guruhdagi xabarlarni birlashtirish"""
+    groups = {}
+    for notification in batch:
+        key = notification.group if notification.group and digest_window() else notification.pk
+        groups.setdefault(key, []).append(notification)
+    return list(groups.values())
+
+
+def get_rate_limiter():
+    """Telegram chat uchun token bucket"""
+    return TokenBucket(
+        f'telegram:{settings.TELEGRAM_CHAT_ID}',
+        getattr(settings, 'TELEGRAM_RATE_LIMIT', '20/min'),
+        getattr(settings, 'TELEGRAM_RATE_BURST', None),
+    )
+
+
+def deliver(notifications):
+    """
+    Xabar(lar)ni bitta Telegram xabari sifatida yuborish va natijasini saqlash.
+    Circuit ochiq bo'lsa CircuitOpen ko'tariladi va xabarlar o'zgarmaydi
+    """
+    now = timezone.now()
+    try:
+        post_telegram_message(render_message(notifications))
+    except CircuitOpen:
+        raise
+    except Exception as e:
+        for notification in notifications:
+            notification.attempts += 1
+            notification.last_error = str(e)[:1000]
+            if notification.attempts >= MAX_ATTEMPTS:
+                notification.status = Notification.STATUS_FAILED
+                logger.error(f"Bildirishnoma #{notification.pk} yuborilmadi: {e}")
+            else:
+                notification.next_attempt_at = now + retry_delay(notification.attempts)
+            notification.save(update_fields=['attempts', 'last_error', 'status', 'next_attempt_at'])
+        return False
+    
+    Notification.objects.filter(pk__in=[notification.pk for notification in notifications]).update(
+        status=Notification.STATUS_SENT, sent_date=now, last_error='', attempts=F('attempts') + 1
+    )
+    return True
+
+
+def release(notifications, delay):
+    """Band qilingan xabarlarni urinish hisoblamasdan keyinroqqa qoldirish"""
+    Notification.objects.filter(pk__in=[notification.pk for notification in notifications]).update(
+        next_attempt_at=timezone.now() + timedelta(seconds=delay)
+    )
+
+
+def dispatch_pending(batch_size=BATCH_SIZE):
+    """Navbatdagi bir partiya xabarni yuborish, (yuborilgan, xato) xabarlar sonini qaytaradi"""
+    sent = failed = 0
+    groups = group_batch(claim_batch(batch_size, timezone.now()))
+    limiter = get_rate_limiter()
+    for i, notifications in enumerate(groups):
+        notifications = renew_lease(notifications)
+        if not notifications:
+            continue
+        remaining = notifications + [notification for group in groups[i + 1:] for notification in group]
+        allowed, wait = limiter.consume()
+        if not allowed:
+            # Chat cheklovi: qolganlari keyingi safar (ehtimol bitta digest bo'lib) yuboriladi
+            release(remaining, wait)
+            break
+        try:
+            delivered = deliver(notifications)
+        except CircuitOpen as e:
+            # Telegram ishlamayapti: urinish hisoblanmaydi, qolganlari circuit
+            # qayta ochilganda yuboriladi
+            release(remaining, e.retry_after)
+            logger.warning(str(e))
+            break
+        if delivered:
+            sent += len(notifications)
+        else:
+            failed += len(notifications)
+    return sent, failed
@@ -0,0 +1,87 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    (created_date, id) bo'yicha keyset (cursor) paginatsiya.
+
+    COUNT(*) va OFFSET ishlatilmaydi: har bir sahifa oldingi sahifaning oxirgi
+    qatoridan keyingi yozuvlarni indeks orqali oladi, shuning uchun chuqur
+    sahifalar ham birinchi sahifadek tez. Faqat oldinga (next) yurish mumkin.
+    """
+    cursor_query_param = 'cursor'
+    page_size = api_settings.PAGE_SIZE
+    ordering = ('-created_date', '-id')
+    invalid_cursor_message = "Noto'g'ri cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        queryset = queryset.order_by(*self.ordering)
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            created_date, pk = self.decode_cursor(cursor)
+            # (created_date, id) < cursor; OR o'rniga shu ko'rinishda indeks bo'yicha qidiriladi
+            queryset = queryset.filter(
+                Q(created_date__lte=created_date) & ~Q(created_date=created_date, id__gte=pk)
+            )
+
+        page = list(queryset[:self.page_size + 1])
+        self.has_next = len(page) > self.page_size
+        self.page = page[:self.page_size]
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        last = self.page[-1]
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(last))
+
+    def encode_cursor(self, obj):
+        value = f'{obj.created_date.isoformat()}|{obj.pk}'
+        return urlsafe_b64encode(value.encode()).decode()
+
+    def decode_cursor(self, cursor):
+        try:
+            created_date, pk = urlsafe_b64decode(cursor.encode()).decode().split('|')
+            created_date = parse_datetime(created_date)
+            pk = int(pk)
+        except (TypeError, ValueError, UnicodeDecodeError):
+            raise NotFound(self.invalid_cursor_message)
+        if created_date is None:
+            raise NotFound(self.invalid_cursor_message)
+        return created_date, pk
+
+    def get_schema_operation_parameters(self, view):
+        return [{
+            'name': self.cursor_query_param,
+            'required': False,
+            'in': 'query',
+            'description': "Keyingi sahifa kursori (?pagination=cursor rejimida)",
+            'schema': {'type': 'string'},
+        }]
@@ -0,0 +1,67 @@
+"""
+Kesh asosidagi token bucket: barcha worker va jarayonlar uchun umumiy tezlik
+cheklovi (kesh umumiy bo'lsa, masalan redis yoki db).
+"""
+import time
+from contextlib import contextmanager
+
+from django.core.cache import cache as default_cache
+
+# DRF dagi kabi: '20/min', '1/s', '1000/day'
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+def parse_rate(rate):
+    """'20/min' -> (20, 60)"""
+    num, period = rate.split('/')
+    return int(num), PERIODS[period[0]]
+
+
+class TokenBucket:
+    """
+    Sekundiga num/period token to'ldiriladigan, capacity tagacha yig'iladigan
+    bucket. consume() token yetarli bo'lsa (True, 0), aks holda
+    (False, kutish_soniya) qaytaradi.
+    """
+    LOCK_TIMEOUT = 1
+    LOCK_ATTEMPTS = 20
+
+    def __init__(self, key, rate, capacity=None, cache=None, clock=time.time):
+        num, period = parse_rate(rate)
+        self.key = f'ratelimit:{key}'
+        self.refill_rate = num / period
+        self.capacity = capacity or num
+        self.cache = cache or default_cache
+        self.clock = clock
+
+    def consume(self, tokens=1):
+        with self._lock():
+            now = self.clock()
+            available, updated = self.cache.get(self.key) or (self.capacity, now)
+            available = min(self.capacity, available + (now - updated) * self.refill_rate)
+            allowed = available >= tokens
+            if allowed:
+                available -= tokens
+            # To'lguncha kerak bo'lgan vaqtdan keyin yozuv keraksiz
+            timeout = int((self.capacity - available) / self.refill_rate) + 1
+            self.cache.set(self.key, (available, now), timeout)
+        if allowed:
+            return True, 0
+        return False, (tokens - available) / self.refill_rate
+
+    @contextmanager
+    def _lock(self):
+        """
+        cache.add orqali qisqa qulf; olinmasa ham davom etiladi (eng yomon
+        holatda bir nechta token ortiqcha beriladi)
+        """
+        lock_key = f'{self.key}:lock'
+        for _ in range(self.LOCK_ATTEMPTS):
+            if self.cache.add(lock_key, 1, self.LOCK_TIMEOUT):
+                try:
+                    yield
+                finally:
+                    self.cache.delete(lock_key)
+                return
+            time.sleep(0.005)
+        yield
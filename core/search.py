@@ -0,0 +1,202 @@
+"""
+Yangiliklar, qarorlar, ish o'rinlari va interaktiv xizmatlar uchun qidiruv indeksi.
+
+Har bir obyekt uchun SearchDocument va uning so'zlari (SearchTerm) saqlanadi.
+Barcha tillardagi matnlar bitta yozuvga (lotin) o'giriladi, shuning uchun
+kirillcha so'rov lotincha matnni ham topadi va aksincha. Qidiruv so'z
+boshlanishi bo'yicha indeks orqali bajariladi va og'irliklar yig'indisi
+bo'yicha saralanadi.
+"""
+from collections import Counter
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import Case, IntegerField, Max, Q, Sum, Value, When
+
+from .models import Decision, InteractiveService, JobVacancy, News, SearchDocument, SearchTerm
+from .utils import LANGUAGE_SUFFIXES, search_words
+
+TITLE_WEIGHT = 10
+MAX_TERM_LENGTH = 64
+MAX_TERM_WEIGHT = 1000
+MAX_QUERY_TERMS = 10
+MAX_CANDIDATES = 1000
+
+# Model -> (natija turi, sarlavha maydoni, matn maydonlari). HTML matnlar o'rniga
+# saqlashda tayyorlangan plain_text* ustunlari indekslanadi (content.py)
+SEARCH_MODELS = {
+    News: ('news', 'title', ('category', 'plain_text')),
+    Decision: ('decision', 'title', ('plain_text',)),
+    JobVacancy: ('job_vacancy', 'title', ('location', 'plain_text')),
+    InteractiveService: ('interactive_service', 'title', ('plain_text',)),
+}
+
+
+def prefix_range(field, word):
+    """So'z boshlanishi bo'yicha indeksdan foydalanadigan oraliq sharti"""
+    return Q(**{f'{field}__gte': word, f'{field}__lt': word + '\uffff'})
+
+
+def tokenize(text):
+    """Matndan qidiruv so'zlari ro'yxati"""
+    return [word[:MAX_TERM_LENGTH] for word in search_words(text)]
+
+
+def _language_values(obj, field):
+    return [
+        getattr(obj, f'{field}{suffix}', None) or ''
+        for suffix in LANGUAGE_SUFFIXES.values()
+    ]
+
+
+def build_terms(obj):
+    """Obyekt uchun {so'z: og'irlik} lug'ati"""
+    _, title_field, body_fields = SEARCH_MODELS[type(obj)]
+    weights = Counter()
+    for value in _language_values(obj, title_field):
+        for term in tokenize(value):
+            weights[term] += TITLE_WEIGHT
+    for field in body_fields:
+        for value in _language_values(obj, field):
+            for term in tokenize(value):
+                weights[term] += 1
+    return {term: min(weight, MAX_TERM_WEIGHT) for term, weight in weights.items()}
+
+
+def _document_fields(obj):
+    _, title_field, _ = SEARCH_MODELS[type(obj)]
+    return {
+        'title': getattr(obj, title_field),
+        'title_ru': getattr(obj, f'{title_field}_ru'),
+        'title_uz_cyrl': getattr(obj, f'{title_field}_uz_cyrl'),
+        'slug': obj.slug,
+        'created_date': obj.created_date,
+    }
+
+
+def index_object(obj):
+    """Obyektni indeksga qo'shish yoki yangilash"""
+    content_type = ContentType.objects.get_for_model(obj.__class__)
+    with transaction.atomic():
+        document, created = SearchDocument.objects.update_or_create(
+            content_type=content_type, object_id=obj.pk, defaults=_document_fields(obj)
+        )
+        if not created:
+            document.terms.all().delete()
+        SearchTerm.objects.bulk_create([
+            SearchTerm(document=document, term=term, weight=weight)
+            for term, weight in build_terms(obj).items()
+        ])
+
+
+def remove_object(obj):
+    """Obyektni indeksdan o'chirish"""
+    SearchDocument.objects.filter(
+        content_type=ContentType.objects.get_for_model(obj.__class__), object_id=obj.pk
+    ).delete()
+
+
+def rebuild_index(batch_size=500, stdout=None):
+    """Butun indeksni qaytadan qurish"""
+    SearchTerm.objects.all().delete()
+    SearchDocument.objects.all().delete()
+    total = 0
+    for model in SEARCH_MODELS:
+        content_type = ContentType.objects.get_for_model(model)
+        batch = []
+        for obj in model.objects.order_by('pk').iterator(chunk_size=batch_size):
+            batch.append(obj)
+            if len(batch) >= batch_size:
+                _index_batch(content_type, batch)
+                total += len(batch)
+                batch = []
+        if batch:
+            _index_batch(content_type, batch)
+            total += len(batch)
+        if stdout:
+            stdout.write(f"{model._meta.verbose_name_plural}: indekslandi")
+    return total
+
+
+def _index_batch(content_type, objects):
+    with transaction.atomic():
+        documents = SearchDocument.objects.bulk_create([
+            SearchDocument(content_type=content_type, object_id=obj.pk, **_document_fields(obj))
+            for obj in objects
+        ])
+        SearchTerm.objects.bulk_create([
+            SearchTerm(document=document, term=term, weight=weight)
+            for document, obj in zip(documents, objects)
+            for term, weight in build_terms(obj).items()
+        ], batch_size=2000)
+
+
+def search(query, types=None):
+    """
+    Barcha so'zlari mos kelgan hujjatlar: {'document_id', 'score'} qatorlari,
+    og'irlik bo'yicha saralangan. Har bir so'z boshlanishi bo'yicha qidiriladi
+    (suv -> suvni, suvchilar).
+
+    Nomzodlar eng kam uchraydigan so'z bo'yicha indeksdan (kerakli turlar
+    orasidan) olinadi va eng yangi MAX_CANDIDATES ta hujjat bilan cheklanadi, shuning uchun juda keng
+    tarqalgan so'zlar ham butun jadvalni saralashga olib kelmaydi.
+    """
+    tokens = list(dict.fromkeys(tokenize(query)))[:MAX_QUERY_TERMS]
+    if not tokens:
+        return SearchTerm.objects.none().values('document_id')
+
+    ranges = [prefix_range('term', token) for token in tokens]
+    condition = ranges[0]
+    for term_range in ranges[1:]:
+        condition |= term_range
+
+    rarest = min(ranges, key=lambda term_range: SearchTerm.objects.filter(term_range).count())
+    candidates = SearchTerm.objects.filter(rarest)
+    if types:
+        # Tur sharti cheklovdan oldin: boshqa turdagi yangi hujjatlar nomzodlarni egallamaydi
+        candidates = candidates.filter(document__content_type__in=[
+            ContentType.objects.get_for_model(model)
+            for model, (name, _, _) in SEARCH_MODELS.items() if name in types
+        ])
+    # Bir hujjatda so'z boshlanishiga mos bir nechta so'z bo'lishi mumkin
+    candidates = candidates.values('document_id').distinct().order_by('-document_id')[:MAX_CANDIDATES]
+    terms = SearchTerm.objects.filter(condition, document_id__in=candidates)
+
+    matched = {
+        f'matched_{i}': Max(Case(When(term_range, then=Value(1)), default=Value(0), output_field=IntegerField()))
+        for i, term_range in enumerate(ranges)
+    }
+    return (
+        terms
+        .values('document_id')
+        .annotate(score=Sum('weight'), **matched)
+        .filter(**{name: 1 for name in matched})
+        .order_by('-score', '-document__created_date', '-document_id')
+    )
+
+
+def matching_object_ids(model, word):
+    """So'z (boshlanishi) uchragan model obyektlari id lari uchun subquery"""
+    documents = SearchTerm.objects.filter(prefix_range('term', word)).values('document_id')
+    return SearchDocument.objects.filter(
+        pk__in=documents, content_type=ContentType.objects.get_for_model(model)
+    ).values('object_id')
+
+
+def get_documents(rows):
+    """search() qatorlari uchun hujjatlarni score bilan birga qaytarish"""
+    documents = SearchDocument.objects.in_bulk([row['document_id'] for row in rows])
+    results = []
+    for row in rows:
+        document = documents.get(row['document_id'])
+        if document is None:
+            # Ikki so'rov orasida o'chirilgan
+            continue
+        document.score = row['score']
+        results.append(document)
+    return results
+
+
+def get_result_type(document):
+    model = ContentType.objects.get_for_id(document.content_type_id).model_class()
+    return SEARCH_MODELS[model][0]
@@ -1,15 +1,49 @@
+from django.core.files.storage import default_storage
 from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
 from drf_spectacular.types import OpenApiTypes
 from .models import *
+from .images import VARIANT_FORMATS
+from .mixins import CleanHTMLSerializerMixin, TranslatedSerializerMixin
+from .search import get_result_type
+from .utils import translate
 
+# To'liq matnning hosila ustunlari (content.py): API javobida alohida chiqmaydi,
+# tozalangan HTML asl maydon nomi bilan qaytariladi (CleanHTMLSerializerMixin)
+CONTENT_DERIVED_FIELDS = (
+    'clean_html', 'clean_html_ru', 'clean_html_uz_cyrl',
+    'plain_text', 'plain_text_ru', 'plain_text_uz_cyrl',
+)
 
-class BannerSerializer(serializers.ModelSerializer):
+
+@extend_schema_field({
+    'type': 'object',
+    'additionalProperties': {'type': 'object', 'additionalProperties': {'type': 'string', 'format': 'uri'}},
+    'example': {'webp': {'320': 'https://.../news/variants/rasm-320.webp'}},
+})
+class SrcsetField(serializers.ReadOnlyField):
+    """Rasm nusxalari: {format: {kenglik: url}} (hali tayyor bo'lmasa bo'sh)"""
+    def to_representation(self, value):
+        request = self.context.get('request')
+        srcset = {}
+        for extension in VARIANT_FORMATS:
+            sizes = (value or {}).get(extension)
+            if not sizes:
+                continue
+            srcset[extension] = {}
+            for width, name in sizes.items():
+                url = default_storage.url(name)
+                srcset[extension][width] = request.build_absolute_uri(url) if request is not None else url
+        return srcset
+
+
+class BannerSerializer(TranslatedSerializerMixin, serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField()
+    image_srcset = SrcsetField(source='image_variants')
     
     class Meta:
         model = Banner
-        fields = '__all__'
+        exclude = ('image_variants',)
     
     @extend_schema_field(OpenApiTypes.URI)
     def get_image_url(self, obj):
@@ -27,12 +61,30 @@ class StatisticsSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
-class UsefulLinkSerializer(serializers.ModelSerializer):
+class StatisticsHistoryQuerySerializer(serializers.Serializer):
+    """/api/statistics/history/ parametrlari"""
+    bucket = serializers.ChoiceField(choices=['day', 'month', 'year'], default='month')
+    limit = serializers.IntegerField(min_value=1, max_value=366, default=24)
+
+
+class StatisticsHistorySerializer(serializers.ModelSerializer):
+    period = serializers.DateField(read_only=True)
+    
+    class Meta:
+        model = Statistics
+        fields = (
+            'period', 'korsatilayotgan_xizmatlar', 'hududiy_boshqarmalar_soni',
+            'nasos_stansiyalar_soni', 'xodimlar', 'created_date',
+        )
+
+
+class UsefulLinkSerializer(TranslatedSerializerMixin, serializers.ModelSerializer):
     icon_url = serializers.SerializerMethodField()
+    icon_srcset = SrcsetField(source='icon_variants')
     
     class Meta:
         model = UsefulLink
-        fields = '__all__'
+        exclude = ('icon_variants', 'search_key')
     
     @extend_schema_field(OpenApiTypes.URI)
     def get_icon_url(self, obj):
@@ -44,13 +96,14 @@ class UsefulLinkSerializer(serializers.ModelSerializer):
         return None
 
 
-class NewsSerializer(serializers.ModelSerializer):
+class NewsSerializer(TranslatedSerializerMixin, CleanHTMLSerializerMixin, serializers.ModelSerializer):
     views_count = serializers.SerializerMethodField()
     main_image_url = serializers.SerializerMethodField()
+    main_image_srcset = SrcsetField(source='main_image_variants')
     
     class Meta:
         model = News
-        fields = '__all__'
+        exclude = ('main_image_variants', *CONTENT_DERIVED_FIELDS)
     
     @extend_schema_field(OpenApiTypes.INT)
     def get_views_count(self, obj):
@@ -66,7 +119,20 @@ class NewsSerializer(serializers.ModelSerializer):
         return None
 
 
-class AboutSerializer(serializers.ModelSerializer):
+class NewsListSerializer(NewsSerializer):
+    """Ro'yxat uchun yengil serializer (to'liq matnsiz)"""
+    class Meta:
+        model = News
+        fields = (
+            'id', 'title', 'title_ru', 'title_uz_cyrl', 'slug',
+            'category', 'category_ru', 'category_uz_cyrl',
+            'main_image_url', 'main_image_srcset', 'views_count', 'minutes_to_read',
+            'excerpt', 'excerpt_ru', 'excerpt_uz_cyrl',
+            'created_date', 'updated_date',
+        )
+
+
+class AboutSerializer(TranslatedSerializerMixin, serializers.ModelSerializer):
     hudud_display = serializers.SerializerMethodField()
     
     class Meta:
@@ -78,12 +144,13 @@ class AboutSerializer(serializers.ModelSerializer):
         return obj.get_hudud_display_uz()
 
 
-class LeadershipSerializer(serializers.ModelSerializer):
+class LeadershipSerializer(TranslatedSerializerMixin, serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField()
+    image_srcset = SrcsetField(source='image_variants')
     
     class Meta:
         model = Leadership
-        fields = '__all__'
+        exclude = ('image_variants', 'search_key')
     
     @extend_schema_field(OpenApiTypes.URI)
     def get_image_url(self, obj):
@@ -95,53 +162,100 @@ class LeadershipSerializer(serializers.ModelSerializer):
         return None
 
 
-class JobVacancyDepartmentSerializer(serializers.ModelSerializer):
+class JobVacancyDepartmentSerializer(TranslatedSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = JobVacancyDepartment
         fields = '__all__'
 
 
-class TypeOfWorkSerializer(serializers.ModelSerializer):
+class TypeOfWorkSerializer(TranslatedSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = TypeOfWork
         fields = '__all__'
 
 
-class JobVacancySerializer(serializers.ModelSerializer):
-    leadership_name = serializers.CharField(source='leadership.full_name', read_only=True)
-    department_name = serializers.CharField(source='department.title', read_only=True)
-    type_of_work_name = serializers.CharField(source='type_of_work.title', read_only=True)
+class JobVacancySerializer(TranslatedSerializerMixin, CleanHTMLSerializerMixin, serializers.ModelSerializer):
+    leadership_name = serializers.SerializerMethodField()
+    department_name = serializers.SerializerMethodField()
+    type_of_work_name = serializers.SerializerMethodField()
     
     class Meta:
         model = JobVacancy
-        fields = '__all__'
+        exclude = CONTENT_DERIVED_FIELDS
         read_only_fields = ('leadership_name', 'department_name', 'type_of_work_name')
+    
+    @extend_schema_field(OpenApiTypes.STR)
+    def get_leadership_name(self, obj):
+        return translate(obj.leadership, 'full_name', self.context.get('lang'))
+    
+    @extend_schema_field(OpenApiTypes.STR)
+    def get_department_name(self, obj):
+        return translate(obj.department, 'title', self.context.get('lang'))
+    
+    @extend_schema_field(OpenApiTypes.STR)
+    def get_type_of_work_name(self, obj):
+        return translate(obj.type_of_work, 'title', self.context.get('lang'))
 
 
-class InteractiveServiceSerializer(serializers.ModelSerializer):
+class JobVacancyListSerializer(JobVacancySerializer):
+    """Ro'yxat uchun yengil serializer (to'liq tavsifsiz)"""
+    class Meta:
+        model = JobVacancy
+        fields = (
+            'id', 'title', 'title_ru', 'title_uz_cyrl', 'slug',
+            'leadership', 'leadership_name', 'department', 'department_name',
+            'type_of_work', 'type_of_work_name',
+            'location', 'location_ru', 'location_uz_cyrl',
+            'excerpt', 'excerpt_ru', 'excerpt_uz_cyrl',
+            'created_date', 'updated_date',
+        )
+
+
+class InteractiveServiceSerializer(TranslatedSerializerMixin, CleanHTMLSerializerMixin, serializers.ModelSerializer):
     views_count = serializers.SerializerMethodField()
     
     class Meta:
         model = InteractiveService
-        fields = '__all__'
+        exclude = CONTENT_DERIVED_FIELDS
     
     @extend_schema_field(OpenApiTypes.INT)
     def get_views_count(self, obj):
         return obj.get_views_count()
 
 
-class DecisionSerializer(serializers.ModelSerializer):
+class DecisionSerializer(TranslatedSerializerMixin, CleanHTMLSerializerMixin, serializers.ModelSerializer):
     views_count = serializers.SerializerMethodField()
     
     class Meta:
         model = Decision
-        fields = '__all__'
+        exclude = CONTENT_DERIVED_FIELDS
     
     @extend_schema_field(OpenApiTypes.INT)
     def get_views_count(self, obj):
         return obj.get_views_count()
 
 
+class DecisionListSerializer(DecisionSerializer):
+    """Ro'yxat uchun yengil serializer (to'liq matnsiz)"""
+    class Meta:
+        model = Decision
+        fields = (
+            'id', 'title', 'title_ru', 'title_uz_cyrl', 'slug', 'views_count',
+            'excerpt', 'excerpt_ru', 'excerpt_uz_cyrl',
+            'created_date', 'updated_date',
+        )
+
+
+class HomeSerializer(serializers.Serializer):
+    """Bosh sahifa bo'limlari (har biri cheklangan sonda)"""
+    banners = BannerSerializer(many=True)
+    statistics = StatisticsSerializer(allow_null=True)
+    useful_links = UsefulLinkSerializer(many=True)
+    news = NewsListSerializer(many=True)
+    interactive_services = InteractiveServiceSerializer(many=True)
+    about = AboutSerializer(allow_null=True)
+
+
 class ContactSerializer(serializers.ModelSerializer):
     class Meta:
         model = Contact
@@ -152,4 +266,69 @@ class ContactSerializer(serializers.ModelSerializer):
 class ContactCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Contact
-        fields = ['full_name', 'phone_number', 'email', 'message']
\ No newline at end of file
+        fields = ['full_name', 'phone_number', 'email', 'message']
+        extra_kwargs = {
+            'message': {'max_length': 5000},
+        }
+
+
+class ContactBulkActionSerializer(serializers.Serializer):
+    """Bir nechta murojaat ustida amal: id lar ro'yxati yoki filtr bo'yicha"""
+    ACTIONS = ('mark_as_read', 'mark_as_unread', 'delete')
+    
+    action = serializers.ChoiceField(choices=ACTIONS)
+    ids = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False, max_length=10000)
+    is_read = serializers.BooleanField(required=False, allow_null=True, default=None)
+    created_before = serializers.DateTimeField(required=False)
+    created_after = serializers.DateTimeField(required=False)
+    
+    def validate(self, attrs):
+        if not attrs.get('ids') and attrs.get('is_read') is None \
+                and 'created_before' not in attrs and 'created_after' not in attrs:
+            raise serializers.ValidationError("ids yoki kamida bitta filtr (is_read, created_before, created_after) kerak")
+        return attrs
+    
+    def get_filters(self):
+        """Contact querysetiga qo'llaniladigan shartlar"""
+        data = self.validated_data
+        lookups = {
+            'pk__in': data.get('ids'),
+            'is_read': data.get('is_read'),
+            'created_date__lt': data.get('created_before'),
+            'created_date__gte': data.get('created_after'),
+        }
+        return {lookup: value for lookup, value in lookups.items() if value is not None}
+
+
+class ContactSummarySerializer(serializers.Serializer):
+    total = serializers.IntegerField()
+    unread = serializers.IntegerField()
+    today = serializers.IntegerField()
+
+
+class CacheEndpointStatsSerializer(serializers.Serializer):
+    hits = serializers.IntegerField()
+    misses = serializers.IntegerField()
+    hit_rate = serializers.FloatField()
+
+
+class CacheStatsSerializer(serializers.Serializer):
+    """Joriy worker keshi statistikasi"""
+    backend = serializers.CharField()
+    pid = serializers.IntegerField()
+    endpoints = serializers.DictField(child=CacheEndpointStatsSerializer())
+
+
+class SearchResultSerializer(TranslatedSerializerMixin, serializers.ModelSerializer):
+    type = serializers.SerializerMethodField()
+    id = serializers.IntegerField(source='object_id')
+    score = serializers.IntegerField()
+    
+    class Meta:
+        model = SearchDocument
+        fields = ('type', 'id', 'slug', 'title', 'title_ru', 'title_uz_cyrl', 'score', 'created_date')
+    
+    @extend_schema_field(OpenApiTypes.STR)
+    def get_type(self, obj):
+        return get_result_type(obj)
+
@@ -1,12 +1,65 @@
-from django.apps import AppConfig
-from django.utils.translation import gettext_lazy as _
-
-class CoreConfig(AppConfig):
-    default_auto_field = 'django.db.models.BigAutoField'
-    name = 'core'
-    verbose_name = _("Asosiy modullar")
-    
-    def ready(self):
-        # Remove or comment out the signals import
-        # import core.signals
-        pass
\ No newline at end of file
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from .cache import bump_model_version
+from .models import (
+    Banner, Statistics, UsefulLink, News, About, Leadership,
+    JobVacancyDepartment, TypeOfWork, JobVacancy,
+    InteractiveService, Decision
+)
+from .images import IMAGE_FIELDS, needs_variants, schedule_variants, schedule_variants_deletion
+from .search import SEARCH_MODELS, index_object, remove_object
+
+# API javoblari keshlanadigan modellar
+CACHED_MODELS = (
+    Banner, Statistics, UsefulLink, News, About, Leadership,
+    JobVacancyDepartment, TypeOfWork, JobVacancy,
+    InteractiveService, Decision,
+)
+
+
+def invalidate_model_cache(sender, **kwargs):
+    """
+    Model o'zgarganda kesh versiyasini oshirish. Tranzaksiya tugagach yana bir bor
+    oshiriladi, aks holda commit'dan oldin keshlangan eski javob qolib ketishi mumkin.
+    """
+    bump_model_version(sender)
+    transaction.on_commit(lambda: bump_model_version(sender))
+
+
+for model in CACHED_MODELS:
+    post_save.connect(invalidate_model_cache, sender=model, dispatch_uid=f'cache-save-{model.__name__}')
+    post_delete.connect(invalidate_model_cache, sender=model, dispatch_uid=f'cache-delete-{model.__name__}')
+
+
+def update_search_index(sender, instance, **kwargs):
+    """Saqlangan obyektni qidiruv indeksida yangilash"""
+    if not kwargs.get('raw'):
+        index_object(instance)
+
+
+def remove_from_search_index(sender, instance, **kwargs):
+    """O'chirilgan obyektni qidiruv indeksidan olib tashlash"""
+    remove_object(instance)
+
+
+for model in SEARCH_MODELS:
+    post_save.connect(update_search_index, sender=model, dispatch_uid=f'search-save-{model.__name__}')
+    post_delete.connect(remove_from_search_index, sender=model, dispatch_uid=f'search-delete-{model.__name__}')
+
+
+
+def update_image_variants(sender, instance, **kwargs):
+    """Rasm o'zgargan bo'lsa, uning nusxalarini fonda tayyorlash"""
+    if not kwargs.get('raw') and needs_variants(instance):
+        schedule_variants(instance)
+
+
+def remove_image_variants(sender, instance, **kwargs):
+    """O'chirilgan obyekt rasmining nusxalarini o'chirish"""
+    schedule_variants_deletion(instance)
+
+
+for model in IMAGE_FIELDS:
+    post_save.connect(update_image_variants, sender=model, dispatch_uid=f'image-variants-{model.__name__}')
+    post_delete.connect(remove_image_variants, sender=model, dispatch_uid=f'image-variants-delete-{model.__name__}')
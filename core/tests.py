@@ -1,3 +1,1374 @@
-from django.test import TestCase
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO, StringIO
+from unittest import mock
 
-# Create your tests here.
+import requests
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.db import DatabaseError, connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from hitcount.models import HitCount
+from PIL import Image
+from rest_framework.settings import api_settings
+from rest_framework.test import APIClient
+
+from .cache import cache_metrics
+from .content import sanitize_html
+from .images import generate_variants
+from . import counters
+from .counters import (
+    check_contact_counters, contact_summary, delete_contacts, hit_buffer, rebuild_contact_counters,
+    set_contacts_read,
+)
+from . import notifications
+from .notifications import MAX_ATTEMPTS, dispatch_pending, enqueue, format_contact_message
+from .ratelimit import TokenBucket
+from .search import get_documents, search
+from .utils import CircuitOpen, HttpClient, telegram_client
+from .models import *
+from .utils import normalize_search_text
+
+
+def create_news(n, **kwargs):
+    return [
+        News.objects.create(
+            title=f"Yangilik {i}",
+            content=f"<p>Matn {i}</p>",
+            main_image='news/test.jpg',
+            slug=f"yangilik-{i}-{News.objects.count()}",
+            **kwargs
+        )
+        for i in range(n)
+    ]
+
+
+class APITestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def count_queries(self, url):
+        cache.clear()
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries)
+
+
+class ViewsCountTests(APITestCase):
+    def test_views_count_is_hit_total(self):
+        news = create_news(1)[0]
+        HitCount.objects.create(
+            content_type=ContentType.objects.get_for_model(News),
+            object_pk=news.pk,
+            hits=7,
+        )
+        response = self.client.get('/api/news/')
+        self.assertEqual(response.data['results'][0]['views_count'], 7)
+
+    def test_list_query_count_is_constant(self):
+        create_news(2)
+        ContentType.objects.get_for_model(News)
+        small = self.count_queries('/api/news/')
+        create_news(8)
+        large = self.count_queries('/api/news/')
+        self.assertEqual(small, large)
+
+    def test_decision_and_service_query_count_is_constant(self):
+        for url, model, field in [
+            ('/api/decisions/', Decision, 'content'),
+            ('/api/interactive-services/', InteractiveService, 'about'),
+        ]:
+            ContentType.objects.get_for_model(model)
+            model.objects.create(title="a", slug=f"{url}-a", **{field: "x"})
+            small = self.count_queries(url)
+            for i in range(5):
+                model.objects.create(title=f"b{i}", slug=f"{url}-b{i}", **{field: "x"})
+            self.assertEqual(small, self.count_queries(url))
+
+
+@override_settings(HITCOUNT_FLUSH_INTERVAL=None)
+class HitBufferTests(APITestCase):
+    def tearDown(self):
+        hit_buffer.flush()
+        hit_buffer._known.clear()
+
+    def test_increment_views_is_buffered(self):
+        news = create_news(1)[0]
+        url = f'/api/news/{news.pk}/increment_views/'
+        views = [self.client.get(url).data['views'] for _ in range(3)]
+        self.assertEqual(views, [1, 2, 3])
+        self.assertFalse(HitCount.objects.exists())
+
+        self.assertEqual(hit_buffer.flush(), 3)
+        self.assertEqual(HitCount.objects.get().hits, 3)
+
+    def test_flush_aggregates_into_existing_hitcount(self):
+        decision = Decision.objects.create(title="Qaror", content="x", slug="qaror")
+        HitCount.objects.create(
+            content_type=ContentType.objects.get_for_model(Decision),
+            object_pk=decision.pk,
+            hits=10,
+        )
+        url = f'/api/decisions/{decision.pk}/increment_views/'
+        self.client.get(url)
+        self.assertEqual(self.client.get(url).data['views'], 12)
+
+        with self.assertNumQueries(3):
+            hit_buffer.flush()
+        self.assertEqual(HitCount.objects.get().hits, 12)
+        self.assertEqual(self.client.get(url).data['views'], 13)
+
+    def test_flush_refreshes_etag_and_cached_list_together(self):
+        news = create_news(1)[0]
+        response = self.client.get('/api/news/')
+        etag = response['ETag']
+        self.assertEqual(self.client.get('/api/news/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.client.get(f'/api/news/{news.pk}/increment_views/')
+        hit_buffer.flush()
+        response = self.client.get('/api/news/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.json()['results'][0]['views_count'], 1)
+
+    def test_views_do_not_decrease_while_flushing(self):
+        news = create_news(1)[0]
+        for _ in range(3):
+            hit_buffer.hit(news)
+        during_flush = []
+        create = HitCount.objects.create
+
+        def create_and_hit(**kwargs):
+            during_flush.append(hit_buffer.hit(news))
+            return create(**kwargs)
+
+        with mock.patch.object(HitCount.objects, 'create', side_effect=create_and_hit):
+            self.assertEqual(hit_buffer.flush(), 3)
+        self.assertEqual(during_flush, [4])
+        self.assertEqual(hit_buffer.hit(news), 5)
+
+        # Yozib bo'lingan obyektlar xotirada qolmaydi
+        hit_buffer.flush()
+        self.assertEqual(hit_buffer._known, {})
+        self.assertEqual(hit_buffer.hit(news), 6)
+
+    def test_failed_flush_keeps_views(self):
+        news = create_news(1)[0]
+        hit_buffer.hit(news)
+        with mock.patch.object(HitCount.objects, 'filter', side_effect=DatabaseError), \
+                self.assertLogs('core.counters', 'ERROR'):
+            self.assertEqual(hit_buffer.flush(), 0)
+        self.assertEqual(hit_buffer.hit(news), 2)
+        self.assertEqual(hit_buffer.flush(), 2)
+
+
+class JobVacancyQueryTests(APITestCase):
+    def create_vacancies(self, n):
+        start = JobVacancy.objects.count()
+        for i in range(start, start + n):
+            leadership = Leadership.objects.create(
+                full_name=f"Rahbar {i}", position="Boshliq", reception_time="9-18",
+                phone_number="+998", about="a", labor_activity="b", slug=f"rahbar-{i}",
+            )
+            JobVacancy.objects.create(
+                title=f"Vakansiya {i}", leadership=leadership,
+                department=JobVacancyDepartment.objects.create(title=f"Bo'lim {i}"),
+                type_of_work=TypeOfWork.objects.create(title=f"Tur {i}"),
+                location="Toshkent", description="<p>Tavsif</p>", slug=f"vakansiya-{i}",
+            )
+
+    def test_list_query_count_is_constant(self):
+        self.create_vacancies(1)
+        small = self.count_queries('/api/job-vacancies/')
+        self.create_vacancies(5)
+        self.assertEqual(small, self.count_queries('/api/job-vacancies/'))
+
+    def test_filtered_list_query_count(self):
+        self.create_vacancies(3)
+        vacancy = JobVacancy.objects.first()
+        for param in ['leadership', 'department', 'type_of_work']:
+            url = f'/api/job-vacancies/?{param}={getattr(vacancy, param + "_id")}'
+            with self.assertNumQueries(2):
+                response = self.client.get(url)
+            self.assertEqual(response.data['count'], 1)
+            self.assertEqual(response.data['results'][0]['leadership_name'], vacancy.leadership.full_name)
+
+    def test_admin_changelist_query_count_is_constant(self):
+        from django.contrib.auth.models import User
+        admin = User.objects.create_superuser('admin', 'admin@example.com', 'parol')
+        self.client.force_login(admin)
+        self.create_vacancies(1)
+        small = self.count_queries('/admin/core/jobvacancy/')
+        self.create_vacancies(5)
+        self.assertEqual(small, self.count_queries('/admin/core/jobvacancy/'))
+
+
+class ListSerializerTests(APITestCase):
+    def test_news_list_omits_content(self):
+        news = create_news(1)[0]
+        news.content = '<p>Birinchi &amp; <b>ikkinchi</b></p>' + '<p>uzun matn</p>' * 200
+        news.save()
+
+        with CaptureQueriesContext(connection) as ctx:
+            item = self.client.get('/api/news/').data['results'][0]
+        self.assertNotIn('content', item)
+        self.assertNotIn('content_ru', item)
+        self.assertTrue(item['excerpt'].startswith('Birinchi & ikkinchi uzun matn'))
+        self.assertLessEqual(len(item['excerpt']), 200)
+        select = [q['sql'] for q in ctx.captured_queries if 'FROM "core_news"' in q['sql']][-1]
+        self.assertNotRegex(select, r'(?<!SUBSTR\()"core_news"\."content')
+
+        detail = self.client.get(f'/api/news/{news.pk}/').data
+        self.assertEqual(detail['content'], news.content)
+
+    def test_decision_and_vacancy_lists_omit_bodies(self):
+        Decision.objects.create(title="Qaror", content="<p>Qaror matni</p>", slug="qaror")
+        item = self.client.get('/api/decisions/').data['results'][0]
+        self.assertNotIn('content', item)
+        self.assertEqual(item['excerpt'], 'Qaror matni')
+
+        JobVacancyQueryTests.create_vacancies(self, 1)
+        item = self.client.get('/api/job-vacancies/').data['results'][0]
+        self.assertNotIn('description', item)
+        self.assertEqual(item['excerpt'], 'Tavsif')
+        self.assertEqual(item['department_name'], "Bo'lim 0")
+
+
+class LanguageTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.news = create_news(1, title_ru="Новость", category="Suv", category_ru="Вода")[0]
+
+    def test_lang_returns_single_language(self):
+        with CaptureQueriesContext(connection) as ctx:
+            item = self.client.get('/api/news/?lang=ru').data['results'][0]
+        self.assertEqual(item['title'], "Новость")
+        self.assertEqual(item['category'], "Вода")
+        self.assertNotIn('title_ru', item)
+        self.assertNotIn('title_uz_cyrl', item)
+        self.assertNotIn('excerpt_ru', item)
+        select = [q['sql'] for q in ctx.captured_queries if 'FROM "core_news"' in q['sql']][-1]
+        self.assertNotIn('uz_cyrl', select)
+
+    def test_missing_translation_falls_back_to_latin(self):
+        item = self.client.get(f'/api/news/{self.news.pk}/?lang=uz-cyrl').data
+        self.assertEqual(item['title'], self.news.title)
+        self.assertEqual(item['content'], self.news.content)
+        self.assertNotIn('content_ru', item)
+
+    def test_without_lang_returns_all_languages(self):
+        item = self.client.get('/api/news/').data['results'][0]
+        self.assertEqual(item['title_ru'], "Новость")
+
+    def test_cached_list_varies_on_language(self):
+        self.assertEqual(self.client.get('/api/news/?lang=ru').data['results'][0]['title'], "Новость")
+        self.assertEqual(self.client.get('/api/news/?lang=uz').data['results'][0]['title'], self.news.title)
+
+    def test_related_names_are_translated(self):
+        JobVacancyQueryTests.create_vacancies(self, 1)
+        JobVacancyDepartment.objects.update(title_ru="Отдел")
+        item = self.client.get('/api/job-vacancies/?lang=ru').data['results'][0]
+        self.assertEqual(item['department_name'], "Отдел")
+        self.assertEqual(item['type_of_work_name'], "Tur 0")
+
+
+class CacheInvalidationTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        from django.contrib.auth.models import User
+        self.admin = APIClient()
+        self.admin.force_authenticate(User.objects.create_superuser('admin', 'admin@example.com', 'parol'))
+
+    def titles(self, url):
+        return [item['title'] for item in self.client.get(url).data['results']]
+
+    def test_api_writes_are_visible_on_next_get(self):
+        news = create_news(1)[0]
+        self.assertEqual(self.titles('/api/news/'), ["Yangilik 0"])
+
+        self.admin.patch(f'/api/news/{news.pk}/', {'title': "Yangilangan"})
+        self.assertEqual(self.titles('/api/news/'), ["Yangilangan"])
+
+        self.admin.delete(f'/api/news/{news.pk}/')
+        self.assertEqual(self.titles('/api/news/'), [])
+
+    def test_orm_writes_invalidate_cached_lists(self):
+        self.assertEqual(self.titles('/api/banners/'), [])
+        banner = Banner.objects.create(title="Banner", image='banners/a.jpg')
+        self.assertEqual(self.titles('/api/banners/'), ["Banner"])
+
+        self.assertEqual(self.client.get('/api/statistics/').json(), {})
+        Statistics.objects.create(xodimlar=5)
+        self.assertEqual(self.client.get('/api/statistics/').json()['xodimlar'], 5)
+
+        banner.delete()
+        self.assertEqual(self.titles('/api/banners/'), [])
+
+    def test_unchanged_list_is_served_from_cache(self):
+        create_news(2)
+        self.client.get('/api/news/')
+        with self.assertNumQueries(0):
+            self.client.get('/api/news/')
+
+
+class CacheBackendTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        cache_metrics.reset()
+
+    def test_hit_and_miss_metrics_per_endpoint(self):
+        first = self.client.get('/api/banners/')
+        second = self.client.get('/api/banners/')
+        self.assertEqual(first['X-Cache'], 'MISS')
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(
+            cache_metrics.snapshot()['endpoints']['banner-list'],
+            {'hits': 1, 'misses': 1, 'hit_rate': 0.5},
+        )
+
+    def test_cache_stats_endpoint_is_admin_only(self):
+        from django.contrib.auth.models import User
+        self.assertEqual(self.client.get('/api/cache-stats/').status_code, 403)
+        self.client.force_authenticate(User.objects.create_superuser('admin', 'admin@example.com', 'parol'))
+        self.assertIn('endpoints', self.client.get('/api/cache-stats/').data)
+
+    def test_dummy_backend_disables_caching(self):
+        with self.settings(CACHES={'default': settings.CACHE_BACKENDS['dummy']}):
+            self.client.get('/api/banners/')
+            self.assertEqual(self.client.get('/api/banners/')['X-Cache'], 'MISS')
+
+    def test_shared_backend_serves_other_workers(self):
+        # Boshqa worker bir xil kesh backendini ko'radi: javob kesh orqali olinadi
+        import tempfile
+        location = tempfile.mkdtemp()
+        backend = {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': location}
+        with self.settings(CACHES={'default': backend}):
+            self.client.get('/api/banners/')
+            with self.assertNumQueries(0):
+                self.assertEqual(APIClient().get('/api/banners/')['X-Cache'], 'HIT')
+
+
+class CacheKeyPolicyTests(APITestCase):
+    def test_anonymous_clients_with_different_cookies_share_entry(self):
+        create_news(2)
+        first = APIClient()
+        first.cookies['csrftoken'] = 'a' * 32
+        first.cookies['_ga'] = 'GA1.1.111'
+        second = APIClient()
+        second.cookies['csrftoken'] = 'b' * 32
+        second.cookies['_ym_uid'] = '222'
+
+        self.assertEqual(first.get('/api/news/')['X-Cache'], 'MISS')
+        with self.assertNumQueries(0):
+            response = second.get('/api/news/')
+        self.assertEqual(response['X-Cache'], 'HIT')
+
+    def test_cache_varies_on_language_and_format(self):
+        self.client.get('/api/leadership/')
+        self.assertEqual(self.client.get('/api/leadership/?lang=ru')['X-Cache'], 'MISS')
+        self.assertEqual(self.client.get('/api/leadership/?format=api')['X-Cache'], 'MISS')
+        self.assertEqual(self.client.get('/api/leadership/')['X-Cache'], 'HIT')
+
+    def test_admin_bypasses_cache(self):
+        from django.contrib.auth.models import User
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'parol'))
+        self.client.get('/api/banners/')
+        response = self.client.get('/api/banners/')
+        self.assertNotIn('X-Cache', response)
+
+
+class ConditionalGetTests(APITestCase):
+    def test_list_etag_short_circuits_to_304(self):
+        Banner.objects.create(title="Banner", image='banners/a.jpg')
+        response = self.client.get('/api/banners/')
+        etag = response['ETag']
+        self.assertIn('Last-Modified', response)
+        self.assertEqual(response['Cache-Control'], 'no-cache')
+        cached = self.client.get('/api/banners/')
+        self.assertEqual((cached['X-Cache'], cached['ETag'], cached['Cache-Control']), ('HIT', etag, 'no-cache'))
+
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/banners/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+        Banner.objects.create(title="Yangi", image='banners/b.jpg')
+        response = self.client.get('/api/banners/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_if_modified_since(self):
+        Statistics.objects.create(xodimlar=1)
+        last_modified = self.client.get('/api/statistics/')['Last-Modified']
+        response = self.client.get('/api/statistics/', HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+
+    def test_etag_varies_on_query_and_retrieve(self):
+        news = create_news(1)[0]
+        list_etag = self.client.get('/api/news/')['ETag']
+        self.assertNotEqual(list_etag, self.client.get('/api/news/?lang=ru')['ETag'])
+
+        response = self.client.get(f'/api/news/{news.pk}/')
+        response = self.client.get(f'/api/news/{news.pk}/', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_contact_list_uses_updated_date(self):
+        from django.contrib.auth.models import User
+        self.client.force_authenticate(User.objects.create_superuser('admin', 'admin@example.com', 'parol'))
+        contact = Contact.objects.create(full_name="Ali", phone_number="1", email="a@a.uz", message="Salom")
+        response = self.client.get('/api/contacts/')
+        self.assertEqual(response['Cache-Control'], 'private, no-cache')
+        etag = response['ETag']
+        self.assertEqual(self.client.get('/api/contacts/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.client.patch(f'/api/contacts/{contact.pk}/mark_as_read/')
+        self.assertEqual(self.client.get('/api/contacts/', HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+
+class KeysetPaginationTests(APITestCase):
+    def test_cursor_walks_whole_archive_in_order(self):
+        create_news(25)
+        expected = list(News.objects.order_by('-created_date', '-id').values_list('id', flat=True))
+
+        seen = []
+        url = '/api/news/?pagination=cursor'
+        while url:
+            cache.clear()
+            data = self.client.get(url).data
+            self.assertNotIn('count', data)
+            seen += [item['id'] for item in data['results']]
+            url = data['next']
+        self.assertEqual(seen, expected)
+
+    def test_keyset_mode_skips_count_query(self):
+        for i in range(12):
+            Decision.objects.create(title=f"Qaror {i}", content="x", slug=f"qaror-{i}")
+        with CaptureQueriesContext(connection) as ctx:
+            data = self.client.get('/api/decisions/?pagination=cursor').data
+        self.assertFalse(any('COUNT(' in q['sql'] for q in ctx.captured_queries))
+        cursor = data['next'].split('cursor=')[1]
+
+        data = self.client.get(f'/api/decisions/?cursor={cursor}').data
+        self.assertEqual([item['title'] for item in data['results']], ["Qaror 1", "Qaror 0"])
+        self.assertIsNone(data['next'])
+
+    def test_page_number_mode_is_default(self):
+        create_news(1)
+        self.assertEqual(self.client.get('/api/news/').data['count'], 1)
+
+    def test_invalid_cursor(self):
+        self.assertEqual(self.client.get('/api/job-vacancies/?cursor=xyz').status_code, 404)
+
+
+class SearchTests(APITestCase):
+    def search(self, query, **params):
+        return self.client.get('/api/search/', {'q': query, **params}).data['results']
+
+    def test_cyrillic_query_finds_latin_text_and_back(self):
+        latin = Decision.objects.create(title="Suv ta'minoti haqida", content="x", slug="suv")
+        cyrillic = Decision.objects.create(title="x", title_uz_cyrl="Ўғит ва сув", content="x", slug="ogit")
+
+        self.assertEqual([item['id'] for item in self.search("сув таъминоти")], [latin.pk])
+        self.assertEqual([item['id'] for item in self.search("ogit")], [cyrillic.pk])
+
+    def test_title_match_ranks_first_and_prefix_matches(self):
+        body, = create_news(1, content_ru="<p>Suvchilar uyushmasi</p>")
+        title = Decision.objects.create(title="Suvchilar kuni", content="x", slug="kun")
+
+        results = self.search("suvchi")
+        self.assertEqual([(item['type'], item['id']) for item in results], [('decision', title.pk), ('news', body.pk)])
+        self.assertEqual([item['id'] for item in self.search("suvchi", type='news')], [body.pk])
+
+    def test_type_filter_applies_before_candidate_limit(self):
+        decision = Decision.objects.create(title="Suvchilar kuni", content="x", slug="kun")
+        create_news(3, title_ru="Suvchilar suvchilari")
+        with mock.patch('core.search.MAX_CANDIDATES', 2):
+            self.assertEqual([item['id'] for item in self.search("suvchi", type='decision')], [decision.pk])
+            self.assertEqual(len(self.search("suvchi")), 2)
+
+    def test_migration_fills_missing_index(self):
+        from django.apps import apps
+        from importlib import import_module
+        decision = Decision.objects.create(title="Suvchilar kuni", content="<p>Kanal</p>", slug="kun")
+        create_news(1)
+        SearchDocument.objects.filter(object_id=decision.pk, content_type__model='decision').delete()
+        import_module('core.migrations.0015_fill_search_index').fill_search_index(apps, None)
+        self.assertEqual(SearchDocument.objects.count(), 2)
+        self.assertEqual([item['id'] for item in self.search("kanal suvchi")], [decision.pk])
+
+    def test_documents_deleted_between_queries_are_skipped(self):
+        decision = Decision.objects.create(title="Suvchilar kuni", content="x", slug="kun")
+        rows = list(search("suvchi"))
+        decision.delete()
+        self.assertEqual(get_documents(rows), [])
+
+    def test_index_follows_save_and_delete(self):
+        decision = Decision.objects.create(title="Eski nom", content="x", slug="nom")
+        decision.title = "Yangi nom"
+        decision.save()
+        self.assertEqual(self.search("eski"), [])
+        self.assertEqual(self.search("yangi nom", lang='ru')[0]['title'], "Yangi nom")
+
+        decision.delete()
+        self.assertFalse(SearchDocument.objects.exists())
+        self.assertFalse(SearchTerm.objects.exists())
+
+
+class NormalizedSearchTests(APITestCase):
+    def test_normalization_pipeline(self):
+        for value in ("Oʻzbekiston", "O‘zbekiston", "O'zbekiston", "O`zbekiston", "Ўзбекистон", "ÓZBEKISTON"):
+            self.assertEqual(normalize_search_text(value), "ozbekiston")
+        self.assertEqual(normalize_search_text("Ғалла ҳосили"), "galla hosili")
+
+    def test_search_key_is_computed_on_save(self):
+        leader = Leadership.objects.create(
+            full_name="Вали Алиев", position="Bosh muhandis", reception_time="-",
+            phone_number="1", about="-", slug="vali",
+        )
+        self.assertEqual(leader.search_key, "vali aliev bosh muhandis")
+
+        leader.position_uz_cyrl = "Бош директор"
+        leader.save(update_fields=['position_uz_cyrl'])
+        leader.refresh_from_db()
+        self.assertEqual(leader.search_key, "vali aliev bosh muhandis direktor")
+
+    def test_search_matches_across_scripts(self):
+        Leadership.objects.create(
+            full_name="Vali Aliyev", position="Bosh muhandis", reception_time="-",
+            phone_number="1", about="-", slug="vali",
+        )
+        news, other = create_news(2)
+        news.title_uz_cyrl = "Сув хўжалиги"
+        news.save()
+
+        def ids(url):
+            return [item['id'] for item in self.client.get(url).data['results']]
+
+        self.assertEqual(len(ids('/api/leadership/?search=МУҲАНДИС')), 1)
+        self.assertEqual(len(ids('/api/leadership/?search=aliyev muhandis')), 1)
+        self.assertEqual(ids('/api/leadership/?search=direktor'), [])
+        self.assertNotIn('search_key', self.client.get('/api/leadership/').data['results'][0])
+        self.assertEqual(ids("/api/news/?search=xoʻjalig"), [news.pk])
+        self.assertEqual(ids('/api/news/?search=suv matn'), [news.pk])
+
+    def test_news_search_does_not_scan_text_columns(self):
+        create_news(1)
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get('/api/news/?search=suv')
+        self.assertFalse(any('LIKE' in q['sql'] for q in ctx.captured_queries))
+
+
+class QueryPlanTests(TestCase):
+    def test_endpoint_queries_use_indexes(self):
+        out = StringIO()
+        call_command('explain_queries', stdout=out)
+        self.assertIn("GET /api/news/?category=", out.getvalue())
+        self.assertIn("GET /api/contacts/?is_read=false", out.getvalue())
+
+
+class SchemaTests(TestCase):
+    def test_schema_is_valid(self):
+        call_command('spectacular', '--validate', '--fail-on-warn', '--file', os.devnull)
+
+
+class FakeTelegramServer:
+    """Telegram Bot API o'rniga testlar uchun lokal HTTP server"""
+
+    def __init__(self):
+        self.messages = []
+        self.clients = set()
+        self.status = 200
+        self.delay = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                server.messages.append((self.path, body))
+                server.clients.add(self.client_address)
+                time.sleep(server.delay)
+                content = json.dumps({'ok': server.status == 200}).encode()
+                try:
+                    self.send_response(server.status)
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Content-Length', str(len(content)))
+                    self.end_headers()
+                    self.wfile.write(content)
+                except (BrokenPipeError, ConnectionResetError):
+                    # Mijoz vaqt chegarasi tufayli ulanishni yopgan
+                    pass
+
+            do_PUT = do_POST
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self.httpd.server_address[1]}'
+
+    def __enter__(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        self.settings = override_settings(
+            TELEGRAM_API_URL=self.url, TELEGRAM_BOT_TOKEN='test-token', TELEGRAM_CHAT_ID='42'
+        )
+        self.settings.enable()
+        return self
+
+    def __exit__(self, *exc):
+        self.settings.disable()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@override_settings(TELEGRAM_DIGEST_WINDOW=0, TELEGRAM_RATE_LIMIT='1000/min')
+class NotificationOutboxTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        telegram_client.breaker.reset()
+
+    def post_contact(self):
+        n = Contact.objects.count()
+        return self.client.post('/api/contacts/', {
+            'full_name': "Vali Aliyev", 'phone_number': '+998901234567',
+            'email': 'vali@example.com', 'message': f"Salom {n}",
+        })
+
+    def test_contact_create_only_enqueues(self):
+        with FakeTelegramServer() as telegram:
+            response = self.post_contact()
+            self.assertEqual(response.status_code, 201)
+            self.assertEqual(telegram.messages, [])
+
+        notification = Notification.objects.get()
+        self.assertEqual(notification.status, Notification.STATUS_PENDING)
+        self.assertEqual(notification.group, 'contact')
+        self.assertIn("Vali Aliyev", notification.message)
+
+    def test_dispatch_sends_pending_batch(self):
+        for _ in range(3):
+            self.post_contact()
+        with FakeTelegramServer() as telegram:
+            self.assertEqual(dispatch_pending(batch_size=2), (2, 0))
+            self.assertEqual(dispatch_pending(batch_size=2), (1, 0))
+            self.assertEqual(dispatch_pending(batch_size=2), (0, 0))
+
+        self.assertEqual(len(telegram.messages), 3)
+        path, body = telegram.messages[0]
+        self.assertEqual(path, '/bottest-token/sendMessage')
+        self.assertEqual(body['chat_id'], '42')
+        self.assertTrue(body['text'].startswith("📩 Yangi murojaat!"))
+        self.assertFalse(Notification.objects.exclude(status=Notification.STATUS_SENT).exists())
+
+    def test_message_leased_by_another_worker_is_not_resent(self):
+        self.post_contact()
+        self.post_contact()
+        first, second = Notification.objects.order_by('pk')
+        deliver = notifications.deliver
+
+        def slow_deliver(batch):
+            # Yuborish uzoq davom etdi: ikkinchi xabar ijarasi tugab, boshqa worker oldi
+            Notification.objects.filter(pk=second.pk).update(
+                next_attempt_at=timezone.now() + timedelta(minutes=5), claim_token=uuid.uuid4()
+            )
+            return deliver(batch)
+
+        with FakeTelegramServer() as telegram, mock.patch.object(notifications, 'deliver', side_effect=slow_deliver):
+            self.assertEqual(dispatch_pending(), (1, 0))
+        self.assertEqual(len(telegram.messages), 1)
+        second.refresh_from_db()
+        self.assertEqual(second.status, Notification.STATUS_PENDING)
+
+    def test_claim_is_set_based(self):
+        Notification.objects.bulk_create([Notification(message=f"Xabar {i}") for i in range(100)])
+        now = timezone.now()
+        # Nomzodlar, bitta UPDATE, token bo'yicha SELECT
+        with self.assertNumQueries(3):
+            batch = notifications.claim_batch(50, now)
+        self.assertEqual(len(batch), 50)
+        # Band qilinganlar boshqa workerga berilmaydi
+        again = notifications.claim_batch(100, now)
+        self.assertEqual(len(again), 50)
+        self.assertFalse({n.pk for n in batch} & {n.pk for n in again})
+        with self.assertNumQueries(1):
+            self.assertEqual(len(notifications.renew_lease(batch)), 50)
+
+    def test_failed_delivery_backs_off_and_gives_up(self):
+        self.post_contact()
+        with FakeTelegramServer() as telegram:
+            telegram.status = 400
+            self.assertEqual(dispatch_pending(), (0, 1))
+            notification = Notification.objects.get()
+            self.assertEqual(notification.attempts, 1)
+            self.assertGreater(notification.next_attempt_at, timezone.now() + timedelta(seconds=20))
+            # Kutish vaqti tugamaguncha qayta urinilmaydi
+            self.assertEqual(dispatch_pending(), (0, 0))
+
+            with self.assertLogs('core.notifications', 'ERROR'):
+                for _ in range(MAX_ATTEMPTS - 1):
+                    Notification.objects.update(next_attempt_at=timezone.now())
+                    dispatch_pending()
+
+        notification.refresh_from_db()
+        self.assertEqual(notification.status, Notification.STATUS_FAILED)
+        self.assertEqual(len(telegram.messages), MAX_ATTEMPTS)
+
+    def test_open_circuit_does_not_consume_attempts(self):
+        self.post_contact()
+        self.post_contact()
+        with FakeTelegramServer() as telegram:
+            telegram.status = 503
+            for _ in range(telegram_client.breaker.failure_threshold):
+                telegram_client.breaker.record_failure()
+            with self.assertLogs('core.notifications', 'WARNING'):
+                self.assertEqual(dispatch_pending(), (0, 0))
+
+        self.assertEqual(telegram.messages, [])
+        for notification in Notification.objects.all():
+            self.assertEqual(notification.attempts, 0)
+            self.assertGreater(notification.next_attempt_at, timezone.now() + timedelta(seconds=20))
+
+
+class HttpClientTests(TestCase):
+    def make_client(self, **kwargs):
+        return HttpClient('test', backoff_factor=0, **kwargs)
+
+    def test_keep_alive_connection_is_reused(self):
+        client = self.make_client()
+        with FakeTelegramServer() as server:
+            for _ in range(3):
+                client.post(f'{server.url}/send', json={})
+        self.assertEqual(len(server.clients), 1)
+        self.assertEqual(client.snapshot()['requests'], 3)
+
+    def test_bounded_retries_on_unavailable(self):
+        client = self.make_client(retries=2)
+        with FakeTelegramServer() as server:
+            server.status = 503
+            with self.assertRaises(requests.exceptions.HTTPError):
+                client.request('PUT', f'{server.url}/send', json={})
+        self.assertEqual(len(server.messages), 3)
+        self.assertEqual(client.snapshot()['failures'], 1)
+
+    def test_post_is_not_retried_after_response(self):
+        client = self.make_client(retries=2)
+        with FakeTelegramServer() as server:
+            server.status = 503
+            with self.assertRaises(requests.exceptions.HTTPError):
+                client.post(f'{server.url}/send', json={})
+        # Server xabarni qabul qilgan bo'lishi mumkin: faqat ulanish xatolari takrorlanadi
+        self.assertEqual(len(server.messages), 1)
+
+    def test_post_is_retried_only_on_connect_errors(self):
+        retry = self.make_client(retries=2).session.get_adapter('http://').max_retries
+        self.assertEqual(retry.connect, 2)
+        self.assertFalse(retry.is_retry('POST', 503))
+        self.assertTrue(retry.is_retry('GET', 503))
+
+    def test_read_timeout(self):
+        client = self.make_client(timeout=(1, 0.1))
+        with FakeTelegramServer() as server:
+            server.delay = 0.3
+            with self.assertRaisesRegex(requests.exceptions.RequestException, 'Read timed out'):
+                client.post(f'{server.url}/send', json={})
+        self.assertEqual(len(server.messages), 1)
+
+    def test_circuit_breaker_opens_and_recovers(self):
+        client = self.make_client(retries=0, failure_threshold=2, reset_timeout=60)
+        now = [0]
+        client.breaker.clock = lambda: now[0]
+        with FakeTelegramServer() as server:
+            server.status = 502
+            for _ in range(2):
+                with self.assertRaises(requests.exceptions.HTTPError):
+                    client.post(f'{server.url}/send', json={})
+            with self.assertRaises(CircuitOpen):
+                client.post(f'{server.url}/send', json={})
+            self.assertEqual(len(server.messages), 2)
+
+            now[0] = 61
+            server.status = 200
+            client.post(f'{server.url}/send', json={})
+        self.assertEqual(client.breaker.state, 'closed')
+        self.assertEqual(client.snapshot()['rejected'], 1)
+
+
+@override_settings(TELEGRAM_DIGEST_WINDOW=30, TELEGRAM_DIGEST_SIZE=5, TELEGRAM_RATE_LIMIT='20/min')
+class DigestNotificationTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        telegram_client.breaker.reset()
+
+    def post_contacts(self, n):
+        for i in range(n):
+            self.client.post('/api/contacts/', {
+                'full_name': f"Mijoz {i}", 'phone_number': '+998901234567',
+                'email': f'mijoz{i}@example.com', 'message': "Salom",
+            }, REMOTE_ADDR=f'10.0.0.{i}')
+
+    def test_burst_is_coalesced_into_one_digest(self):
+        self.post_contacts(7)
+        self.assertEqual(Notification.objects.values('next_attempt_at').distinct().count(), 1)
+        with FakeTelegramServer() as telegram:
+            # Oyna tugamaguncha hech narsa yuborilmaydi
+            self.assertEqual(dispatch_pending(), (0, 0))
+            Notification.objects.update(next_attempt_at=timezone.now())
+            self.assertEqual(dispatch_pending(), (7, 0))
+
+        self.assertEqual(len(telegram.messages), 1)
+        text = telegram.messages[0][1]['text']
+        self.assertTrue(text.startswith("📩 Yangi murojaatlar: 7 ta"))
+        self.assertIn("Mijoz 4", text)
+        self.assertNotIn("Mijoz 5", text)
+        self.assertTrue(text.endswith("... va yana 2 ta"))
+
+    def test_digest_covers_whole_group_beyond_batch_size(self):
+        self.post_contacts(7)
+        Contact.objects.create(full_name="<Ali>", phone_number='1', email='a@example.com', message="1 < 2 & 3")
+        enqueue(format_contact_message(Contact.objects.latest('pk')), group='contact')
+        Notification.objects.update(next_attempt_at=timezone.now())
+        with FakeTelegramServer() as telegram:
+            self.assertEqual(dispatch_pending(batch_size=3), (8, 0))
+
+        self.assertEqual(len(telegram.messages), 1)
+        self.assertTrue(telegram.messages[0][1]['text'].startswith("📩 Yangi murojaatlar: 8 ta"))
+        self.assertIn("Xabar: 1 &lt; 2 &amp; 3", Notification.objects.latest('pk').message)
+
+    @override_settings(TELEGRAM_DIGEST_WINDOW=0, TELEGRAM_RATE_LIMIT='2/min', TELEGRAM_RATE_BURST=2)
+    def test_chat_rate_limit_defers_the_rest(self):
+        self.post_contacts(5)
+        with FakeTelegramServer() as telegram:
+            self.assertEqual(dispatch_pending(), (2, 0))
+            self.assertEqual(dispatch_pending(), (0, 0))
+
+        self.assertEqual(len(telegram.messages), 2)
+        deferred = Notification.objects.filter(status=Notification.STATUS_PENDING)
+        self.assertEqual(deferred.count(), 3)
+        self.assertFalse(deferred.filter(attempts__gt=0).exists())
+        self.assertFalse(deferred.filter(next_attempt_at__lte=timezone.now()).exists())
+
+    def test_token_bucket_refills_over_time(self):
+        now = [1000.0]
+        bucket = TokenBucket('test', '60/min', capacity=2, clock=lambda: now[0])
+        self.assertEqual(bucket.consume(), (True, 0))
+        self.assertEqual(bucket.consume(), (True, 0))
+        allowed, wait = bucket.consume()
+        self.assertFalse(allowed)
+        self.assertAlmostEqual(wait, 1.0)
+        now[0] += 1
+        self.assertEqual(bucket.consume(), (True, 0))
+
+
+class ContactAbuseTests(APITestCase):
+    def post(self, ip='10.0.0.1', **data):
+        return self.client.post('/api/contacts/', {
+            'full_name': "Vali", 'phone_number': '+998901234567',
+            'email': 'vali@example.com', 'message': "Salom", **data,
+        }, REMOTE_ADDR=ip)
+
+    def test_per_ip_throttle_rejects_without_queries(self):
+        for i in range(5):
+            self.assertEqual(self.post(message=f"Xabar {i}").status_code, 201)
+        with self.assertNumQueries(0):
+            response = self.post(message="Yana")
+        self.assertEqual(response.status_code, 429)
+        self.assertIn('Retry-After', response)
+        # Boshqa IP cheklanmaydi
+        self.assertEqual(self.post(ip='10.0.0.2', message="Yana").status_code, 201)
+
+    def test_global_throttle(self):
+        rates = {**api_settings.DEFAULT_THROTTLE_RATES, 'contact_global': '3/min'}
+        with override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': rates}):
+            statuses = [self.post(ip=f'10.0.1.{i}', message=f"Xabar {i}").status_code for i in range(4)]
+        self.assertEqual(statuses, [201, 201, 201, 429])
+
+    def test_blocked_ip_does_not_use_global_limit(self):
+        rates = {**api_settings.DEFAULT_THROTTLE_RATES, 'contact_global': '10/min'}
+        with override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': rates}):
+            statuses = [self.post(message=f"Xabar {i}").status_code for i in range(20)]
+            self.assertEqual(statuses.count(429), 15)
+            self.assertEqual(self.post(ip='10.0.0.2', message="Boshqa").status_code, 201)
+
+    def test_duplicate_message_is_rejected_before_db(self):
+        self.assertEqual(self.post(message="Suv  yo'q").status_code, 201)
+        with self.assertNumQueries(0):
+            response = self.post(ip='10.0.0.9', email='VALI@example.com', message="Suv yo'q")
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(Contact.objects.count(), 1)
+
+    def test_invalid_payload_does_not_reserve_fingerprint(self):
+        self.assertEqual(self.post(message="x" * 5001).status_code, 400)
+        self.assertEqual(self.post(email='yaroqsiz').status_code, 400)
+        self.assertEqual(self.post().status_code, 201)
+
+
+class ContactBulkTests(APITestCase):
+    def setUp(self):
+        from django.contrib.auth.models import User
+        super().setUp()
+        self.client.force_authenticate(User.objects.create_superuser('admin', 'admin@example.com', 'parol'))
+        Contact.objects.bulk_create([
+            Contact(full_name=f"Mijoz {i}", phone_number='1', email='a@example.com', message='x', is_read=i % 2 == 0)
+            for i in range(6)
+        ])
+        rebuild_contact_counters()
+
+    def test_bulk_by_ids_is_one_update(self):
+        ids = list(Contact.objects.filter(is_read=False).values_list('pk', flat=True))
+        before = Contact.objects.get(pk=ids[0]).updated_date
+        # Kunlar bo'yicha sanash, bitta UPDATE, hisoblagich UPDATE, savepoint/release
+        with self.assertNumQueries(5):
+            response = self.client.post('/api/contacts/bulk/', {'action': 'mark_as_read', 'ids': ids}, format='json')
+        self.assertEqual(response.data, {'action': 'mark_as_read', 'count': 3})
+        self.assertFalse(Contact.objects.filter(is_read=False).exists())
+        self.assertGreater(Contact.objects.get(pk=ids[0]).updated_date, before)
+
+    def test_bulk_by_filter(self):
+        response = self.client.post('/api/contacts/bulk/', {'action': 'mark_as_unread', 'is_read': True}, format='json')
+        self.assertEqual(response.data['count'], 3)
+        with self.assertNumQueries(5):
+            response = self.client.post('/api/contacts/bulk/', {'action': 'delete', 'is_read': False}, format='json')
+        self.assertEqual(response.data, {'action': 'delete', 'count': 6})
+        self.assertFalse(Contact.objects.exists())
+        self.assertEqual(check_contact_counters(), {})
+
+    def test_concurrent_change_does_not_drift_counters(self):
+        contact = Contact.objects.filter(is_read=False).first()
+        queryset = Contact.objects.filter(pk=contact.pk)
+        # Ikkinchi so'rov qatorlarni birinchisi o'zgartirishidan oldin o'qigan
+        stale = counters._lock_contacts(queryset)
+        self.assertEqual(set_contacts_read(queryset, True), 1)
+        with mock.patch.object(counters, '_lock_contacts', return_value=stale):
+            self.assertEqual(set_contacts_read(queryset, True), 0)
+        self.assertEqual(delete_contacts(queryset), 1)
+        with mock.patch.object(counters, '_lock_contacts', return_value=stale):
+            self.assertEqual(delete_contacts(queryset), 0)
+        self.assertEqual(check_contact_counters(), {})
+        self.assertEqual(contact_summary(), {'total': 5, 'unread': 2, 'today': 5})
+
+    def test_bulk_requires_ids_or_filter_and_admin(self):
+        self.assertEqual(self.client.post('/api/contacts/bulk/', {'action': 'delete'}, format='json').status_code, 400)
+        self.client.force_authenticate(None)
+        self.assertEqual(self.client.post('/api/contacts/bulk/', {'action': 'delete', 'ids': [1]}, format='json').status_code, 403)
+        self.assertEqual(Contact.objects.count(), 6)
+
+    def test_single_mark_as_read_updates_only_changed_columns(self):
+        contact = Contact.objects.filter(is_read=False).first()
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.patch(f'/api/contacts/{contact.pk}/mark_as_read/')
+        update, = [q['sql'] for q in ctx.captured_queries if q['sql'].startswith('UPDATE "core_contact"')]
+        self.assertNotIn('"message"', update)
+        contact.refresh_from_db()
+        self.assertTrue(contact.is_read)
+
+
+class ContactSummaryTests(APITestCase):
+    def setUp(self):
+        from django.contrib.auth.models import User
+        super().setUp()
+        self.admin = User.objects.create_superuser('admin', 'admin@example.com', 'parol')
+        self.client.force_authenticate(self.admin)
+
+    def summary(self):
+        return self.client.get('/api/contacts/summary/').data
+
+    def create_contacts(self, n):
+        client = APIClient()
+        for i in range(n):
+            client.post('/api/contacts/', {
+                'full_name': "Vali", 'phone_number': '1', 'email': 'vali@example.com', 'message': f"Xabar {i}",
+            }, REMOTE_ADDR=f'10.0.2.{i}')
+        return list(Contact.objects.order_by('pk'))
+
+    def test_summary_follows_create_read_and_delete(self):
+        first, second, third = self.create_contacts(3)
+        old = Contact.objects.create(full_name="Eski", phone_number='1', email='e@example.com', message='x')
+        Contact.objects.filter(pk=old.pk).update(created_date=timezone.now() - timedelta(days=3))
+        rebuild_contact_counters()
+        with self.assertNumQueries(1):
+            self.assertEqual(self.summary(), {'total': 4, 'unread': 4, 'today': 3})
+
+        self.client.patch(f'/api/contacts/{first.pk}/mark_as_read/')
+        self.client.patch(f'/api/contacts/{first.pk}/mark_as_read/')
+        self.client.post('/api/contacts/bulk/', {'action': 'mark_as_read', 'ids': [second.pk, old.pk]}, format='json')
+        self.client.post('/api/contacts/bulk/', {'action': 'mark_as_unread', 'ids': [second.pk]}, format='json')
+        self.client.delete(f'/api/contacts/{third.pk}/')
+        self.assertEqual(self.summary(), {'total': 3, 'unread': 1, 'today': 2})
+        self.assertEqual(check_contact_counters(), {})
+
+    def test_admin_actions_keep_counters(self):
+        contacts = self.create_contacts(2)
+        self.client.force_login(self.admin)
+        self.client.post('/admin/core/contact/', {
+            'action': 'mark_as_read', '_selected_action': [c.pk for c in contacts],
+        })
+        self.assertEqual(self.summary()['unread'], 0)
+        self.client.post('/admin/core/contact/', {
+            'action': 'mark_as_unread', '_selected_action': [contacts[0].pk],
+        })
+        self.assertEqual(self.summary()['unread'], 1)
+        self.assertEqual(check_contact_counters(), {})
+
+    def test_check_and_rebuild_command(self):
+        self.create_contacts(2)
+        ContactCounter.objects.update(unread=5)
+        with self.assertRaises(CommandError):
+            call_command('rebuild_contact_counters', check=True, stdout=StringIO())
+        call_command('rebuild_contact_counters', stdout=StringIO())
+        call_command('rebuild_contact_counters', check=True, stdout=StringIO())
+        self.assertEqual(self.summary()['unread'], 2)
+
+    def test_summary_is_admin_only(self):
+        self.client.force_authenticate(None)
+        self.assertEqual(self.client.get('/api/contacts/summary/').status_code, 403)
+
+
+def make_image(width, height, mode='RGBA', name='rasm.png'):
+    buffer = BytesIO()
+    Image.new(mode, (width, height), (0, 120, 200, 128) if mode == 'RGBA' else (0, 120, 200)).save(buffer, 'PNG')
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/png')
+
+
+@override_settings(IMAGE_VARIANT_WORKERS=0)
+class ImageVariantTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.media_root = tempfile.mkdtemp()
+        override = override_settings(MEDIA_ROOT=self.media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+
+    def create_banner(self, image):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Banner.objects.create(title="Banner", image=image)
+
+    def test_variants_generated_after_commit(self):
+        banner = self.create_banner(make_image(1000, 500))
+        banner.refresh_from_db()
+        variants = banner.image_variants
+        self.assertEqual(variants['source'], banner.image.name)
+        self.assertEqual(set(variants['webp']), {'320', '640', '1000'})
+        self.assertEqual(set(variants['jpeg']), {'320', '640', '1000'})
+        with default_storage.open(variants['jpeg']['320']) as f:
+            image = Image.open(f)
+            self.assertEqual((image.format, image.size, image.mode), ('JPEG', (320, 160), 'RGB'))
+        with default_storage.open(variants['webp']['640']) as f:
+            self.assertEqual(Image.open(f).format, 'WEBP')
+
+        data = self.client.get('/api/banners/').json()['results'][0]
+        self.assertNotIn('image_variants', data)
+        self.assertEqual(
+            data['image_srcset']['webp']['320'],
+            'http://testserver/media/' + variants['webp']['320'],
+        )
+
+    def test_small_image_not_upscaled(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            link = UsefulLink.objects.create(name="Havola", link='https://example.com', icon=make_image(64, 64, 'RGB'))
+        link.refresh_from_db()
+        self.assertEqual(list(link.icon_variants['webp']), ['64'])
+
+    def test_replaced_image_removes_old_variants(self):
+        banner = self.create_banner(make_image(400, 400))
+        banner.refresh_from_db()
+        old = banner.image_variants['webp']['320']
+        banner.image = make_image(800, 400, name='yangi.png')
+        with self.captureOnCommitCallbacks(execute=True):
+            banner.save()
+        banner.refresh_from_db()
+        self.assertFalse(default_storage.exists(old))
+        self.assertIn('yangi', banner.image_variants['webp']['320'])
+
+    def test_deleted_object_removes_variants(self):
+        banner = self.create_banner(make_image(400, 400))
+        banner.refresh_from_db()
+        names = list(banner.image_variants['webp'].values()) + list(banner.image_variants['jpeg'].values())
+        with self.captureOnCommitCallbacks(execute=True):
+            banner.delete()
+        self.assertFalse(any(default_storage.exists(name) for name in names))
+
+    def test_unchanged_image_not_regenerated(self):
+        banner = self.create_banner(make_image(400, 400))
+        banner.refresh_from_db()
+        banner.title = "Yangi sarlavha"
+        with self.captureOnCommitCallbacks() as callbacks:
+            banner.save()
+        self.assertFalse(any('schedule_variants' in callback.__qualname__ for callback in callbacks))
+        self.assertFalse(generate_variants(Banner, banner.pk))
+
+    def test_backfill_command(self):
+        banner = self.create_banner(make_image(400, 200))
+        Banner.objects.filter(pk=banner.pk).update(image_variants={})
+        call_command('build_image_variants', stdout=StringIO())
+        banner.refresh_from_db()
+        self.assertEqual(set(banner.image_variants['jpeg']), {'320', '400'})
+        self.assertTrue(os.path.exists(os.path.join(self.media_root, banner.image_variants['jpeg']['400'])))
+
+
+class HomeTests(APITestCase):
+    @override_settings(HITCOUNT_FLUSH_INTERVAL=None)
+    def test_view_counts_refresh_cache_and_etag_together(self):
+        news = create_news(1)[0]
+        etag = self.client.get('/api/home/')['ETag']
+        self.client.get(f'/api/news/{news.pk}/increment_views/')
+        hit_buffer.flush()
+        response = self.client.get('/api/home/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.json()['news'][0]['views_count'], 1)
+        hit_buffer._known.clear()
+
+    def test_sections_are_bounded(self):
+        create_news(8)
+        Banner.objects.create(title="Banner", title_ru="Баннер", image='banners/a.jpg')
+        Statistics.objects.create(xodimlar=7)
+        data = self.client.get('/api/home/').json()
+        self.assertEqual(
+            set(data), {'banners', 'statistics', 'useful_links', 'news', 'interactive_services', 'about'}
+        )
+        self.assertEqual(len(data['news']), 6)
+        self.assertEqual(data['news'][0]['title'], "Yangilik 7")
+        self.assertNotIn('content', data['news'][0])
+        self.assertEqual(data['statistics']['xodimlar'], 7)
+        self.assertIsNone(data['about'])
+
+        data = self.client.get('/api/home/?lang=ru').json()
+        self.assertEqual(data['banners'][0]['title'], "Баннер")
+        self.assertNotIn('title_ru', data['banners'][0])
+
+    def test_served_from_one_cache_entry(self):
+        create_news(2)
+        self.client.get('/api/home/')
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/home/')
+        self.assertEqual(response['X-Cache'], 'HIT')
+
+        UsefulLink.objects.create(name="Havola", link='https://example.com', icon='links_icons/a.png')
+        response = self.client.get('/api/home/')
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual([link['name'] for link in response.json()['useful_links']], ["Havola"])
+
+
+class ContentPipelineTests(APITestCase):
+    def test_html_is_sanitized(self):
+        self.assertEqual(
+            sanitize_html(
+                '<p onclick="x()">Salom   <b>dunyo</b>\n<script>alert(1)</script></p>'
+                '<a href="javascript:alert(1)">havola</a><img src="/media/a.png" onerror="y()"><div>ochiq'
+            ),
+            '<p>Salom <b>dunyo</b> </p><a>havola</a><img src="/media/a.png"><div>ochiq</div>',
+        )
+
+    def test_derived_columns_filled_on_save(self):
+        news = create_news(1)[0]
+        news.content = '<p>So&#39;z &amp; matn</p>' + '<p>so\'z</p>' * 450
+        news.content_ru = '<p>Текст</p>'
+        news.save()
+        news.refresh_from_db()
+        self.assertTrue(news.plain_text.startswith("So'z & matn so'z"))
+        self.assertEqual(news.plain_text_ru, "Текст")
+        self.assertEqual(news.excerpt_uz_cyrl, '')
+        self.assertLessEqual(len(news.excerpt), 200)
+        self.assertEqual(news.minutes_to_read, 3)
+
+        News.objects.filter(pk=news.pk).update(plain_text='eski')
+        news.title = "Yangi sarlavha"
+        news.save(update_fields=['title'])
+        news.refresh_from_db()
+        self.assertEqual(news.plain_text, 'eski')
+
+    def test_source_html_is_kept_and_api_returns_clean_html(self):
+        source = (
+            '<p>Video</p><iframe src="https://www.youtube.com/embed/abc" allowfullscreen></iframe>'
+            '<iframe src="https://evil.example/x"></iframe><script>alert(1)</script>'
+        )
+        decision = Decision.objects.create(title="Qaror", content=source, content_ru="<p>Текст</p>", slug="qaror")
+        decision.refresh_from_db()
+        self.assertEqual(decision.content, source)
+        clean = '<p>Video</p><iframe src="https://www.youtube.com/embed/abc" allowfullscreen=""></iframe>'
+        self.assertEqual(decision.clean_html, clean)
+
+        detail = self.client.get(f'/api/decisions/{decision.pk}/').json()
+        self.assertEqual(detail['content'], clean)
+        self.assertNotIn('clean_html', detail)
+        self.assertEqual(self.client.get(f'/api/decisions/{decision.pk}/?lang=ru').json()['content'], "<p>Текст</p>")
+
+    def test_list_reads_stored_excerpt(self):
+        decision = Decision.objects.create(title="Qaror", content="<p>Qaror <i>matni</i></p>", slug="qaror")
+        with CaptureQueriesContext(connection) as ctx:
+            item = self.client.get('/api/decisions/?lang=ru').data['results'][0]
+        self.assertEqual(item['excerpt'], 'Qaror matni')
+        select = [q['sql'] for q in ctx.captured_queries if 'FROM "core_decision"' in q['sql']][-1]
+        self.assertNotIn('"core_decision"."content', select)
+        self.assertNotIn('plain_text', select)
+        detail = self.client.get(f'/api/decisions/{decision.pk}/').data
+        self.assertEqual(detail['content'], '<p>Qaror <i>matni</i></p>')
+        self.assertNotIn('plain_text', detail)
+
+    def test_rebuild_content_command(self):
+        News.objects.bulk_create([
+            News(title="Yangilik", content='<p>Matn</p>', main_image='news/a.jpg', slug='yangilik')
+        ])
+        call_command('rebuild_content', stdout=StringIO())
+        news = News.objects.get()
+        self.assertEqual((news.plain_text, news.excerpt, news.minutes_to_read), ('Matn', 'Matn', 1))
+
+
+class StatisticsHistoryTests(APITestCase):
+    def create_snapshot(self, created_date, **kwargs):
+        stats = Statistics.objects.create(**kwargs)
+        Statistics.objects.filter(pk=stats.pk).update(created_date=created_date)
+        return stats
+
+    def test_latest_snapshot_is_deterministic(self):
+        now = timezone.now()
+        newest = self.create_snapshot(now, xodimlar=3)
+        self.create_snapshot(now - timedelta(days=1), xodimlar=2)
+        self.assertEqual(Statistics.objects.current(), newest)
+        self.assertEqual(self.client.get('/api/statistics/').json()['xodimlar'], 3)
+
+    def test_history_is_bucketed(self):
+        now = timezone.localtime().replace(hour=12)
+        self.create_snapshot(now - timedelta(days=40), xodimlar=1)
+        self.create_snapshot(now - timedelta(days=1), xodimlar=2)
+        self.create_snapshot(now - timedelta(hours=1), xodimlar=3)
+        self.create_snapshot(now, xodimlar=4)
+
+        data = self.client.get('/api/statistics/history/?bucket=day').json()
+        self.assertEqual(data['bucket'], 'day')
+        self.assertEqual([row['xodimlar'] for row in data['results']][-2:], [2, 4])
+        self.assertEqual(data['results'][-1]['period'], timezone.localdate(now).isoformat())
+
+        data = self.client.get('/api/statistics/history/?bucket=year').json()
+        self.assertEqual([row['xodimlar'] for row in data['results']][-1], 4)
+
+        data = self.client.get('/api/statistics/history/?bucket=day&limit=1').json()
+        self.assertEqual([row['xodimlar'] for row in data['results']], [4])
+
+    def test_history_is_revalidated(self):
+        self.create_snapshot(timezone.now(), xodimlar=1)
+        response = self.client.get('/api/statistics/history/')
+        self.assertEqual(response['Cache-Control'], 'no-cache')
+        self.assertNotIn('Expires', response)
+        etag = response['ETag']
+        self.assertEqual(self.client.get('/api/statistics/history/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        Statistics.objects.create(xodimlar=2)
+        response = self.client.get('/api/statistics/history/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['results'][-1]['xodimlar'], 2)
+
+    def test_history_validates_params(self):
+        self.assertEqual(self.client.get('/api/statistics/history/?bucket=week').status_code, 400)
+        self.assertEqual(self.client.get('/api/statistics/history/?limit=1000').status_code, 400)
+
+
+class SingletonCacheTests(APITestCase):
+    def create_about(self, name, **kwargs):
+        return About.objects.create(
+            inn='123', qisqacha_nomlanishi=name, tashkiliy_huquqiy_shakli="DM",
+            tashkilot_faoliyatining_holati="Faol", tasischi="Vazirlik", hudud='toshkent_shahri',
+            tuman="Yunusobod", manzil="Manzil", davlat_ulishi=100, xojalik_ulishi=0, **kwargs
+        )
+
+    def test_repeat_requests_skip_database(self):
+        self.create_about("Birinchi")
+        self.create_about("Ikkinchi", qisqacha_nomlanishi_ru="Второй")
+        response = self.client.get('/api/about/')
+        self.assertEqual((response['X-Cache'], response.json()['qisqacha_nomlanishi']), ('MISS', "Ikkinchi"))
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/about/')
+        self.assertEqual((response['X-Cache'], response.json()['qisqacha_nomlanishi']), ('HIT', "Ikkinchi"))
+
+        # Til bo'yicha alohida yozuv
+        self.assertEqual(self.client.get('/api/about/?lang=ru').json()['qisqacha_nomlanishi'], "Второй")
+
+    def test_save_and_delete_refresh_entry(self):
+        about = self.create_about("Eski")
+        self.client.get('/api/about/')
+        About.objects.filter(pk=about.pk).update(qisqacha_nomlanishi="Yangi")
+        # update() signal yubormaydi, versiya o'zgarmagan
+        self.assertEqual(self.client.get('/api/about/').json()['qisqacha_nomlanishi'], "Eski")
+        about.refresh_from_db()
+        about.save()
+        self.assertEqual(self.client.get('/api/about/').json()['qisqacha_nomlanishi'], "Yangi")
+        about.delete()
+        self.assertEqual(self.client.get('/api/about/').json(), {})
+
+    def test_browsable_api_is_not_cached(self):
+        Statistics.objects.create(xodimlar=9)
+        response = self.client.get('/api/statistics/', HTTP_ACCEPT='text/html')
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('X-Cache', response)
+
+
+class AsyncViewTests(APITestCase):
+    async def test_list_and_retrieve_match_sync_endpoints(self):
+        news = await sync_to_async(create_news)(12, title_ru="Новость")
+        sync_data = await sync_to_async(lambda: self.client.get('/api/news/?page=2&lang=ru').json())()
+        response = await self.async_client.get('/api/async/news/', {'page': 2, 'lang': 'ru'})
+        self.assertEqual(response['X-Cache'], 'MISS')
+        data = response.json()
+        self.assertEqual(data['count'], 12)
+        self.assertIsNone(data['next'])
+        self.assertEqual(data['previous'], 'http://testserver/api/async/news/?lang=ru')
+        self.assertEqual(data['results'], sync_data['results'])
+
+        response = await self.async_client.get('/api/async/news/', {'page': 2, 'lang': 'ru'})
+        self.assertEqual(response['X-Cache'], 'HIT')
+
+        response = await self.async_client.get(f'/api/async/news/{news[0].pk}/')
+        self.assertEqual(response.json()['content'], news[0].content)
+        self.assertEqual((await self.async_client.get('/api/async/news/0/')).status_code, 404)
+        self.assertEqual((await self.async_client.get('/api/async/news/?page=9')).status_code, 404)
+
+    async def test_changes_invalidate_async_cache(self):
+        await self.async_client.get('/api/async/banners/')
+        await Banner.objects.acreate(title="Banner", image='banners/a.jpg')
+        data = (await self.async_client.get('/api/async/banners/')).json()
+        self.assertEqual([item['title'] for item in data['results']], ["Banner"])
+
+        await Statistics.objects.acreate(xodimlar=5)
+        self.assertEqual((await self.async_client.get('/api/async/statistics/')).json()['xodimlar'], 5)
+
+    async def test_unsupported_params_use_sync_view(self):
+        await sync_to_async(create_news)(1)
+        await sync_to_async(create_news)(2, category="Suv")
+        response = await self.async_client.get('/api/async/news/', {'category': 'Suv'})
+        self.assertEqual(response.json()['count'], 2)
+
+    async def test_contact_create(self):
+        payload = {
+            'full_name': "Ali", 'phone_number': '+998901234567',
+            'email': 'ali@example.com', 'message': "Async murojaat",
+        }
+        response = await self.async_client.post('/api/async/contacts/', payload, content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        response = await self.async_client.post('/api/async/contacts/', payload, content_type='application/json')
+        self.assertEqual(response.status_code, 409)
+        response = await self.async_client.post('/api/async/contacts/', {'email': 'x'}, content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        response = await self.async_client.post('/api/async/contacts/', '{bad json', content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        response = await self.async_client.post('/api/async/contacts/', 'x', content_type='text/csv')
+        self.assertEqual(response.status_code, 415)
+        self.assertEqual(await Contact.objects.acount(), 1)
+        self.assertEqual(await Notification.objects.filter(group='contact').acount(), 1)
@@ -0,0 +1,81 @@
+"""
+Ochiq endpointlar (murojaat yuborish) uchun kesh asosidagi cheklovlar.
+Hammasi faqat keshga murojaat qiladi, shuning uchun rad etilgan so'rov
+bazaga ham, Telegramga ham yetib bormaydi.
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+from .ratelimit import TokenBucket
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    DEFAULT_THROTTLE_RATES[scope] tezligidagi token bucket; get_cache_key
+    None qaytarsa so'rov cheklanmaydi
+    """
+    scope = None
+
+    def get_cache_key(self, request, view):
+        raise NotImplementedError
+
+    def allow_request(self, request, view):
+        key = self.get_cache_key(request, view)
+        rate = api_settings.DEFAULT_THROTTLE_RATES.get(self.scope)
+        if key is None or rate is None:
+            return True
+        allowed, self._wait = TokenBucket(f'throttle:{self.scope}:{key}', rate).consume()
+        return allowed
+
+    def wait(self):
+        return self._wait
+
+
+class ContactIPThrottle(TokenBucketThrottle):
+    """Bitta IP manzildan murojaatlar"""
+    scope = 'contact'
+
+    def get_cache_key(self, request, view):
+        return self.get_ident(request)
+
+
+class ContactGlobalThrottle(TokenBucketThrottle):
+    """Barcha manzillardan jami murojaatlar"""
+    scope = 'contact_global'
+
+    def get_cache_key(self, request, view):
+        return 'all'
+
+
+def contact_fingerprint(email, message):
+    """(email, xabar) juftligi uchun kesh kaliti"""
+    normalized = f"{email.strip().lower()}\0{' '.join(message.split())}"
+    return 'contact-fingerprint:' + hashlib.sha256(normalized.encode()).hexdigest()
+
+
+def claim_contact_fingerprint(email, message):
+    """
+    (email, xabar) juftligini CONTACT_DUPLICATE_WINDOW soniyaga band qilish.
+    Xuddi shu xabar shu vaqt ichida yuborilgan bo'lsa None, aks holda kalitni
+    qaytaradi (saqlashda xatolik bo'lsa release_contact_fingerprint bilan bo'shatiladi)
+    """
+    key = contact_fingerprint(email, message)
+    if cache.add(key, 1, settings.CONTACT_DUPLICATE_WINDOW):
+        return key
+    return None
+
+
+async def aclaim_contact_fingerprint(email, message):
+    """claim_contact_fingerprint ning async varianti"""
+    key = contact_fingerprint(email, message)
+    if await cache.aadd(key, 1, settings.CONTACT_DUPLICATE_WINDOW):
+        return key
+    return None
+
+
+def release_contact_fingerprint(key):
+    cache.delete(key)
@@ -1,7 +1,7 @@
 # core/urls.py
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from . import views
+from . import async_views, views
 
 router = DefaultRouter()
 router.register(r'banners', views.BannerViewSet)
@@ -16,7 +16,44 @@ router.register(r'job-vacancies', views.JobVacancyViewSet)
 router.register(r'interactive-services', views.InteractiveServiceViewSet)
 router.register(r'decisions', views.DecisionViewSet)
 router.register(r'contacts', views.ContactViewSet)
+router.register(r'home', views.HomeViewSet, basename='home')
+
+# Ochiq o'qish endpointlarining async (ASGI) variantlari
+ASYNC_LIST_VIEWSETS = {
+    'banners': views.BannerViewSet,
+    'useful-links': views.UsefulLinkViewSet,
+    'news': views.NewsViewSet,
+    'leadership': views.LeadershipViewSet,
+    'job-vacancy-departments': views.JobVacancyDepartmentViewSet,
+    'type-of-works': views.TypeOfWorkViewSet,
+    'job-vacancies': views.JobVacancyViewSet,
+    'interactive-services': views.InteractiveServiceViewSet,
+    'decisions': views.DecisionViewSet,
+}
+ASYNC_SINGLETON_VIEWSETS = {
+    'statistics': views.StatisticsViewSet,
+    'about': views.AboutViewSet,
+}
+
+async_urlpatterns = [
+    path('contacts/', async_views.AsyncContactCreateView.as_view(), name='async-contact-create'),
+]
+for prefix, viewset in ASYNC_LIST_VIEWSETS.items():
+    async_urlpatterns += [
+        path(f'{prefix}/', async_views.AsyncReadView.as_view(viewset=viewset), name=f'async-{prefix}-list'),
+        path(
+            f'{prefix}/<int:pk>/', async_views.AsyncReadView.as_view(viewset=viewset, action='retrieve'),
+            name=f'async-{prefix}-detail',
+        ),
+    ]
+for prefix, viewset in ASYNC_SINGLETON_VIEWSETS.items():
+    async_urlpatterns.append(
+        path(f'{prefix}/', async_views.AsyncSingletonView.as_view(viewset=viewset), name=f'async-{prefix}-list')
+    )
 
 urlpatterns = [
+    path('async/', include(async_urlpatterns)),
+    path('cache-stats/', views.CacheStatsView.as_view(), name='cache-stats'),
+    path('search/', views.SearchView.as_view(), name='search'),
     path('', include(router.urls)),
 ]
\ No newline at end of file
@@ -1,21 +1,279 @@
 import requests
 from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import html
 import logging
+import re
+import threading
+import time
+import unicodedata
 
 logger = logging.getLogger(__name__)
 
-def send_telegram_message(message):
+# Til kodlari va ularga mos maydon qo'shimchalari (title, title_ru, title_uz_cyrl)
+LANGUAGE_SUFFIXES = {
+    'uz': '',
+    'ru': '_ru',
+    'uz-cyrl': '_uz_cyrl',
+}
+
+EXCERPT_LENGTH = 200
+TAG_RE = re.compile(r'<[^>]*>')
+
+# Qidiruv uchun o'zbek/rus kirill harflarining lotincha yozilishi
+CYRILLIC_TO_LATIN = {
+    'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'ғ': 'g', 'д': 'd', 'е': 'e', 'ё': 'yo',
+    'ж': 'j', 'з': 'z', 'и': 'i', 'й': 'y', 'к': 'k', 'қ': 'q', 'л': 'l', 'м': 'm',
+    'н': 'n', 'о': 'o', 'ў': 'o', 'п': 'p', 'р': 'r', 'с': 's', 'т': 't', 'у': 'u',
+    'ф': 'f', 'х': 'x', 'ҳ': 'h', 'ц': 's', 'ч': 'ch', 'ш': 'sh', 'щ': 'sh', 'ъ': '',
+    'ы': 'i', 'ь': '', 'э': 'e', 'ю': 'yu', 'я': 'ya',
+}
+# o' / oʻ / o‘ / o` kabi tutuq belgisi variantlari
+APOSTROPHES = "'`´ʹʻʼʽ‘’‛′"
+TRANSLITERATION = str.maketrans({
+    **CYRILLIC_TO_LATIN,
+    **{char: '' for char in APOSTROPHES},
+})
+WORD_RE = re.compile(r'\w+')
+SEARCH_KEY_LENGTH = 500
+
+
+def html_to_text(value):
     """
-    Telegram bot orqali xabar yuborish
+    HTML matnni teglarsiz oddiy matnga aylantirish
+    """
+    if not value:
+        return ''
+    if value.rfind('<') > value.rfind('>'):
+        # Qirqilgan matn oxiridagi yopilmagan tegni tashlab yuborish
+        value = value[:value.rfind('<')]
+    return ' '.join(html.unescape(TAG_RE.sub(' ', value)).split())
+
+
+def normalize_search_text(value):
+    """
+    Qidiruv uchun matnni yagona ko'rinishga keltirish: kichik harf, kirilldan
+    lotinga o'girish, tutuq belgilari va diakritikalarni olib tashlash
+    """
+    value = (value or '').casefold().translate(TRANSLITERATION)
+    value = unicodedata.normalize('NFKD', value)
+    return ''.join(char for char in value if not unicodedata.combining(char))
+
+
+def search_words(value):
+    """Normallashtirilgan matndagi so'zlar"""
+    return WORD_RE.findall(normalize_search_text(value))
+
+
+def build_search_key(obj, fields):
+    """
+    Obyektning barcha tillardagi maydonlaridan qidiruv kaliti: takrorlanmaydigan
+    normallashtirilgan so'zlar, bo'sh joy bilan ajratilgan
+    """
+    words = []
+    for field in fields:
+        for suffix in LANGUAGE_SUFFIXES.values():
+            words += search_words(getattr(obj, f'{field}{suffix}', None))
+    key = ' '.join(dict.fromkeys(words))
+    if len(key) > SEARCH_KEY_LENGTH:
+        key = key[:SEARCH_KEY_LENGTH].rsplit(' ', 1)[0]
+    return key
+
+
+def get_request_language(request):
+    """
+    ?lang= parametridan tilni aniqlash (uz, ru, uz-cyrl), berilmagan bo'lsa None
+    """
+    lang = request.query_params.get('lang', '').lower().replace('_', '-')
+    return lang if lang in LANGUAGE_SUFFIXES else None
+
+
+def translate(obj, field, language_code):
+    """
+    Obyekt maydonining tanlangan tildagi qiymati, bo'lmasa asosiy (lotin) qiymati
+    """
+    value = getattr(obj, f'{field}{LANGUAGE_SUFFIXES.get(language_code, "")}', None)
+    return value or getattr(obj, field)
+
+
+def get_other_language_fields(model, language_code):
+    """
+    Modelning tanlangan tilga kerak bo'lmagan tarjima ustunlari
+    """
+    keep = LANGUAGE_SUFFIXES[language_code]
+    names = {field.name for field in model._meta.concrete_fields}
+    return [
+        f'{name}{suffix}'
+        for name in names
+        for suffix in LANGUAGE_SUFFIXES.values()
+        if suffix and suffix != keep and f'{name}{suffix}' in names
+    ]
+
+
+class CircuitOpen(requests.exceptions.RequestException):
+    """Tashqi xizmat vaqtincha ishlamayapti, so'rov yuborilmadi"""
+    def __init__(self, name, retry_after):
+        super().__init__(f"{name}: circuit ochiq, {retry_after:.0f} soniyadan keyin qayta urinish")
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Ketma-ket failure_threshold ta xatolikdan keyin reset_timeout soniya
+    so'rovlarni to'xtatib turadi, so'ng bitta sinov so'roviga ruxsat beradi
+    """
+    CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half_open'
+    
+    def __init__(self, failure_threshold=5, reset_timeout=30, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self):
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+    
+    def retry_after(self):
+        """Sinov so'rovigacha qolgan vaqt (soniya), yopiq bo'lsa 0"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return 0
+            return max(self.opened_at + self.reset_timeout - self.clock(), 0)
+    
+    def allow(self):
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and self.clock() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                return True
+            return False
+    
+    def record_success(self):
+        with self._lock:
+            self.reset()
+    
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = self.clock()
+
+
+class HttpClient:
+    """
+    Tashqi API lar uchun HTTP mijoz: keep-alive ulanishlar puli (Session),
+    ulanish/javob vaqt chegaralari, cheklangan qayta urinishlar, circuit
+    breaker va kechikish/xatolik statistikasi
+    """
+    # Bu javoblar xizmat ishlamayotganini bildiradi (4xx - bizning xatomiz)
+    RETRY_STATUSES = (429, 502, 503, 504)
+    
+    def __init__(self, name, timeout=(3.05, 10), retries=2, backoff_factor=0.5,
+                 pool_maxsize=10, failure_threshold=5, reset_timeout=30):
+        self.name = name
+        self.timeout = timeout
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self._lock = threading.Lock()
+        self.reset_metrics()
+        
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=0,  # javob kutilayotganda uzilsa, xabar ikki marta yuborilmasligi uchun
+            status=retries,
+            status_forcelist=self.RETRY_STATUSES,
+            # Javob kelgan (status) qayta urinishlar faqat idempotent metodlar
+            # uchun: POST ni server qabul qilgan bo'lishi mumkin. Ulanish
+            # xatolarida so'rov yuborilmagan, ular har qanday metod uchun takrorlanadi
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            backoff_factor=backoff_factor,
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+    
+    def reset_metrics(self):
+        with self._lock:
+            self.metrics = {'requests': 0, 'failures': 0, 'rejected': 0, 'latency_total': 0.0, 'latency_max': 0.0}
+    
+    def snapshot(self):
+        with self._lock:
+            metrics = dict(self.metrics)
+        completed = metrics['requests']
+        return {
+            'name': self.name,
+            'state': self.breaker.state,
+            'requests': completed,
+            'failures': metrics['failures'],
+            'rejected': metrics['rejected'],
+            'avg_latency_ms': round(metrics['latency_total'] / completed * 1000, 1) if completed else 0,
+            'max_latency_ms': round(metrics['latency_max'] * 1000, 1),
+        }
+    
+    def request(self, method, url, **kwargs):
+        """So'rov yuborish; xatolik (jumladan 4xx/5xx) bo'lsa RequestException ko'taradi"""
+        if not self.breaker.allow():
+            with self._lock:
+                self.metrics['rejected'] += 1
+            raise CircuitOpen(self.name, self.breaker.retry_after())
+        
+        kwargs.setdefault('timeout', self.timeout)
+        start = time.perf_counter()
+        try:
+            response = self.session.request(method, url, **kwargs)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            response = getattr(e, 'response', None)
+            if response is None or response.status_code in self.RETRY_STATUSES or response.status_code >= 500:
+                self.breaker.record_failure()
+            else:
+                # Xizmat javob berdi, xato so'rovning o'zida
+                self.breaker.record_success()
+            self._record(start, failed=True)
+            raise
+        self.breaker.record_success()
+        self._record(start, failed=False)
+        return response
+    
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+    
+    def _record(self, start, failed):
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.metrics['requests'] += 1
+            self.metrics['failures'] += failed
+            self.metrics['latency_total'] += elapsed
+            self.metrics['latency_max'] = max(self.metrics['latency_max'], elapsed)
+
+
+telegram_client = HttpClient('telegram')
+
+
+class TelegramNotConfigured(Exception):
+    """Bot token yoki chat ID sozlanmagan"""
+
+
+def post_telegram_message(message):
+    """
+    Telegram bot orqali xabar yuborish, xatolik bo'lsa istisno ko'taradi
     """
     bot_token = settings.TELEGRAM_BOT_TOKEN
     chat_id = settings.TELEGRAM_CHAT_ID
     
     if not bot_token or not chat_id:
-        logger.warning("Telegram bot token yoki chat ID sozlanmagan")
-        return False
+        raise TelegramNotConfigured("Telegram bot token yoki chat ID sozlanmagan")
     
-    url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+    url = f"{settings.TELEGRAM_API_URL}/bot{bot_token}/sendMessage"
     
     payload = {
         'chat_id': chat_id,
@@ -23,11 +281,21 @@ def send_telegram_message(message):
         'parse_mode': 'HTML'
     }
     
+    response = telegram_client.post(url, json=payload)
+    logger.info(f"Telegramga xabar yuborildi: {response.status_code}")
+    return response
+
+
+def send_telegram_message(message):
+    """
+    Telegram bot orqali xabar yuborish
+    """
     try:
-        response = requests.post(url, json=payload)
-        response.raise_for_status()
-        logger.info(f"Telegramga xabar yuborildi: {response.status_code}")
+        post_telegram_message(message)
         return True
+    except TelegramNotConfigured as e:
+        logger.warning(str(e))
+        return False
     except requests.exceptions.RequestException as e:
         logger.error(f"Telegramga xabar yuborishda xatolik: {e}")
-        return False
\ No newline at end of file
+        return False
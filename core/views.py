@@ -1,12 +1,14 @@
 from rest_framework import viewsets, filters, status, mixins
+from rest_framework.views import APIView
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.permissions import IsAuthenticated, AllowAny, IsAdminUser
 from django_filters.rest_framework import DjangoFilterBackend
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
-from django.views.decorators.vary import vary_on_cookie
+from django.conf import settings
 from django.core.cache import cache
+from django.db import transaction
 from django.db.models import Q
 import logging
 
@@ -15,13 +17,22 @@ from drf_spectacular.types import OpenApiTypes
 
 from .models import *
 from .serializers import *
-from .utils import send_telegram_message
+from .filters import NormalizedSearchFilter
+from .search import get_documents, search
+from .throttles import (
+    ContactGlobalThrottle, ContactIPThrottle, claim_contact_fingerprint, release_contact_fingerprint
+)
+from .notifications import enqueue, format_contact_message
+from .utils import get_other_language_fields, get_request_language
+from .cache import SingletonCache, cache_metrics, versioned_cache_page
+from .counters import contact_created, contact_summary, delete_contacts, hit_buffer, set_contacts_read
+from .mixins import ConditionalGetMixin, KeysetPaginationMixin, LanguageMixin, SingletonListMixin
 
 logger = logging.getLogger(__name__)
 
 
 # 1. Banner CRUD
-class BannerViewSet(viewsets.ModelViewSet):
+class BannerViewSet(ConditionalGetMixin, LanguageMixin, viewsets.ModelViewSet):
     """
     Bannerlar uchun to'liq CRUD amallari
     """
@@ -36,8 +47,7 @@ class BannerViewSet(viewsets.ModelViewSet):
             permission_classes = [IsAdminUser]
         return [permission() for permission in permission_classes]
     
-    @method_decorator(cache_page(60 * 60 * 2))
-    @method_decorator(vary_on_cookie)
+    @method_decorator(versioned_cache_page(60 * 60 * 24, Banner))
     def list(self, request, *args, **kwargs):
         """Barcha bannerlarni olish"""
         return super().list(request, *args, **kwargs)
@@ -64,28 +74,29 @@ class BannerViewSet(viewsets.ModelViewSet):
 
 
 # 2. Statistics CRUD
-class StatisticsViewSet(viewsets.ModelViewSet):
+class StatisticsViewSet(ConditionalGetMixin, LanguageMixin, SingletonListMixin, viewsets.ModelViewSet):
     """
     Statistika ma'lumotlari uchun to'liq CRUD amallari
     """
     queryset = Statistics.objects.all()
     serializer_class = StatisticsSerializer
+    singleton_cache = SingletonCache(Statistics)
+    # Tarix ham yangi qiymat qo'shilishi bilan darhol yangilanishi kerak
+    conditional_actions = ('list', 'retrieve', 'history')
     
     def get_permissions(self):
-        if self.action in ['list', 'retrieve']:
+        if self.action in ['list', 'retrieve', 'history']:
             permission_classes = [AllowAny]
         else:
             permission_classes = [IsAdminUser]
         return [permission() for permission in permission_classes]
     
-    @method_decorator(cache_page(60 * 60))
+    def get_singleton(self):
+        return self.get_queryset().current()
+    
     def list(self, request, *args, **kwargs):
         """Eng oxirgi statistikani olish"""
-        latest_stats = self.queryset.last()
-        if latest_stats:
-            serializer = self.get_serializer(latest_stats)
-            return Response(serializer.data)
-        return Response({})
+        return super().list(request, *args, **kwargs)
     
     def create(self, request, *args, **kwargs):
         """Yangi statistika yaratish"""
@@ -108,16 +119,35 @@ class StatisticsViewSet(viewsets.ModelViewSet):
     def destroy(self, request, *args, **kwargs):
         """Statistikani o'chirish"""
         return super().destroy(request, *args, **kwargs)
+    
+    @extend_schema(
+        parameters=[StatisticsHistoryQuerySerializer],
+        responses=StatisticsHistorySerializer(many=True),
+    )
+    @action(detail=False, methods=['get'])
+    @method_decorator(versioned_cache_page(60 * 60 * 24, Statistics))
+    def history(self, request):
+        """
+        Statistika tarixi: har bir kun, oy yoki yil uchun shu davrdagi oxirgi
+        qiymatlar (?bucket=day|month|year, ?limit= davrlar soni)
+        """
+        params = StatisticsHistoryQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        rows = Statistics.objects.history(params.validated_data['bucket'], params.validated_data['limit'])
+        return Response({
+            'bucket': params.validated_data['bucket'],
+            'results': StatisticsHistorySerializer(rows, many=True).data,
+        })
 
 
 # 3. UsefulLink CRUD
-class UsefulLinkViewSet(viewsets.ModelViewSet):
+class UsefulLinkViewSet(ConditionalGetMixin, LanguageMixin, viewsets.ModelViewSet):
     """
     Foydali havolalar uchun to'liq CRUD amallari
     """
     queryset = UsefulLink.objects.all()
     serializer_class = UsefulLinkSerializer
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, NormalizedSearchFilter, filters.OrderingFilter]
     search_fields = ['name', 'name_ru', 'name_uz_cyrl']
     
     def get_permissions(self):
@@ -153,13 +183,14 @@ class UsefulLinkViewSet(viewsets.ModelViewSet):
 
 
 # 4. News CRUD
-class NewsViewSet(viewsets.ModelViewSet):
+class NewsViewSet(ConditionalGetMixin, LanguageMixin, KeysetPaginationMixin, viewsets.ModelViewSet):
     """
     Yangiliklar uchun to'liq CRUD amallari
     """
     queryset = News.objects.all()
+    cache_models = (News, HitCount)
     serializer_class = NewsSerializer
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, NormalizedSearchFilter, filters.OrderingFilter]
     search_fields = ['title', 'title_ru', 'title_uz_cyrl', 'content', 'content_ru', 'content_uz_cyrl', 'category', 'category_ru', 'category_uz_cyrl']
     ordering_fields = ['created_date', 'title', 'minutes_to_read']
     filterset_fields = ['category']
@@ -171,8 +202,22 @@ class NewsViewSet(viewsets.ModelViewSet):
             permission_classes = [IsAdminUser]
         return [permission() for permission in permission_classes]
     
-    @method_decorator(cache_page(60 * 30))
-    @method_decorator(vary_on_cookie)
+    def get_queryset(self):
+        """Ko'rishlar soni bitta so'rovda annotatsiya qilinadi, ro'yxatda to'liq matn o'qilmaydi"""
+        queryset = super().get_queryset().with_views_count()
+        if self.action == 'list':
+            queryset = queryset.without_content('content')
+        return queryset
+    
+    def get_serializer_class(self):
+        """Ro'yxat uchun yengil serializer"""
+        if self.action == 'list':
+            return NewsListSerializer
+        return NewsSerializer
+    
+    # Kesh kaliti ETag bilan bir xil modellarga bog'langan: ko'rishlar soni
+    # bazaga yozilganda (HitCount versiyasi) javob ham yangilanadi
+    @method_decorator(versioned_cache_page(60 * 60, *cache_models))
     def list(self, request, *args, **kwargs):
         """Barcha yangiliklarni olish"""
         return super().list(request, *args, **kwargs)
@@ -201,18 +246,17 @@ class NewsViewSet(viewsets.ModelViewSet):
     def increment_views(self, request, pk=None):
         """Ko'rishlar sonini oshirish"""
         news = self.get_object()
-        hit_count = HitCount.objects.get_for_object(news)
-        hit_count.hit()
-        return Response({'views': hit_count.hits})
+        return Response({'views': hit_buffer.hit(news)})
 
 
 # 5. About CRUD
-class AboutViewSet(viewsets.ModelViewSet):
+class AboutViewSet(ConditionalGetMixin, LanguageMixin, SingletonListMixin, viewsets.ModelViewSet):
     """
     Tashkilot haqida ma'lumot uchun to'liq CRUD amallari
     """
     queryset = About.objects.all()
     serializer_class = AboutSerializer
+    singleton_cache = SingletonCache(About)
     
     def get_permissions(self):
         if self.action in ['list', 'retrieve']:
@@ -221,14 +265,12 @@ class AboutViewSet(viewsets.ModelViewSet):
             permission_classes = [IsAdminUser]
         return [permission() for permission in permission_classes]
     
-    @method_decorator(cache_page(60 * 60 * 24))
+    def get_singleton(self):
+        return self.get_queryset().order_by('-created_date', '-id').first()
+    
     def list(self, request, *args, **kwargs):
         """Eng oxirgi tashkilot haqida ma'lumotni olish"""
-        latest_about = self.queryset.last()
-        if latest_about:
-            serializer = self.get_serializer(latest_about)
-            return Response(serializer.data)
-        return Response({})
+        return super().list(request, *args, **kwargs)
     
     def create(self, request, *args, **kwargs):
         """Yangi tashkilot haqida ma'lumot yaratish"""
@@ -252,13 +294,13 @@ class AboutViewSet(viewsets.ModelViewSet):
 
 
 # 6. Leadership CRUD
-class LeadershipViewSet(viewsets.ModelViewSet):
+class LeadershipViewSet(ConditionalGetMixin, LanguageMixin, viewsets.ModelViewSet):
     """
     Rahbariyat uchun to'liq CRUD amallari
     """
     queryset = Leadership.objects.all()
     serializer_class = LeadershipSerializer
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter]
+    filter_backends = [DjangoFilterBackend, NormalizedSearchFilter]
     search_fields = ['full_name', 'full_name_ru', 'full_name_uz_cyrl', 'position', 'position_ru', 'position_uz_cyrl']
     
     def get_permissions(self):
@@ -268,8 +310,7 @@ class LeadershipViewSet(viewsets.ModelViewSet):
             permission_classes = [IsAdminUser]
         return [permission() for permission in permission_classes]
     
-    @method_decorator(cache_page(60 * 60))
-    @method_decorator(vary_on_cookie)
+    @method_decorator(versioned_cache_page(60 * 60 * 24, Leadership))
     def list(self, request, *args, **kwargs):
         """Barcha rahbarlarni olish"""
         return super().list(request, *args, **kwargs)
@@ -296,7 +337,7 @@ class LeadershipViewSet(viewsets.ModelViewSet):
 
 
 # 7. JobVacancyDepartment CRUD
-class JobVacancyDepartmentViewSet(viewsets.ModelViewSet):
+class JobVacancyDepartmentViewSet(ConditionalGetMixin, LanguageMixin, viewsets.ModelViewSet):
     """
     Ish o'rinlari bo'limlari uchun to'liq CRUD amallari
     """
@@ -336,7 +377,7 @@ class JobVacancyDepartmentViewSet(viewsets.ModelViewSet):
 
 
 # 8. TypeOfWork CRUD
-class TypeOfWorkViewSet(viewsets.ModelViewSet):
+class TypeOfWorkViewSet(ConditionalGetMixin, LanguageMixin, viewsets.ModelViewSet):
     """
     Ish turlari uchun to'liq CRUD amallari
     """
@@ -376,13 +417,14 @@ class TypeOfWorkViewSet(viewsets.ModelViewSet):
 
 
 # 9. JobVacancy CRUD
-class JobVacancyViewSet(viewsets.ModelViewSet):
+class JobVacancyViewSet(ConditionalGetMixin, LanguageMixin, KeysetPaginationMixin, viewsets.ModelViewSet):
     """
     Ish o'rinlari uchun to'liq CRUD amallari
     """
-    queryset = JobVacancy.objects.all()
+    queryset = JobVacancy.objects.select_related('leadership', 'department', 'type_of_work')
+    cache_models = (JobVacancy, Leadership, JobVacancyDepartment, TypeOfWork)
     serializer_class = JobVacancySerializer
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, NormalizedSearchFilter, filters.OrderingFilter]
     search_fields = ['title', 'title_ru', 'title_uz_cyrl', 'description', 'description_ru', 'description_uz_cyrl']
     ordering_fields = ['created_date', 'title']
     
@@ -396,6 +438,8 @@ class JobVacancyViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         """Filterlash imkoniyatlari"""
         queryset = super().get_queryset()
+        if self.action == 'list':
+            queryset = queryset.without_content('description')
         leadership = self.request.query_params.get('leadership', None)
         department = self.request.query_params.get('department', None)
         type_of_work = self.request.query_params.get('type_of_work', None)
@@ -409,6 +453,12 @@ class JobVacancyViewSet(viewsets.ModelViewSet):
         
         return queryset
     
+    def get_serializer_class(self):
+        """Ro'yxat uchun yengil serializer"""
+        if self.action == 'list':
+            return JobVacancyListSerializer
+        return JobVacancySerializer
+    
     def list(self, request, *args, **kwargs):
         """Barcha ish o'rinlarini olish"""
         return super().list(request, *args, **kwargs)
@@ -435,13 +485,14 @@ class JobVacancyViewSet(viewsets.ModelViewSet):
 
 
 # 10. InteractiveService CRUD
-class InteractiveServiceViewSet(viewsets.ModelViewSet):
+class InteractiveServiceViewSet(ConditionalGetMixin, LanguageMixin, viewsets.ModelViewSet):
     """
     Interaktiv xizmatlar uchun to'liq CRUD amallari
     """
     queryset = InteractiveService.objects.all()
+    cache_models = (InteractiveService, HitCount)
     serializer_class = InteractiveServiceSerializer
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter]
+    filter_backends = [DjangoFilterBackend, NormalizedSearchFilter]
     search_fields = ['title', 'title_ru', 'title_uz_cyrl', 'about', 'about_ru', 'about_uz_cyrl']
     
     def get_permissions(self):
@@ -451,6 +502,10 @@ class InteractiveServiceViewSet(viewsets.ModelViewSet):
             permission_classes = [IsAdminUser]
         return [permission() for permission in permission_classes]
     
+    def get_queryset(self):
+        """Ko'rishlar soni bitta so'rovda annotatsiya qilinadi"""
+        return super().get_queryset().with_views_count()
+    
     def list(self, request, *args, **kwargs):
         """Barcha interaktiv xizmatlarni olish"""
         return super().list(request, *args, **kwargs)
@@ -479,19 +534,18 @@ class InteractiveServiceViewSet(viewsets.ModelViewSet):
     def increment_views(self, request, pk=None):
         """Ko'rishlar sonini oshirish"""
         service = self.get_object()
-        hit_count = HitCount.objects.get_for_object(service)
-        hit_count.hit()
-        return Response({'views': hit_count.hits})
+        return Response({'views': hit_buffer.hit(service)})
 
 
 # 11. Decision CRUD
-class DecisionViewSet(viewsets.ModelViewSet):
+class DecisionViewSet(ConditionalGetMixin, LanguageMixin, KeysetPaginationMixin, viewsets.ModelViewSet):
     """
     Qarorlar uchun to'liq CRUD amallari
     """
     queryset = Decision.objects.all()
+    cache_models = (Decision, HitCount)
     serializer_class = DecisionSerializer
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, NormalizedSearchFilter, filters.OrderingFilter]
     search_fields = ['title', 'title_ru', 'title_uz_cyrl', 'content', 'content_ru', 'content_uz_cyrl']
     ordering_fields = ['created_date', 'title']
     
@@ -502,6 +556,19 @@ class DecisionViewSet(viewsets.ModelViewSet):
             permission_classes = [IsAdminUser]
         return [permission() for permission in permission_classes]
     
+    def get_queryset(self):
+        """Ko'rishlar soni bitta so'rovda annotatsiya qilinadi, ro'yxatda to'liq matn o'qilmaydi"""
+        queryset = super().get_queryset().with_views_count()
+        if self.action == 'list':
+            queryset = queryset.without_content('content')
+        return queryset
+    
+    def get_serializer_class(self):
+        """Ro'yxat uchun yengil serializer"""
+        if self.action == 'list':
+            return DecisionListSerializer
+        return DecisionSerializer
+    
     def list(self, request, *args, **kwargs):
         """Barcha qarorlarni olish"""
         return super().list(request, *args, **kwargs)
@@ -530,18 +597,33 @@ class DecisionViewSet(viewsets.ModelViewSet):
     def increment_views(self, request, pk=None):
         """Ko'rishlar sonini oshirish"""
         decision = self.get_object()
-        hit_count = HitCount.objects.get_for_object(decision)
-        hit_count.hit()
-        return Response({'views': hit_count.hits})
+        return Response({'views': hit_buffer.hit(decision)})
+
+
+def save_contact(serializer, fingerprint):
+    """
+    Murojaatni saqlash. Telegram xabari murojaat bilan bir tranzaksiyada
+    navbatga qo'yiladi va send_notifications worker i tomonidan yuboriladi
+    """
+    try:
+        with transaction.atomic():
+            serializer.save()
+            contact_created(serializer.instance)
+            enqueue(format_contact_message(serializer.instance), group='contact')
+    except Exception:
+        release_contact_fingerprint(fingerprint)
+        raise
 
 
 # 12. Contact CRUD
-class ContactViewSet(viewsets.ModelViewSet):
+class ContactViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     Murojaatlar uchun to'liq CRUD amallari
     """
     queryset = Contact.objects.all()
     serializer_class = ContactSerializer
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ['is_read']
     
     def get_permissions(self):
         """Yaratish hammaga ochiq, qolganlari admin uchun"""
@@ -551,6 +633,21 @@ class ContactViewSet(viewsets.ModelViewSet):
             permission_classes = [IsAdminUser]
         return [permission() for permission in permission_classes]
     
+    def get_throttles(self):
+        """Ochiq yaratish endpointi IP va umumiy tezlik bo'yicha cheklanadi"""
+        if self.action == 'create':
+            return [ContactIPThrottle(), ContactGlobalThrottle()]
+        return super().get_throttles()
+    
+    def check_throttles(self, request):
+        """
+        Birinchi rad etgan cheklovda to'xtaydi: IP bo'yicha rad etilgan so'rov
+        umumiy cheklov tokenini sarflamaydi (bitta IP hammani to'sib qo'ymaydi)
+        """
+        for throttle in self.get_throttles():
+            if not throttle.allow_request(request, self):
+                self.throttled(request, throttle.wait())
+    
     def get_serializer_class(self):
         """Yaratish va boshqalarga alohida serializer"""
         if self.action == 'create':
@@ -565,16 +662,18 @@ class ContactViewSet(viewsets.ModelViewSet):
         """Yangi murojaat yaratish (hamma uchun)"""
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        self.perform_create(serializer)
         
-        # Telegramga xabar yuborish
-        try:
-            contact = serializer.instance
-            message = f"📩 Yangi murojaat!\n\n👤 Ism: {contact.full_name}\n📞 Telefon: {contact.phone_number}\n📧 Email: {contact.email}\n✉️ Xabar: {contact.message}\n⏰ Vaqt: {contact.created_date.strftime('%d.%m.%Y %H:%M')}"
-            send_telegram_message(message)
-        except Exception as e:
-            logger.error(f"Telegramga xabar yuborishda xatolik: {e}")
+        # Bir xil xabar qayta yuborilsa, bazaga yozilmaydi
+        fingerprint = claim_contact_fingerprint(
+            serializer.validated_data['email'], serializer.validated_data['message']
+        )
+        if fingerprint is None:
+            return Response(
+                {'message': 'Bu murojaat allaqachon qabul qilingan.'},
+                status=status.HTTP_409_CONFLICT
+            )
         
+        save_contact(serializer, fingerprint)
         headers = self.get_success_headers(serializer.data)
         return Response(
             {'message': 'Murojaatingiz qabul qilindi. Tez orada aloqaga chiqamiz.'},
@@ -602,6 +701,129 @@ class ContactViewSet(viewsets.ModelViewSet):
     def mark_as_read(self, request, pk=None):
         """Murojaatni o'qilgan deb belgilash"""
         contact = self.get_object()
-        contact.is_read = True
-        contact.save()
-        return Response({'status': 'Murojaat o\'qilgan deb belgilandi'})
\ No newline at end of file
+        set_contacts_read(Contact.objects.filter(pk=contact.pk), True)
+        return Response({'status': 'Murojaat o\'qilgan deb belgilandi'})
+    
+    @extend_schema(request=ContactBulkActionSerializer)
+    @action(detail=False, methods=['post'])
+    def bulk(self, request):
+        """
+        Bir nechta murojaatni o'qilgan/o'qilmagan deb belgilash yoki o'chirish
+        (bitta UPDATE/DELETE so'rovi bilan, holati o'zgarganlar soni qaytariladi)
+        """
+        serializer = ContactBulkActionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        queryset = Contact.objects.filter(**serializer.get_filters())
+        
+        action_name = serializer.validated_data['action']
+        if action_name == 'delete':
+            count = delete_contacts(queryset)
+        else:
+            count = set_contacts_read(queryset, action_name == 'mark_as_read')
+        return Response({'action': action_name, 'count': count})
+    
+    @extend_schema(responses=ContactSummarySerializer)
+    @action(detail=False, methods=['get'])
+    def summary(self, request):
+        """Jami, o'qilmagan va bugungi murojaatlar soni (hisoblagichdan)"""
+        return Response(contact_summary())
+    
+    def perform_destroy(self, instance):
+        delete_contacts(Contact.objects.filter(pk=instance.pk))
+
+
+# 13. Kesh statistikasi
+class CacheStatsView(APIView):
+    """
+    Endpointlar bo'yicha kesh hit/miss statistikasi (joriy worker uchun, admin)
+    """
+    permission_classes = [IsAdminUser]
+    
+    @extend_schema(responses=CacheStatsSerializer)
+    def get(self, request):
+        return Response({
+            'backend': settings.CACHES['default']['BACKEND'],
+            **cache_metrics.snapshot(),
+        })
+
+
+# 14. Umumiy qidiruv
+class SearchView(APIView):
+    """
+    Yangiliklar, qarorlar, ish o'rinlari va interaktiv xizmatlar bo'yicha
+    tartiblangan qidiruv (?q=, ?type=news,decision, ?lang=)
+    """
+    permission_classes = [AllowAny]
+    pagination_class = LimitOffsetPagination
+    
+    @extend_schema(
+        parameters=[
+            OpenApiParameter('q', OpenApiTypes.STR, description="Qidiruv so'zlari"),
+            OpenApiParameter('type', OpenApiTypes.STR, description="news, decision, job_vacancy, interactive_service"),
+            OpenApiParameter('lang', OpenApiTypes.STR, description="uz, ru, uz-cyrl"),
+        ],
+        responses=SearchResultSerializer(many=True),
+    )
+    def get(self, request):
+        query = request.query_params.get('q', '')
+        types = [name for name in request.query_params.get('type', '').split(',') if name]
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(search(query, types), request, view=self)
+        serializer = SearchResultSerializer(
+            get_documents(page), many=True, context={'request': request, 'lang': get_request_language(request)}
+        )
+        return paginator.get_paginated_response(serializer.data)
+
+
+# 15. Bosh sahifa
+# Bosh sahifaning har bir bo'limidagi yozuvlar soni
+HOME_SECTION_LIMITS = {
+    'banners': 5,
+    'useful_links': 12,
+    'news': 6,
+    'interactive_services': 8,
+}
+HOME_MODELS = (Banner, Statistics, UsefulLink, News, InteractiveService, About)
+
+
+class HomeViewSet(ConditionalGetMixin, viewsets.ViewSet):
+    """
+    Bosh sahifa uchun barcha bo'limlar bitta javobda (?lang=).
+    Javob bitta kesh yozuvidan beriladi va bo'limlardagi biror model
+    o'zgarganda qaytadan tuziladi
+    """
+    permission_classes = [AllowAny]
+    cache_models = HOME_MODELS + (HitCount,)
+    
+    def localize(self, queryset, lang):
+        """Faqat tanlangan til ustunlarini o'qish"""
+        if lang:
+            queryset = queryset.defer(*get_other_language_fields(queryset.model, lang))
+        return queryset
+    
+    def get_sections(self, lang):
+        limits = HOME_SECTION_LIMITS
+        return {
+            'banners': self.localize(Banner.objects.all(), lang)[:limits['banners']],
+            'statistics': Statistics.objects.current(),
+            'useful_links': self.localize(UsefulLink.objects.all(), lang)[:limits['useful_links']],
+            'news': self.localize(
+                News.objects.with_views_count().without_content('content'), lang
+            )[:limits['news']],
+            'interactive_services': self.localize(
+                InteractiveService.objects.with_views_count(), lang
+            )[:limits['interactive_services']],
+            'about': self.localize(About.objects.order_by('-created_date', '-id'), lang).first(),
+        }
+    
+    # Kesh kaliti ETag bilan bir xil modellarga (ko'rishlar soni ham) bog'langan
+    @extend_schema(
+        parameters=[OpenApiParameter('lang', OpenApiTypes.STR, description="uz, ru, uz-cyrl")],
+        responses=HomeSerializer,
+    )
+    @method_decorator(versioned_cache_page(60 * 60, *cache_models))
+    def list(self, request):
+        """Bosh sahifa ma'lumotlari"""
+        lang = get_request_language(request)
+        serializer = HomeSerializer(self.get_sections(lang), context={'request': request, 'lang': lang})
+        return Response(serializer.data)